@@ -9,6 +9,7 @@ import sys
 
 from processor.pipeline.reidentification.reid_data import ReidData
 from processor.input.image_capture import ImageCapture
+from processor.pipeline.prepare_pipeline import prefetch_capture
 from processor.utils.config_parser import ConfigParser
 from processor.utils.create_runners import create_detector, create_tracker
 from processor.utils.datawriter import get_data_writer
@@ -27,7 +28,10 @@ def main(configs):
     """
     captures = __get_captures(configs)
 
-    for capture, det_writer, track_writer in captures:
+    for image_capture, det_writer, track_writer in captures:
+        # Decode the next images while detecting the current one, the captures only start reading here.
+        capture = prefetch_capture(image_capture, configs['Input'])
+        image_index = -1
 
         # Instantiate the detector.
         print("Instantiating detector...")
@@ -43,7 +47,9 @@ def main(configs):
 
             if not ret:
                 continue
-            image_id = int(capture.image_names[capture.image_index].split('.')[0])
+            # The prefetching capture reads ahead, so count the images instead of using the index of the capture.
+            image_index += 1
+            image_id = int(image_capture.image_names[image_index].split('.')[0])
             detected_boxes = detector.detect(frame_obj)
             tracked_boxes = tracker.track(frame_obj, detected_boxes, reid_data)
 
@@ -53,7 +59,8 @@ def main(configs):
             det_writer.write(detected_boxes)
             track_writer.write(tracked_boxes)
 
-        # Close files.
+        # Close capture and files.
+        capture.close()
         det_writer.close()
         track_writer.close()
 
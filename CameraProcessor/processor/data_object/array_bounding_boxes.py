@@ -0,0 +1,257 @@
+"""Contains the columnar bounding boxes object, which stores all boxes of a frame in NumPy arrays.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+
+# Object id stored for boxes that do not depict an object that is being followed.
+NO_OBJECT_ID = -1
+
+
+class ArrayBoundingBoxes(BoundingBoxes):
+    """Bounding boxes of a frame stored as columns instead of a list of BoundingBox objects.
+
+    The rectangles are stored in an (N, 4) array, and the identifiers, class indices, certainties and
+    object ids in arrays of length N, so conversions of all boxes are whole-array operations.
+    Iterating and the bounding_boxes property still give BoundingBox objects, which are only
+    created when they are used.
+
+    Attributes:
+        class_names ([str]): Classification of every class index.
+    """
+
+    def __init__(self, rects, identifiers, class_indices, certainties, object_ids=None, class_names=(),
+                 image_id='', validate=True):
+        """Inits the columns of the bounding boxes.
+
+        Args:
+            rects (np.ndarray): (N, 4) array of normalized [x1, y1, x2, y2] coordinates.
+            identifiers (np.ndarray): identifier of every box.
+            class_indices (np.ndarray): index into class_names of the classification of every box.
+            certainties (np.ndarray): certainty/confidence of every box.
+            object_ids (np.ndarray): object id of every box, NO_OBJECT_ID if it does not depict a followed object.
+                None if no box depicts a followed object.
+            class_names ([str]): classification of every class index.
+            image_id (str): id of the image.
+            validate (bool): whether to check the rectangles, only skip this for rectangles that are already
+                known to be valid (e.g. output of the detector and tracker).
+
+        Raises:
+            ValueError: The columns have different lengths, or a rectangle is invalid.
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(None, image_id)
+        self.class_names = list(class_names)
+
+        self.__rects = np.asarray(rects, dtype=float).reshape(-1, 4)
+        count = len(self.__rects)
+        self.__identifiers = np.asarray(identifiers, dtype=int).reshape(-1)
+        self.__class_indices = np.asarray(class_indices, dtype=int).reshape(-1)
+        self.__certainties = np.asarray(certainties, dtype=float).reshape(-1)
+        self.__object_ids = np.full(count, NO_OBJECT_ID, dtype=int) if object_ids is None \
+            else np.asarray(object_ids, dtype=int).reshape(-1)
+
+        if any(len(column) != count for column in
+               (self.__identifiers, self.__class_indices, self.__certainties, self.__object_ids)):
+            raise ValueError('All columns should contain a value for every box')
+        if validate:
+            self.__validate()
+
+        # BoundingBox objects, only created when they are requested.
+        self.__boxes = None
+
+    @staticmethod
+    def from_bounding_boxes(bounding_boxes, image_id=None):
+        """Creates the columns from BoundingBox objects.
+
+        Args:
+            bounding_boxes (iterable[BoundingBox]): boxes to store, e.g. a BoundingBoxes object.
+            image_id (str): id of the image, None uses the id of the given BoundingBoxes.
+
+        Returns:
+            ArrayBoundingBoxes: columns with the same boxes.
+        """
+        if image_id is None:
+            image_id = getattr(bounding_boxes, 'image_id', '')
+        boxes = list(bounding_boxes)
+
+        classifications = [box.classification for box in boxes]
+        class_names = list(dict.fromkeys(classifications))
+        class_lookup = {name: i for i, name in enumerate(class_names)}
+
+        return ArrayBoundingBoxes(
+            rects=[(box.rectangle.x1, box.rectangle.y1, box.rectangle.x2, box.rectangle.y2) for box in boxes],
+            identifiers=[box.identifier for box in boxes],
+            class_indices=[class_lookup[classification] for classification in classifications],
+            certainties=[box.certainty for box in boxes],
+            object_ids=[NO_OBJECT_ID if box.object_id is None else box.object_id for box in boxes],
+            class_names=class_names,
+            image_id=image_id,
+            validate=False
+        )
+
+    @property
+    def rects(self):
+        """Gets the rectangles.
+
+        Returns:
+            np.ndarray: (N, 4) array of normalized [x1, y1, x2, y2] coordinates.
+        """
+        return self.__rects
+
+    @property
+    def identifiers(self):
+        """Gets the identifiers.
+
+        Returns:
+            np.ndarray: identifier of every box.
+        """
+        return self.__identifiers
+
+    @property
+    def class_indices(self):
+        """Gets the class indices.
+
+        Returns:
+            np.ndarray: index into class_names of the classification of every box.
+        """
+        return self.__class_indices
+
+    @property
+    def classifications(self):
+        """Gets the classifications.
+
+        Returns:
+            [str]: classification of every box.
+        """
+        return [self.class_names[i] for i in self.__class_indices]
+
+    @property
+    def certainties(self):
+        """Gets the certainties.
+
+        Returns:
+            np.ndarray: certainty/confidence of every box.
+        """
+        return self.__certainties
+
+    @property
+    def object_ids(self):
+        """Gets the object ids.
+
+        Returns:
+            np.ndarray: object id of every box, NO_OBJECT_ID if it does not depict a followed object.
+        """
+        return self.__object_ids
+
+    @property
+    def bounding_boxes(self):
+        """Get bounding boxes, created from the columns the first time they are requested.
+
+        Returns:
+            [BoundingBox]: list of bounding boxes.
+        """
+        if self.__boxes is None:
+            self.__boxes = [self.__create_box(i) for i in range(len(self))]
+        return self.__boxes
+
+    def set_object_id(self, index, object_id):
+        """Sets the object id of a box.
+
+        Args:
+            index (int): index of the box.
+            object_id (int): id of the object depicted by the box.
+        """
+        self.__object_ids[index] = NO_OBJECT_ID if object_id is None else object_id
+        if self.__boxes is not None:
+            self.__boxes[index] = self.__create_box(index)
+
+    def select(self, mask):
+        """Selects a subset of the boxes.
+
+        Args:
+            mask (np.ndarray): boolean mask or indices of the boxes to keep.
+
+        Returns:
+            ArrayBoundingBoxes: columns containing only the selected boxes.
+        """
+        return ArrayBoundingBoxes(self.__rects[mask], self.__identifiers[mask], self.__class_indices[mask],
+                                  self.__certainties[mask], self.__object_ids[mask], self.class_names,
+                                  self.image_id, validate=False)
+
+    def to_dicts(self):
+        """Converts all boxes to the dict format of the API.
+
+        Returns:
+            [dict]: Representation of every box, the same as bounding_box_to_dict gives.
+        """
+        dicts = [
+            {
+                'boxId': identifier,
+                'rect': rect,
+                'objectType': self.class_names[class_index],
+                'certainty': certainty
+            }
+            for identifier, rect, class_index, certainty in zip(
+                self.__identifiers.tolist(), self.__rects.tolist(), self.__class_indices.tolist(),
+                self.__certainties.tolist())
+        ]
+
+        # Add the objectId to the dicts of the boxes that have one.
+        for i in np.flatnonzero(self.__object_ids != NO_OBJECT_ID):
+            dicts[i]['objectId'] = int(self.__object_ids[i])
+
+        return dicts
+
+    def __iter__(self):
+        """Iterates the bounding boxes.
+
+        Returns:
+            list_iterator: Iterator for the list of bounding boxes.
+        """
+        return iter(self.bounding_boxes)
+
+    def __len__(self):
+        """Number of boxes stored inside the object.
+
+        Returns:
+            int: Length of the number of boxes.
+        """
+        return len(self.__rects)
+
+    def __create_box(self, index):
+        """Creates the BoundingBox object of a box.
+
+        Args:
+            index (int): index of the box.
+
+        Returns:
+            BoundingBox: box with the values of the columns.
+        """
+        object_id = int(self.__object_ids[index])
+        return BoundingBox(
+            identifier=int(self.__identifiers[index]),
+            rectangle=Rectangle(*self.__rects[index].tolist(), validate=False),
+            classification=self.class_names[self.__class_indices[index]],
+            certainty=float(self.__certainties[index]),
+            object_id=None if object_id == NO_OBJECT_ID else object_id
+        )
+
+    def __validate(self):
+        """Checks all rectangles at once, with the same rules and rounding as Rectangle.
+
+        Raises:
+            ValueError: A rectangle is invalid.
+        """
+        rounded = np.round(self.__rects, 2)
+        invalid = ((rounded[:, 0] > rounded[:, 2]) | (rounded[:, 1] > rounded[:, 3])
+                   | (rounded[:, :2] < 0).any(axis=1) | (rounded[:, 2:] > 1).any(axis=1))
+        if invalid.any():
+            raise ValueError(f'Rectangle {self.__rects[np.argmax(invalid)].tolist()} is invalid, '
+                             f'coordinates should be normalized with x1 <= x2 and y1 <= y2')
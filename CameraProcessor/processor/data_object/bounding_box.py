@@ -7,7 +7,11 @@ Utrecht University within the Software Project course.
 
 
 class BoundingBox:
-    """Contains information about a single bounding box."""
+    """Contains information about a single bounding box.
+
+    Bounding boxes are immutable, and use slots as many of them are created for every frame.
+    """
+    __slots__ = ('__identifier', '__rectangle', '__classification', '__certainty', '__object_id')
 
     def __init__(self, identifier, rectangle, classification, certainty, object_id=None):
         """Init the bounding box.
@@ -79,13 +83,11 @@ class BoundingBox:
         Returns:
             bool: Whether the bounding boxes are the same.
         """
-        return all([
-            self.__identifier == other.identifier,
-            self.__rectangle == other.rectangle,
-            self.__classification == other.classification,
-            self.__certainty == other.certainty,
-            self.__object_id == other.object_id
-        ])
+        return self.__identifier == other.identifier \
+            and self.__rectangle == other.rectangle \
+            and self.__classification == other.classification \
+            and self.__certainty == other.certainty \
+            and self.__object_id == other.object_id
 
     def __repr__(self):
         """Converts the bounding box object to a string.
@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+from processor.data_object.bounding_box import BoundingBox
 
 
 class BoundingBoxes:
@@ -37,6 +38,22 @@ class BoundingBoxes:
         """
         return self.__image_id
 
+    def set_object_id(self, index, object_id):
+        """Sets the object id of a box, replacing the box by a box with the new object id.
+
+        Args:
+            index (int): index of the box.
+            object_id (int): id of the object depicted by the box.
+        """
+        box = self.__bounding_boxes[index]
+        self.__bounding_boxes[index] = BoundingBox(
+            identifier=box.identifier,
+            rectangle=box.rectangle,
+            classification=box.classification,
+            certainty=box.certainty,
+            object_id=object_id
+        )
+
     def __eq__(self, other):
         """Function that checks whether the current bounding box is the same as the given one.
 
@@ -8,16 +8,19 @@ Utrecht University within the Software Project course.
 
 class FrameObj:
     """Frame object contains the frame and corresponding timestamp."""
+    __slots__ = ('__frame', '__timestamp', '__received')
 
-    def __init__(self, frame, timestamp):
+    def __init__(self, frame, timestamp, received=None):
         """Inits the FrameObj with frame and timestamp.
 
         Args:
             frame (numpy.ndarray): the frame from the capture given by OpenCV.
             timestamp (float): timestamp (in s) associated with the current frame.
+            received (float): time.monotonic() (in s) at which the capture read the frame, None if unknown.
         """
         self.__frame = frame
         self.__timestamp = timestamp
+        self.__received = received
 
     @property
     def frame(self):
@@ -37,6 +40,15 @@ class FrameObj:
         """
         return self.__timestamp
 
+    @property
+    def received(self):
+        """Gets the time at which the capture read the frame, e.g. to measure how long it waited to be processed.
+
+        Returns:
+            float: time.monotonic() (in s) at which the frame was read, None if unknown.
+        """
+        return self.__received
+
     @property
     def shape(self):
         """Gets shape of frame.
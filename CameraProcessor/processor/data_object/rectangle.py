@@ -7,8 +7,13 @@ Utrecht University within the Software Project course.
 
 
 class Rectangle:
-    """Rectangle class containing bottom right and top left corner points."""
-    def __init__(self, x1, y1, x2, y2):
+    """Rectangle class containing bottom right and top left corner points.
+
+    Rectangles are immutable, and use slots as many of them are created for every frame.
+    """
+    __slots__ = ('__x1', '__y1', '__x2', '__y2')
+
+    def __init__(self, x1, y1, x2, y2, validate=True):
         """Inits rectangle with bottom right and top left coords.
 
         Args:
@@ -16,17 +21,24 @@ class Rectangle:
             y1 (float): normalized top-left Y.
             x2 (float): normalized bottom-right X.
             y2 (float): normalized bottom-right Y.
-        """
-        # Rounding for float precision errors errors.
-        if round(x1, 2) > round(x2, 2):
-            raise ValueError(f'x1 {x1} should be smaller than or equal to x2 {x2}')
-        if round(y1, 2) > round(y2, 2):
-            raise ValueError(f'y1 {y1} should be smaller than or equal to y2 {y2}')
+            validate (bool): whether to check the coordinates, only skip this for coordinates that are already
+                known to be valid (e.g. output of the detector and tracker).
 
-        if round(x1, 2) < 0 or round(y1, 2) < 0:
-            raise ValueError(f'x1 {x1} and y1 {y1} should be greater than or equal to 0')
-        if round(x2, 2) > 1 or round(y2, 2) > 1:
-            raise ValueError(f'x2 {x2} and y2 {y2} should be smaller than or equal to 1')
+        Raises:
+            ValueError: The coordinates are not normalized, or in the wrong order.
+        """
+        if validate:
+            # Rounding for float precision errors errors.
+            rx1, ry1, rx2, ry2 = round(x1, 2), round(y1, 2), round(x2, 2), round(y2, 2)
+            if rx1 > rx2:
+                raise ValueError(f'x1 {x1} should be smaller than or equal to x2 {x2}')
+            if ry1 > ry2:
+                raise ValueError(f'y1 {y1} should be smaller than or equal to y2 {y2}')
+
+            if rx1 < 0 or ry1 < 0:
+                raise ValueError(f'x1 {x1} and y1 {y1} should be greater than or equal to 0')
+            if rx2 > 1 or ry2 > 1:
+                raise ValueError(f'x2 {x2} and y2 {y2} should be smaller than or equal to 1')
 
         self.__x1 = x1
         self.__y1 = y1
@@ -78,7 +90,7 @@ class Rectangle:
         Returns:
             bool: Whether self and other are the same.
         """
-        return all([self.x1 == other.x1, self.x2 == other.x2, self.y1 == other.y1, self.y2 == other.y2])
+        return self.__x1 == other.x1 and self.__x2 == other.x2 and self.__y1 == other.y1 and self.__y2 == other.y2
 
     def __repr__(self):
         """Converts the rectangle object to a string.
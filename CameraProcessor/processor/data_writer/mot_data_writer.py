@@ -4,9 +4,11 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import os
+
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
 from processor.data_writer.i_data_writer import IDataWriter
 from processor.utils.text import boxes_to_txt
-import os
 
 
 class MotDataWriter(IDataWriter):
@@ -27,9 +29,16 @@ class MotDataWriter(IDataWriter):
         """
         # Writing can only be done at the end, because MOT data needs to be sorted at the end.
         image_id = bounding_boxes.image_id
-        for bounding_box in bounding_boxes:
-            tracked_boxes_string = boxes_to_txt([bounding_box], shape, image_id)
-            self.to_write.append((bounding_box.identifier, image_id, tracked_boxes_string))
+
+        # Convert all boxes at once, which uses the columns of an ArrayBoundingBoxes, giving a line per box.
+        lines = boxes_to_txt(bounding_boxes, shape, image_id).splitlines(keepends=True)
+        if isinstance(bounding_boxes, ArrayBoundingBoxes):
+            identifiers = bounding_boxes.identifiers.tolist()
+        else:
+            identifiers = [bounding_box.identifier for bounding_box in bounding_boxes]
+
+        for identifier, tracked_boxes_string in zip(identifiers, lines):
+            self.to_write.append((identifier, image_id, tracked_boxes_string))
 
     def close(self):
         """Method for writing the information in the object to the file and to close the file."""
@@ -47,4 +47,4 @@ class CamCapture(ICapture):
             bool, numpy.ndarray: Whether a next frame was found and its frame.
         """
         ret, frame = self.cap.read(0)
-        return ret, FrameObj(frame, time.time())
+        return ret, FrameObj(frame, time.time(), time.monotonic())
@@ -0,0 +1,90 @@
+"""Contains the frame handoff, which passes frames from a reading thread to the processing thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+from collections import deque
+
+FRAME_MODES = ('latest', 'every')
+
+
+class FrameHandoff:
+    """Passes frames from a reading thread to a consumer, which can block until a frame arrives.
+
+    In 'latest' mode only the newest frame is kept, a frame that is not taken before the next one arrives is dropped.
+    In 'every' mode all frames are kept in order, up to the maximum number of frames, after which the oldest
+    frame is dropped. Dropped frames are counted, so the consumer knows how many frames it skipped.
+
+    Attributes:
+        frame_mode (str): 'latest' to only process the newest frame, 'every' to process every frame.
+        dropped_frames (int): Number of frames that were dropped before they were taken.
+    """
+
+    def __init__(self, frame_mode='latest', max_frames=64):
+        """Inits an empty handoff.
+
+        Args:
+            frame_mode (str): 'latest' to only process the newest frame, 'every' to process every frame.
+            max_frames (int): Maximum number of frames kept in 'every' mode.
+
+        Raises:
+            ValueError: The frame mode is unknown or the maximum number of frames is smaller than 1.
+        """
+        if frame_mode not in FRAME_MODES:
+            raise ValueError(f'Frame mode "{frame_mode}" is unknown, use one of {FRAME_MODES}')
+        if max_frames < 1:
+            raise ValueError('At least one frame should be kept')
+
+        self.frame_mode = frame_mode
+        self.dropped_frames = 0
+
+        self.__frames = deque(maxlen=1 if frame_mode == 'latest' else max_frames)
+        self.__condition = threading.Condition()
+        self.__closed = False
+
+    def publish(self, frame_obj):
+        """Adds a frame and wakes up the waiting consumer, dropping the oldest frame when full.
+
+        Args:
+            frame_obj (FrameObj): frame that was read.
+        """
+        with self.__condition:
+            if len(self.__frames) == self.__frames.maxlen:
+                self.dropped_frames += 1
+            self.__frames.append(frame_obj)
+            self.__condition.notify_all()
+
+    def wait(self, timeout=None):
+        """Blocks until a frame is available, the handoff is closed or the timeout passed.
+
+        Args:
+            timeout (float): Maximum time (in s) to wait, None waits until a frame arrives.
+
+        Returns:
+            bool: Whether a frame is available.
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__frames or self.__closed, timeout)
+            return len(self.__frames) > 0
+
+    def take(self):
+        """Takes the next frame without waiting.
+
+        Returns:
+            FrameObj: the oldest available frame, None if no frame is available.
+        """
+        with self.__condition:
+            return self.__frames.popleft() if self.__frames else None
+
+    def clear(self):
+        """Drops all available frames, e.g. after a reconnect."""
+        with self.__condition:
+            self.__frames.clear()
+
+    def close(self):
+        """Wakes up all waiting consumers, waits return directly afterwards."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
@@ -12,6 +12,7 @@ import ffmpeg
 import cv2
 
 from processor.input.i_capture import ICapture
+from processor.input.frame_handoff import FrameHandoff
 from processor.data_object.frame_obj import FrameObj
 
 
@@ -19,7 +20,8 @@ class HlsCapture(ICapture):
     """Implementation of the ICapture class which handles an HLS stream with timestamps.
 
     Main thread runs the implementation with open, close and getting the next frame.
-    Separate thread runs the reading loop, which reads the next frame at a constant rate.
+    Separate thread runs the reading loop, which reads the next frame at a constant rate
+    and hands it over to the main thread, which can block until a frame arrives (wait_for_frame).
     Another thread gets the time stamp of the stream once and going from there.
 
     Attributes:
@@ -27,14 +29,12 @@ class HlsCapture(ICapture):
         fps (int): FPS of the stream.
 
         __start_time_stamp (float): Start time of capture object.
-        __frame_time_stamp (float): Time stamp of current frame.
-        __last_frame_time_stamp (float): Time stamp of previous frame.
         __hls_start_time_stamp (float): Start time of hls stream.
 
         __thread_start_time (float): Start time of thread.
         __wait_ms (float): Time between frames in ms
 
-        __current_frame (numpy.ndarray): The current frame.
+        __frames (FrameHandoff): Frames read by the reading thread that were not returned yet.
 
         __previous_time (float): a time float to determine the time diff between frame readings.
         __timeout (int): an integer for timeout in seconds (used as float).
@@ -50,7 +50,8 @@ class HlsCapture(ICapture):
         __drop_reconnect (bool): Boolean indicating the reconnect-thread can be closed
         __found_stream (bool): Boolean indicating whether stream was found.
     """
-    def __init__(self, hls_url='http://81.83.10.9:8001/mjpg/video.mjpg', retries=10):
+    def __init__(self, hls_url='http://81.83.10.9:8001/mjpg/video.mjpg', retries=10, frame_mode='latest',
+                 max_buffered_frames=64):
         """Initiates the capture object with a hls url and starts reading frames.
 
         Default hls_url is of a public stream that is available 24/7.
@@ -58,6 +59,9 @@ class HlsCapture(ICapture):
         Args:
             hls_url (str): Url the cv2.VideoCapture has to connect to.
             retries (int): Number of retries before it is concluded connection cannot be made.
+            frame_mode (str): 'latest' to only return the newest frame, skipping frames while the pipeline is busy,
+                'every' to return every frame that was read.
+            max_buffered_frames (int): Maximum number of frames waiting to be returned in 'every' mode.
         """
 
         # Stream related properties.
@@ -66,16 +70,14 @@ class HlsCapture(ICapture):
 
         # Time stamps.
         self.__start_time_stamp = 0
-        self.__frame_time_stamp = 0
-        self.__last_frame_time_stamp = 0
         self.__hls_start_time_stamp = 0
 
         # Time.
         self.__thread_start_time = 0
         self.__wait_ms = 0
 
-        # Frame numbers.
-        self.__current_frame = None
+        # Frames handed over by the reading thread.
+        self.__frames = FrameHandoff(frame_mode, max_buffered_frames)
 
         # Tells thread they should keep running.
         self.__thread_running = False
@@ -110,8 +112,9 @@ class HlsCapture(ICapture):
         logging.info('HLS stream closing')
         logging.info("Joining threads")
 
-        # Join the reading thread.
+        # Join the reading thread, and wake up the threads waiting for a frame.
         self.__thread_running = False
+        self.__frames.close()
         self.__reading_thread.join()
 
         # Join the reconnecting thread.
@@ -119,8 +122,28 @@ class HlsCapture(ICapture):
         self.__reconnect_thread.join()
         logging.info('Threads joined')
 
+    @property
+    def dropped_frames(self):
+        """Gets the number of frames that were read, but replaced by a newer frame before they were returned.
+
+        Returns:
+            int: Number of dropped frames.
+        """
+        return self.__frames.dropped_frames
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the reading thread handed over a new frame, the capture closed or the timeout passed.
+
+        Args:
+            timeout (float): Maximum time (in s) to wait, None waits until a frame arrives.
+
+        Returns:
+            bool: Whether get_next_frame has a new frame to return.
+        """
+        return self.__frames.wait(timeout)
+
     def get_next_frame(self):
-        """Gets the next frame from the hls stream.
+        """Gets the next frame from the hls stream, without waiting for it.
 
         Returns:
             bool, FrameObj: boolean whether a new frame has been returned compared to the previous one.
@@ -134,8 +157,10 @@ class HlsCapture(ICapture):
         if not self.__thread_running or self.__reconnecting:
             return False, None
 
-        # Frame is not different from the last one.
-        if self.__frame_time_stamp == self.__last_frame_time_stamp:
+        frame_obj = self.__frames.take()
+
+        # No new frame was read since the last one.
+        if frame_obj is None:
             if self.__grace_period > 0:
                 self.__grace_period -= diff_time
             else:
@@ -149,9 +174,7 @@ class HlsCapture(ICapture):
             return False, None
 
         self.__timeout = 5
-
-        self.__last_frame_time_stamp = self.__frame_time_stamp
-        return True, FrameObj(self.__current_frame, self.__frame_time_stamp)
+        return True, frame_obj
 
     def __read(self, cap, hls_start_time_stamp, wait_ms):
         """Method that runs in separate thread that goes through the frames of the stream at a consistent pace.
@@ -171,7 +194,7 @@ class HlsCapture(ICapture):
         while self.__thread_running and not self.__reconnecting:
             # Reads next frame.
             try:
-                ret, self.__current_frame = cap.read()
+                ret, frame = cap.read()
             except SystemExit as error:
                 logging.warning('Capture read has been blocked')
                 raise TimeoutError('Capture read has been blocked.') from error
@@ -180,9 +203,10 @@ class HlsCapture(ICapture):
             if not ret:
                 continue
 
-            # Saves timestamp of the current frame.
+            # Hands over the frame with the timestamp of the frame in the stream and the time it arrived.
+            # The time it waits in the handoff then counts towards its lag.
             current_frame_time = current_frame_nr * wait_ms
-            self.__frame_time_stamp = hls_start_time_stamp + (current_frame_time / 1000)
+            self.__frames.publish(FrameObj(frame, hls_start_time_stamp + (current_frame_time / 1000), time.monotonic()))
 
             # Calculate the wait time for the next frame.
             time_into_stream = time.time() - thread_start_time
@@ -232,9 +256,10 @@ class HlsCapture(ICapture):
         # How much time has to get awaited between frames.
         wait_ms = 1000 / self.fps
 
-        # Reset some variables.
+        # Reset some variables, frames of the previous connection are outdated.
         self.__drop_reconnect = False
         self.__reconnecting = False
+        self.__frames.clear()
 
         # Done with probing, starting the reading thread.
         self.__reading_thread = kthread.KThread(target=self.__read,
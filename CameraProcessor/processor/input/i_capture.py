@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import asyncio
 
 
 class ICapture:
@@ -28,3 +29,33 @@ class ICapture:
                             Frame from the capture object.
         """
         raise NotImplementedError('No implementation for getting next frame')
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until get_next_frame has a new frame to return, the capture closed or the timeout passed.
+
+        Captures that read the next frame on demand always have a frame to return, so they do not wait.
+        Captures reading a live stream on another thread override this to wait for the next frame to arrive.
+
+        Args:
+            timeout (float): Maximum time (in s) to wait, None waits until a frame arrives.
+
+        Returns:
+            bool: Whether get_next_frame has a new frame to return.
+        """
+        # pylint: disable=unused-argument
+        return True
+
+    async def get_next_frame_async(self, timeout=0.5):
+        """Waits for the next frame without blocking the event loop and gets it.
+
+        Args:
+            timeout (float): Maximum time (in s) to wait for a new frame.
+
+        Returns:
+            bool, FrameObj: Boolean whether a next frame was found.
+                            Frame from the capture object.
+        """
+        # Only hand the wait to another thread when the frame is not available yet.
+        if not self.wait_for_frame(0):
+            await asyncio.get_running_loop().run_in_executor(None, self.wait_for_frame, timeout)
+        return self.get_next_frame()
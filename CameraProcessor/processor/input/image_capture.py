@@ -63,9 +63,20 @@ class ImageCapture(ICapture):
             return False, None
 
         self.image_index += 1
-        # Get path of next frame.
-        image_path = self.images_paths[self.image_index]
+        return True, self.read_image(self.image_index)
 
+    def read_image(self, index):
+        """Reads and decodes an image of the folder, without changing the current image.
+
+        Does not use any state of the capture, so multiple images can be read at the same time
+        (e.g. by the threads of a PrefetchCapture).
+
+        Args:
+            index (int): Index of the image in the sorted folder.
+
+        Returns:
+            FrameObj: FrameObject containing frame and missing timestamp.
+        """
         # Reads the image file and returns it.
-        frame = cv2.imread(image_path)
-        return True, FrameObj(frame, time.time())
+        frame = cv2.imread(self.images_paths[index])
+        return FrameObj(frame, time.time(), time.monotonic())
@@ -0,0 +1,184 @@
+"""Contains the prefetch capture, which decodes the next frames of another capture in the background.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from queue import Queue, Empty, Full
+
+from processor.input.i_capture import ICapture
+from processor.input.image_capture import ImageCapture
+
+# Put in the queue by the reading thread when the capture has no more frames.
+END_OF_CAPTURE = None
+
+
+class PrefetchCapture(ICapture):
+    """Capture wrapper that decodes the next frames of a capture while the pipeline processes the current one.
+
+    A background thread reads frames from the wrapped capture into a bounded buffer, so decoding overlaps with
+    the processing of the pipeline instead of adding to the time per frame. Frames of an ImageCapture can be
+    decoded by a small pool of threads, which keeps the frames in order.
+
+    Only use it for captures of which every frame has to be processed (images and video files),
+    for live captures it adds latency, as the buffered frames get older while they wait.
+
+    Attributes:
+        capture (ICapture): Capture of which the frames are prefetched.
+        buffer_size (int): Maximum number of decoded frames waiting in the buffer.
+    """
+
+    def __init__(self, capture, buffer_size=8, workers=1):
+        """Starts reading frames from the capture in the background.
+
+        Args:
+            capture (ICapture): Capture of which the frames are prefetched, only used by the reading thread.
+            buffer_size (int): Maximum number of decoded frames waiting in the buffer.
+            workers (int): Number of threads decoding the images of an ImageCapture,
+                other captures are always read by a single thread.
+
+        Raises:
+            ValueError: The buffer size or number of workers is smaller than 1.
+        """
+        if buffer_size < 1 or workers < 1:
+            raise ValueError('The buffer should hold at least one frame, read by at least one worker')
+
+        self.capture = capture
+        self.buffer_size = buffer_size
+
+        # Futures of the decoded frames, in the order of the capture.
+        self.__frames = Queue(buffer_size)
+        self.__ended = False
+        self.__stopped = threading.Event()
+
+        self.__executor = None
+        if workers > 1 and isinstance(capture, ImageCapture):
+            self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch-decode')
+        elif workers > 1:
+            logging.warning(f'{type(capture).__name__} is read by a single thread, ignoring the prefetch workers')
+
+        self.__thread = threading.Thread(target=self.__read, name='prefetch-capture', daemon=True)
+        self.__thread.start()
+
+    def opened(self):
+        """Checks whether frames are still buffered or can still be read.
+
+        Returns:
+            bool: Whether the capture might return another frame.
+        """
+        return not self.__stopped.is_set() and not self.__ended
+
+    def close(self):
+        """Stops the reading thread, discards the buffered frames and closes the wrapped capture."""
+        self.__stopped.set()
+        self.__discard_buffer()
+
+        # Wake up the threads waiting for a frame, as no frames will arrive anymore.
+        with self.__frames.not_empty:
+            self.__frames.not_empty.notify_all()
+        self.__thread.join()
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+        self.capture.close()
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the next frame is decoded, the capture closed or the timeout passed.
+
+        Args:
+            timeout (float): Maximum time (in s) to wait, None waits until a frame is decoded.
+
+        Returns:
+            bool: Whether get_next_frame can return without waiting.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        # The buffer is only emptied by get_next_frame, so the first frame stays in it after the wait.
+        with self.__frames.not_empty:
+            self.__frames.not_empty.wait_for(lambda: self.__frames.queue or not self.opened(), timeout)
+            if not self.__frames.queue:
+                return False
+            future = self.__frames.queue[0]
+
+        if future is END_OF_CAPTURE:
+            return True
+
+        # The images of the pool might still be decoding.
+        done, _ = wait([future], None if deadline is None else max(deadline - time.monotonic(), 0))
+        return len(done) > 0
+
+    def get_next_frame(self):
+        """Gets the next decoded frame, waiting for it when the buffer is empty.
+
+        Returns:
+            bool, FrameObj: Boolean whether a next frame was found.
+                            Frame from the capture object.
+        """
+        while self.opened():
+            try:
+                future = self.__frames.get(timeout=0.1)
+            except Empty:
+                continue
+
+            if future is END_OF_CAPTURE:
+                self.__ended = True
+                break
+
+            return True, future.result()
+
+        return False, None
+
+    def __read(self):
+        """Reading thread, fills the buffer with the frames of the capture until it has no frames left."""
+        try:
+            if self.__executor is not None:
+                self.__read_images()
+            else:
+                self.__read_frames()
+        # pylint: disable=broad-except
+        except Exception as error:
+            logging.error(f'Prefetching frames failed: {error}')
+
+        self.__put(END_OF_CAPTURE)
+
+    def __read_frames(self):
+        """Reads the frames of the capture one by one, skipping frames that could not be read."""
+        while not self.__stopped.is_set() and self.capture.opened():
+            ret, frame_obj = self.capture.get_next_frame()
+            if not ret:
+                continue
+
+            future = Future()
+            future.set_result(frame_obj)
+            self.__put(future)
+
+    def __read_images(self):
+        """Lets the pool decode the images of the folder, buffering the futures so the order is kept."""
+        while not self.__stopped.is_set() and self.capture.opened():
+            self.capture.image_index += 1
+            self.__put(self.__executor.submit(self.capture.read_image, self.capture.image_index))
+
+    def __put(self, future):
+        """Puts a frame in the buffer, waiting while the buffer is full until the capture is closed.
+
+        Args:
+            future (Future): future of the decoded frame, or END_OF_CAPTURE.
+        """
+        while not self.__stopped.is_set():
+            try:
+                self.__frames.put(future, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def __discard_buffer(self):
+        """Removes all frames from the buffer."""
+        try:
+            while True:
+                self.__frames.get_nowait()
+        except Empty:
+            pass
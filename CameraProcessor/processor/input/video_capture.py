@@ -66,4 +66,4 @@ class VideoCapture(ICapture):
 
         self.__current_frame_nr += 1
         ret, frame = self.cap.read()
-        return ret, FrameObj(frame, time.time())
+        return ret, FrameObj(frame, time.time(), time.monotonic())
@@ -17,7 +17,10 @@ from processor.utils.config_parser import ConfigParser
 from processor.utils.display import opencv_display
 
 from processor.pipeline.prepare_pipeline import prepare_objects
-from processor.pipeline.process_frames import process_stream
+from processor.pipeline.detection.detection_batcher import DetectionBatcher
+from processor.pipeline.detection.detection_server import DetectionServer, parse_address, parse_authkey
+from processor.utils.create_runners import create_detector, DETECTOR_SWITCH
+from processor.pipeline.process_frames import get_stream_processor
 
 from processor.websocket.websocket_client import WebsocketClient
 from processor.webhosting.html_page_handler import HtmlPageHandler
@@ -81,7 +84,7 @@ async def deploy(configs, websocket_id, websocket_url, hls_url):
     websocket_client = WebsocketClient(websocket_url, websocket_id)
     await websocket_client.connect()
     # Initiate the stream processing loop, giving the websocket client.
-    await process_stream(
+    await get_stream_processor(configs['Main'])(
         capture,
         detector,
         tracker,
@@ -94,6 +97,34 @@ async def deploy(configs, websocket_id, websocket_url, hls_url):
     )
 
 
+def serve_detection(configs):
+    """Runs a detector as detection server, combining the frames of all connected camera processors into batches.
+
+    Args:
+        configs (configparser.ConfigParser): configurations containing the DetectionServer section.
+
+    Raises:
+        NameError: The detector of the server is not known, or is the remote detector itself.
+    """
+    server_config = configs['DetectionServer']
+    detector_name = server_config.get('detector').lower()
+    if detector_name not in DETECTOR_SWITCH or detector_name == 'remote':
+        raise NameError(f'Incorrect detector. Detector {detector_name} can not be run by the detection server.')
+
+    # A single model is shared by all connections.
+    detector = DetectionBatcher(create_detector(detector_name, configs),
+                                server_config.getint('max_batch_size'),
+                                server_config.getfloat('max_wait'))
+    server = DetectionServer(detector,
+                             parse_address(server_config['address']),
+                             parse_authkey(server_config.get('authkey')))
+    try:
+        server.serve_forever()
+    finally:
+        server.close()
+        detector.stop()
+
+
 def main():
     """Run the main loop, depending on the mode run on localhost, locally with opencv or in the swarm.
 
@@ -118,13 +149,16 @@ def main():
     elif configs['Main']['mode'].lower() == 'opencv':
         capture, detector, tracker, re_identifier, _ = prepare_objects(configs)
         asyncio.get_event_loop().run_until_complete(
-            process_stream(capture, detector, tracker, re_identifier, opencv_display, None)
+            get_stream_processor(configs['Main'])(capture, detector, tracker, re_identifier, opencv_display, None)
         )
     # Deploy mode where all is sent to the orchestrator using the websocket URL.
     elif configs['Main']['mode'].lower() == 'deploy':
         # Make environment variables are set when running in deploy.
         ws_id, ws_url, hls_url = enforce_deploy_environment_variables()
         asyncio.get_event_loop().run_until_complete(deploy(configs, ws_id, ws_url, hls_url))
+    # Detection server mode where the frames of multiple camera processors are detected by a single model.
+    elif configs['Main']['mode'].lower() == 'detection_server':
+        serve_detection(configs)
     else:
         raise AttributeError('Mode you try to run in does not exist, did you make a typo?')
 
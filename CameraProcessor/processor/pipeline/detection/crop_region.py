@@ -0,0 +1,54 @@
+"""Contains the functions to detect a region of a frame and map the detections back onto the full frame.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+
+
+def crop_frame(frame_obj, region):
+    """Crops a region out of a frame.
+
+    Args:
+        frame_obj (FrameObj): object containing frame and timestamp.
+        region ((int, int, int, int)): region in pixels in the form (x1, y1, x2, y2).
+
+    Returns:
+        FrameObj: frame object of the region, with the timestamp of the frame.
+    """
+    x1, y1, x2, y2 = region
+    return FrameObj(np.ascontiguousarray(frame_obj.frame[y1:y2, x1:x2]), frame_obj.timestamp)
+
+
+def boxes_from_crop(bounding_boxes, region, shape):
+    """Maps the boxes detected in a region back onto the full frame.
+
+    Args:
+        bounding_boxes (BoundingBoxes): boxes normalized to the region.
+        region ((int, int, int, int)): region in pixels in the form (x1, y1, x2, y2).
+        shape ((int, int)): width and height of the full frame.
+
+    Returns:
+        [BoundingBox]: the boxes normalized to the full frame.
+    """
+    x1, y1, x2, y2 = region
+    width, height = shape
+    scale_x, scale_y = (x2 - x1) / width, (y2 - y1) / height
+    offset_x, offset_y = x1 / width, y1 / height
+
+    return [
+        BoundingBox(
+            box.identifier,
+            Rectangle(offset_x + box.rectangle.x1 * scale_x, offset_y + box.rectangle.y1 * scale_y,
+                      offset_x + box.rectangle.x2 * scale_x, offset_y + box.rectangle.y2 * scale_y, validate=False),
+            box.classification,
+            box.certainty,
+            box.object_id
+        )
+        for box in bounding_boxes
+    ]
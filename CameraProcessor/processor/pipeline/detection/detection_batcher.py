@@ -0,0 +1,130 @@
+"""Contains a detector that combines the frames of multiple callers into batches for a shared detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from queue import Queue, Empty
+
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class DetectionBatcher(IDetector):
+    """Detector that collects frames from multiple threads and detects them in batches using a single detector.
+
+    Every call to detect blocks until the batch containing the frame has been detected. A batch is run as soon
+    as it is full, or when the oldest frame in it has waited for the maximum wait time.
+
+    Attributes:
+        detector (IDetector): Detector running the batches, only used by the worker thread of the batcher.
+        max_batch_size (int): Maximum number of frames detected in a single batch.
+        max_wait (float): Maximum time (in s) to wait for more frames before an incomplete batch is detected.
+    """
+
+    def __init__(self, detector, max_batch_size=8, max_wait=0.01):
+        """Inits the batcher and starts the worker thread running the batches.
+
+        Args:
+            detector (IDetector): Detector running the batches.
+            max_batch_size (int): Maximum number of frames detected in a single batch.
+            max_wait (float): Maximum time (in s) to wait for more frames before an incomplete batch is detected.
+
+        Raises:
+            ValueError: The maximum batch size is smaller than 1.
+        """
+        if max_batch_size < 1:
+            raise ValueError('A batch should contain at least one frame')
+
+        self.detector = detector
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self.__requests = Queue()
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name='detection-batcher', daemon=True)
+        self.__thread.start()
+
+    def detect(self, frame_obj):
+        """Adds the frame to the next batch and waits for its detections.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: returns BoundingBoxes object containing a list of BoundingBox objects.
+
+        Raises:
+            Exception: the detector raised an exception on the batch containing the frame.
+        """
+        future = Future()
+        self.__requests.put((frame_obj, future))
+        return future.result()
+
+    def detect_batch(self, frame_objs):
+        """Adds all frames to the next batches at once and waits for their detections.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object for every frame, in the same order as the frames.
+        """
+        futures = []
+        for frame_obj in frame_objs:
+            future = Future()
+            self.__requests.put((frame_obj, future))
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def stop(self):
+        """Stops the worker thread after the current batch, frames that are still waiting are not detected."""
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __collect_batch(self):
+        """Collects the next batch, waiting at most the maximum wait time after the first frame arrived.
+
+        Returns:
+            [(FrameObj, Future)]: frames of the batch with the futures to store their detections in,
+                empty if no frame arrived in time.
+        """
+        try:
+            batch = [self.__requests.get(timeout=0.1)]
+        except Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                # Take frames that are already waiting, even when the deadline has passed.
+                batch.append(self.__requests.get(timeout=remaining) if remaining > 0
+                             else self.__requests.get_nowait())
+            except Empty:
+                break
+
+        return batch
+
+    def __run(self):
+        """Worker loop running the batches until the batcher is stopped."""
+        while not self.__stopped.is_set():
+            batch = self.__collect_batch()
+            if not batch:
+                continue
+
+            try:
+                batch_bounding_boxes = self.detector.detect_batch([frame_obj for frame_obj, _ in batch])
+            # pylint: disable=broad-except
+            except Exception as error:
+                # Let every caller of the failed batch raise the error.
+                logging.error(f'Detection of a batch of {len(batch)} frames failed: {error}')
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+
+            for (_, future), bounding_boxes in zip(batch, batch_bounding_boxes):
+                future.set_result(bounding_boxes)
@@ -0,0 +1,131 @@
+"""Contains the detection server, which runs a single detector for the frames of multiple camera processors.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+
+def parse_address(address):
+    """Parses the address of a detection server.
+
+    Args:
+        address (str): host:port for a TCP socket, or a file path for a local (unix) socket.
+
+    Returns:
+        (str, int) or str: address that can be used by a multiprocessing Listener or Client.
+    """
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def parse_authkey(authkey):
+    """Parses the shared secret used to authenticate the connections of a detection server.
+
+    Args:
+        authkey (str): secret shared by the server and the clients, empty or None disables authentication,
+            which is only allowed for local (unix) sockets.
+
+    Returns:
+        bytes: authentication key, None if authentication is disabled.
+    """
+    return authkey.encode() if authkey else None
+
+
+class DetectionServer:
+    """Server that receives frames of camera processors over a socket and sends their detections back.
+
+    Every connection is handled on its own thread, which passes the frames to a shared detector.
+    Using a DetectionBatcher as detector combines the frames of all cameras into batches,
+    so a single model in memory serves all of them.
+
+    Attributes:
+        detector (IDetector): Detector shared by all connections.
+        address ((str, int) or str): Address the server listens on.
+    """
+
+    def __init__(self, detector, address, authkey=None):
+        """Inits the server and starts listening on the address.
+
+        Args:
+            detector (IDetector): Detector shared by all connections, has to be thread-safe (e.g. DetectionBatcher).
+            address ((str, int) or str): (host, port) for a TCP socket or a file path for a local (unix) socket.
+            authkey (bytes): secret the clients need to connect, None disables authentication.
+
+        Raises:
+            ValueError: A TCP socket is used without authentication key.
+        """
+        # Connections receive pickled frames, which can run any code, so only local sockets may skip authentication.
+        if not authkey and not isinstance(address, str):
+            raise ValueError(f'The detection server on {address} needs an authkey, '
+                             f'only a local (unix) socket address may be used without authentication')
+
+        self.detector = detector
+        self.address = address
+
+        self.__authkey = authkey
+        self.__listener = Listener(address, authkey=authkey)
+        self.__closed = threading.Event()
+
+    def serve_forever(self):
+        """Accepts connections until the server is closed, handling each connection on its own thread."""
+        logging.info(f'Detection server listening on {self.address}')
+        while not self.__closed.is_set():
+            try:
+                connection = self.__listener.accept()
+            except (OSError, AuthenticationError) as error:
+                logging.error(f'Detection server could not accept a connection: {error}')
+                continue
+
+            # The connection made by close only wakes up the server.
+            if self.__closed.is_set():
+                connection.close()
+                break
+
+            threading.Thread(target=self.__handle, args=(connection,), daemon=True).start()
+
+    def close(self):
+        """Stops accepting new connections.
+
+        Closing the listener does not interrupt a blocking accept, so a connection is made to wake up the server.
+        """
+        self.__closed.set()
+        try:
+            Client(self.address, authkey=self.__authkey).close()
+        except OSError:
+            pass
+        self.__listener.close()
+
+    def __handle(self, connection):
+        """Detects the frames received on a connection until the client disconnects.
+
+        Exceptions of the detector are sent back, so the client can raise them.
+
+        Args:
+            connection (Connection): Connection with a single camera processor.
+        """
+        with connection:
+            while True:
+                try:
+                    frame_obj = connection.recv()
+                except (EOFError, OSError):
+                    break
+
+                try:
+                    result = self.detector.detect(frame_obj)
+                # pylint: disable=broad-except
+                except Exception as error:
+                    result = error
+
+                try:
+                    connection.send(result)
+                except OSError:
+                    break
+
+        logging.info('Detection server connection closed')
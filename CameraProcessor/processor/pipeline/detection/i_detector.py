@@ -31,3 +31,17 @@ class IDetector(IComponent):
             NotImplementedError: The function is not overridden in the subclass.
         """
         raise NotImplementedError("Detect function not implemented")
+
+    def detect_batch(self, frame_objs):
+        """Runs detection on multiple frames, possibly from different cameras.
+
+        Detectors that can run a batch in a single forward pass override this function,
+        by default the frames are detected one by one.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object for every frame, in the same order as the frames.
+        """
+        return [self.detect(frame_obj) for frame_obj in frame_objs]
@@ -8,43 +8,22 @@ import numpy as np
 import torch
 
 from processor.pipeline.detection.i_detector import IDetector
-from processor.data_object.bounding_box import BoundingBox
-from processor.data_object.rectangle import Rectangle
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
 from processor.pipeline.detection.yolor.utils.general import non_max_suppression, scale_coords
 
 
 class IYoloDetector(IDetector):
     """Detection runner interface that can be run as Scheduler component."""
     @staticmethod
-    def convert_image(img, device, half):
-        """Converts the image to the size used for the detection.
-
-        Args:
-            img (Tensor): Image in a tensor representation.
-            device (device): What device to convert image on.
-            half (bool): Whether to half the image.
-
-        Returns:
-            Tensor: Image that is converted.
-        """
-        # Convert image.
-        img = img[:, :, ::-1].transpose(2, 0, 1)  # BGR to RGB, to 3x416x416
-        img = np.ascontiguousarray(img)
-        img = torch.from_numpy(img).to(device)
-        img = img.half() if half else img.float()  # uint8 to fp16/32
-        img /= 255.0  # 0 - 255 to 0.0 - 1.0
-        if img.ndimension() == 3:
-            img = img.unsqueeze(0)
-        return img
-
-    @staticmethod
-    def generate_predictions(img, model, configs):
+    def generate_predictions(img, model, configs, classes=None):
         """Generates the predictions of the detection.
 
         Args:
             img (Tensor): 2.
             model (model): Model that gets used.
             configs (SectionProxy): Yolo section of the configuration.
+            classes ([int]): Class indices to keep, candidates of other classes are dropped before the
+                non-maximum suppression. None keeps all classes.
 
         Returns:
             Tensor: Tensor containing the predictions the detection made
@@ -54,38 +33,57 @@ class IYoloDetector(IDetector):
         # Apply NMS.
         return non_max_suppression(pred, configs.getfloat('conf-thres'),
                                    configs.getfloat('iou-thres'),
-                                   classes=configs['classes'],
+                                   classes=classes,
                                    agnostic=configs.getboolean('agnostic_nms'))
 
     @staticmethod
-    def create_bounding_boxes(pred, img, frame_obj, bounding_boxes, filter_types, names):
-        """Creates the bounding boxes of the detection.
+    def class_indices(names, filter_types):
+        """Gets the class indices of the object types to detect, so predictions can be filtered on their class.
 
         Args:
-            pred ([Tensor]): List of tensors containing the predictions.
-            img (Tensor): Image stored in a tensor.
-            frame_obj (FrameObj): Object containing the frame.
-            bounding_boxes ([BoundingBoxes]): Bounding boxes in which to store the predictions.
+            names ([str]): The complete list of types that get detected.
             filter_types ([str]): What detection types to filter on.
+
+        Returns:
+            Tensor: Indices into names of the filtered types.
+        """
+        filter_types = set(filter_types)
+        return torch.tensor([i for i, name in enumerate(names) if name in filter_types], dtype=torch.long)
+
+    @staticmethod
+    def create_bounding_boxes(det, img, frame_obj, filter_classes, names):
+        """Creates the bounding boxes of the predictions of a frame.
+
+        The predictions of other classes are dropped on the device, before the remaining predictions are
+        rescaled, copied and normalized at once. BoundingBox objects are only created when they are used.
+
+        Args:
+            det (Tensor): (N, 6) predictions [x1, y1, x2, y2, confidence, class] of the frame, may be None.
+            img (Tensor): Images the predictions were made on.
+            frame_obj (FrameObj): Object containing the frame.
+            filter_classes (Tensor): Class indices to detect, see class_indices.
             names ([str]): The complete list of types that get detected.
+
+        Returns:
+            ArrayBoundingBoxes: Boxes of the filtered classes, lowest confidence first.
         """
-        # Detections per image.
-        for _, det in enumerate(pred):
-            if det is not None and len(det) > 0:
-                # Rescale boxes from img_size to im0 size.
-                det[:, :4] = scale_coords(img.shape[2:], det[:, :4], frame_obj.frame.shape).round()
-
-                bb_id = 0
-                # Get the xyxy, confidence, and class, attach them to det_obj.
-                for *xyxy, conf, cls in reversed(det):
-                    width, height = frame_obj.shape
-                    bbox = BoundingBox(
-                        bb_id,
-                        Rectangle(int(xyxy[0]) / width, int(xyxy[1]) / height, int(xyxy[2]) / width,
-                                  int(xyxy[3]) / height),
-                        names[int(cls)],
-                        conf.item()
-                    )
-                    if any(x == bbox.classification for x in filter_types):
-                        bounding_boxes.append(bbox)
-                        bb_id += 1
+        if det is not None and len(det) > 0:
+            classes = det[:, 5].long().unsqueeze(1)
+            det = det[(classes == filter_classes.to(classes.device).unsqueeze(0)).any(dim=1)].flip(0)
+
+        if det is None or len(det) == 0:
+            return ArrayBoundingBoxes(np.empty((0, 4)), [], [], [], class_names=names, validate=False)
+
+        # Rescale boxes from img_size to im0 size.
+        det[:, :4] = scale_coords(img.shape[2:], det[:, :4], frame_obj.frame.shape).round()
+        det = det.float().cpu().numpy()
+
+        width, height = frame_obj.shape
+        return ArrayBoundingBoxes(
+            det[:, :4] / np.array([width, height, width, height]),
+            np.arange(len(det)),
+            det[:, 5].astype(int),
+            det[:, 4],
+            class_names=names,
+            validate=False
+        )
@@ -0,0 +1,143 @@
+"""Contains the letterbox buffer, which letterboxes frames straight into a preallocated input tensor of a detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import cv2
+import torch
+
+# Colour of the padding around the resized frame, the same as the letterbox of YOLOv5 and YOLOR.
+PADDING_VALUE = 114
+
+
+class LetterboxBuffer:
+    """Letterboxes BGR frames to normalized RGB input tensors of a detector without allocating per frame.
+
+    Gives the same images as letterbox followed by the former per-frame conversion (swapping the channels to RGB,
+    transposing to channels first and normalizing to floats). The frames are resized straight into a preallocated
+    (pinned when the detector runs on the GPU) uint8 buffer, of which the padding is only filled when the layout of
+    a slot changes. The channel swap, transpose and conversion to floats are then done in one copy per channel into
+    a preallocated input tensor on the device, which is normalized in place. The buffers are reused until the input
+    shape or batch grows.
+
+    Note:
+        The returned tensor is overwritten by the next call, so it must be used before converting the next frames.
+
+    Attributes:
+        img_size (int): Width and height of the letterbox before the padding is trimmed.
+        stride (int): Stride of the model, the trimmed padding is a multiple of it.
+        device (torch.device): Device the input tensor is on.
+        half (bool): Whether the input tensor is half precision.
+        auto (bool): Whether to trim the padding to the smallest multiple of the stride,
+            otherwise all frames are letterboxed to img_size by img_size.
+    """
+
+    def __init__(self, img_size, stride, device, half=False, auto=True):
+        """Inits the letterbox buffer without allocating the buffers yet.
+
+        Args:
+            img_size (int): Width and height of the letterbox before the padding is trimmed.
+            stride (int): Stride of the model.
+            device (torch.device): Device the input tensor is on.
+            half (bool): Whether the input tensor is half precision.
+            auto (bool): Whether to trim the padding to the smallest multiple of the stride.
+        """
+        self.img_size = img_size
+        self.stride = stride
+        self.device = torch.device(device)
+        self.half = half
+        self.auto = auto
+
+        # Resized frames (N, height, width, 3), their copy on the device and the input tensor (N, 3, height, width).
+        self.__host = None
+        self.__device_frames = None
+        self.__input = None
+
+        # Layout of the frame in every slot of the host buffer, of which the padding is filled.
+        self.__layouts = []
+
+    def layout(self, frame_shape):
+        """Calculates where a frame ends up in its letterbox, like the letterbox of YOLOv5.
+
+        Args:
+            frame_shape ((int, int)): Height and width of the frame.
+
+        Returns:
+            ((int, int), (int, int, int, int)): Height and width of the letterbox and the region of the resized
+                frame in it in the form (x1, y1, x2, y2).
+        """
+        height, width = frame_shape
+        ratio = min(self.img_size / height, self.img_size / width)
+        resized_width, resized_height = int(round(width * ratio)), int(round(height * ratio))
+
+        pad_width, pad_height = self.img_size - resized_width, self.img_size - resized_height
+        if self.auto:
+            pad_width, pad_height = pad_width % self.stride, pad_height % self.stride
+
+        # Divide the padding over both sides, like the letterbox.
+        top, bottom = int(round(pad_height / 2 - 0.1)), int(round(pad_height / 2 + 0.1))
+        left, right = int(round(pad_width / 2 - 0.1)), int(round(pad_width / 2 + 0.1))
+
+        shape = (top + resized_height + bottom, left + resized_width + right)
+        return shape, (left, top, left + resized_width, top + resized_height)
+
+    def convert(self, frames):
+        """Letterboxes the frames into the input tensor.
+
+        Args:
+            frames ([np.ndarray]): BGR frames, which are letterboxed to the same shape.
+
+        Returns:
+            Tensor: (N, 3, height, width) normalized RGB images on the device, a view of the input tensor.
+
+        Raises:
+            ValueError: The frames have different letterbox shapes.
+        """
+        layouts = [self.layout(frame.shape[:2]) for frame in frames]
+        shape = layouts[0][0]
+        if any(frame_layout[0] != shape for frame_layout in layouts):
+            raise ValueError('All frames of a batch must have the same letterbox shape')
+
+        self.__allocate(len(frames), shape)
+
+        host = self.__host.numpy()
+        for i, (frame, (_, region)) in enumerate(zip(frames, layouts)):
+            if self.__layouts[i] != region:
+                host[i].fill(PADDING_VALUE)
+                self.__layouts[i] = region
+
+            x1, y1, x2, y2 = region
+            if frame.shape[:2] == (y2 - y1, x2 - x1):
+                host[i, y1:y2, x1:x2] = frame
+            else:
+                cv2.resize(frame, (x2 - x1, y2 - y1), dst=host[i, y1:y2, x1:x2], interpolation=cv2.INTER_LINEAR)
+
+        frames_uint8 = self.__host[:len(frames)]
+        if self.__device_frames is not None:
+            frames_uint8 = self.__device_frames[:len(frames)]
+            frames_uint8.copy_(self.__host[:len(frames)], non_blocking=True)
+
+        # Swap BGR to RGB and transpose to channels first in the copy to the input tensor, then normalize in place.
+        images = self.__input[:len(frames)]
+        for channel in range(3):
+            images[:, channel].copy_(frames_uint8[..., 2 - channel])
+        return images.div_(255.0)
+
+    def __allocate(self, batch_size, shape):
+        """Allocates the buffers when they are too small or have a different shape.
+
+        Args:
+            batch_size (int): Number of frames converted at once.
+            shape ((int, int)): Height and width of the letterbox.
+        """
+        if self.__host is not None and self.__host.shape[0] >= batch_size and tuple(self.__host.shape[1:3]) == shape:
+            return
+
+        height, width = shape
+        on_gpu = self.device.type == 'cuda'
+        self.__host = torch.empty((batch_size, height, width, 3), dtype=torch.uint8, pin_memory=on_gpu)
+        self.__device_frames = torch.empty_like(self.__host, device=self.device) if on_gpu else None
+        self.__input = torch.empty((batch_size, 3, height, width), device=self.device,
+                                   dtype=torch.float16 if self.half else torch.float32)
+        self.__layouts = [None] * batch_size
@@ -0,0 +1,215 @@
+"""Contains the motion gated detector, which only runs the detector when the frame changed.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+
+import cv2
+import numpy as np
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.pipeline.detection.crop_region import crop_frame, boxes_from_crop
+from processor.pipeline.detection.i_detector import IDetector
+
+# Number of frames in between two logs of the stats.
+STATS_LOG_INTERVAL = 1000
+
+
+class MotionGatedDetector(IDetector):
+    """Detector wrapper that skips detection when the frame barely changed since the last detected frame.
+
+    Frames are downscaled to grayscale and compared with the last detected frame. When too few pixels changed,
+    the detections of the last detected frame are returned without running the detector, which saves most of
+    the inference of static cameras showing an empty or unchanged scene. Optionally only the changed region
+    is detected, keeping the last detections outside it.
+
+    Attributes:
+        detector (IDetector): Detector running on the frames that changed.
+        config (SectionProxy): MotionGate section of the configurations.
+        frames (int): Number of frames passed to the detector.
+        skipped_frames (int): Number of frames of which the detections of the last detected frame were reused.
+        cropped_frames (int): Number of frames of which only the changed region was detected.
+    """
+
+    def __init__(self, detector, config):
+        """Inits the motion gate in front of the detector.
+
+        Args:
+            detector (IDetector): Detector running on the frames that changed.
+            config (SectionProxy): MotionGate section of the configurations.
+        """
+        self.detector = detector
+        self.config = config
+        self.frames = 0
+        self.skipped_frames = 0
+        self.cropped_frames = 0
+
+        self.__scale_width = config.getint('scale_width', 160)
+        self.__pixel_threshold = config.getint('pixel_threshold', 25)
+        self.__min_changed_fraction = config.getfloat('min_changed_fraction', 0.002)
+        self.__max_skipped_frames = config.getint('max_skipped_frames', 100)
+        self.__crop_to_motion = config.getboolean('crop_to_motion', False)
+        self.__crop_padding = config.getfloat('crop_padding', 0.1)
+
+        # Downscaled frame and detections of the last detected frame.
+        self.__reference = None
+        self.__detections = None
+        self.__consecutive_skips = 0
+
+    @property
+    def skip_ratio(self):
+        """Gets the fraction of the frames of which detection was skipped.
+
+        Returns:
+            float: Skipped frames divided by the frames, 0 when no frame was passed.
+        """
+        return self.skipped_frames / self.frames if self.frames > 0 else 0.
+
+    def stats(self):
+        """Gets the counters of the motion gate.
+
+        Returns:
+            dict[str, float]: Number of frames, skipped and cropped frames and the skip ratio.
+        """
+        return {
+            'frames': self.frames,
+            'skipped_frames': self.skipped_frames,
+            'cropped_frames': self.cropped_frames,
+            'skip_ratio': self.skip_ratio
+        }
+
+    def detect(self, frame_obj):
+        """Detects the frame when it changed since the last detected frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: detections of the frame, or of the last detected frame when the frame did not change.
+        """
+        self.frames += 1
+        if self.frames % STATS_LOG_INTERVAL == 0:
+            logging.info(f'motion gate: {self.stats()}')
+
+        small = self.__downscale(frame_obj.frame)
+        if self.__reference is None or small.shape != self.__reference.shape:
+            return self.__detect_full(frame_obj, small)
+
+        changed = cv2.absdiff(small, self.__reference) > self.__pixel_threshold
+        if changed.mean() < self.__min_changed_fraction and \
+                (self.__max_skipped_frames <= 0 or self.__consecutive_skips < self.__max_skipped_frames):
+            self.skipped_frames += 1
+            self.__consecutive_skips += 1
+            return self.__last_detections()
+
+        if self.__crop_to_motion:
+            region = self.__changed_region(changed, frame_obj.shape)
+            if region is not None:
+                return self.__detect_region(frame_obj, small, region)
+
+        return self.__detect_full(frame_obj, small)
+
+    def __detect_full(self, frame_obj, small):
+        """Detects the whole frame and makes it the reference frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+            small (np.ndarray): downscaled grayscale frame.
+
+        Returns:
+            BoundingBoxes: detections of the frame.
+        """
+        self.__detections = self.detector.detect(frame_obj)
+        self.__reference = small
+        self.__consecutive_skips = 0
+        return self.__last_detections()
+
+    def __detect_region(self, frame_obj, small, region):
+        """Detects the changed region, keeping the last detections that do not overlap it.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+            small (np.ndarray): downscaled grayscale frame.
+            region ((int, int, int, int)): changed region in pixels in the form (x1, y1, x2, y2).
+
+        Returns:
+            BoundingBoxes: detections of the frame.
+        """
+        self.cropped_frames += 1
+        width, height = frame_obj.shape
+        x1, y1, x2, y2 = region[0] / width, region[1] / height, region[2] / width, region[3] / height
+
+        kept = [box for box in self.__detections
+                if box.rectangle.x2 <= x1 or box.rectangle.x1 >= x2
+                or box.rectangle.y2 <= y1 or box.rectangle.y1 >= y2]
+        detected = boxes_from_crop(self.detector.detect(crop_frame(frame_obj, region)), region, frame_obj.shape)
+
+        # Number the boxes again, as the kept and detected boxes both start at 0.
+        self.__detections = BoundingBoxes(
+            [BoundingBox(i, box.rectangle, box.classification, box.certainty, box.object_id)
+             for i, box in enumerate(kept + detected)]
+        )
+
+        # The region of the reference frame is now up to date, the rest is kept to accumulate slow changes.
+        small_x1, small_y1 = int(x1 * small.shape[1]), int(y1 * small.shape[0])
+        small_x2, small_y2 = int(np.ceil(x2 * small.shape[1])), int(np.ceil(y2 * small.shape[0]))
+        self.__reference[small_y1:small_y2, small_x1:small_x2] = small[small_y1:small_y2, small_x1:small_x2]
+        self.__consecutive_skips = 0
+        return self.__last_detections()
+
+    def __last_detections(self):
+        """Gets a new BoundingBoxes of the last detections for the current frame.
+
+        The stages after the detector may change the returned boxes (e.g. set_object_id), so every frame gets its own
+        list, and the image id of the frame the detections were made on is not carried over.
+
+        Returns:
+            BoundingBoxes: the last detections.
+        """
+        return BoundingBoxes(list(self.__detections))
+
+    def __changed_region(self, changed, shape):
+        """Gets the padded bounding rectangle of the changed pixels.
+
+        Args:
+            changed (np.ndarray): boolean mask of the changed pixels of the downscaled frame.
+            shape ((int, int)): width and height of the full frame.
+
+        Returns:
+            (int, int, int, int): region in pixels in the form (x1, y1, x2, y2), None if no pixel changed
+                or the region covers most of the frame, so cropping does not save time.
+        """
+        rows = np.flatnonzero(changed.any(axis=1))
+        columns = np.flatnonzero(changed.any(axis=0))
+        if len(rows) == 0:
+            return None
+
+        small_height, small_width = changed.shape
+        width, height = shape
+
+        x1 = max(columns[0] / small_width - self.__crop_padding, 0.)
+        y1 = max(rows[0] / small_height - self.__crop_padding, 0.)
+        x2 = min((columns[-1] + 1) / small_width + self.__crop_padding, 1.)
+        y2 = min((rows[-1] + 1) / small_height + self.__crop_padding, 1.)
+
+        if (x2 - x1) * (y2 - y1) > 0.5:
+            return None
+        return int(x1 * width), int(y1 * height), int(np.ceil(x2 * width)), int(np.ceil(y2 * height))
+
+    def __downscale(self, frame):
+        """Downscales the frame to a blurred grayscale image, which removes most of the noise.
+
+        Args:
+            frame (np.ndarray): BGR frame.
+
+        Returns:
+            np.ndarray: downscaled grayscale frame.
+        """
+        height, width = frame.shape[:2]
+        scale_height = max(round(height * self.__scale_width / width), 1)
+        small = cv2.resize(frame, (self.__scale_width, scale_height), interpolation=cv2.INTER_AREA)
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(small, (5, 5), 0)
@@ -0,0 +1,188 @@
+"""Contains the region of interest detector, which only detects the regions of the frame that can contain objects.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+
+import cv2
+import numpy as np
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.pipeline.detection.crop_region import crop_frame, boxes_from_crop
+from processor.pipeline.detection.i_detector import IDetector
+
+
+def parse_polygons(text):
+    """Parses the polygons of the regions of interest.
+
+    Args:
+        text (str): Polygons separated by ';', each a list of normalized x,y points separated by spaces,
+            e.g. '0,0.3 1,0.3 1,1 0,1; 0,0 0.2,0 0.2,0.3'.
+
+    Returns:
+        [np.ndarray]: (N, 2) array of normalized points of every polygon.
+
+    Raises:
+        ValueError: A polygon has fewer than 3 points, or a point is not normalized.
+    """
+    polygons = []
+    for polygon_text in text.split(';'):
+        if not polygon_text.strip():
+            continue
+
+        polygon = np.array([[float(value) for value in point.split(',')] for point in polygon_text.split()])
+        if polygon.ndim != 2 or polygon.shape[1] != 2 or len(polygon) < 3:
+            raise ValueError(f'Region of interest "{polygon_text.strip()}" should contain at least 3 x,y points')
+        if (polygon < 0).any() or (polygon > 1).any():
+            raise ValueError(f'Region of interest "{polygon_text.strip()}" should contain normalized points')
+        polygons.append(polygon)
+    return polygons
+
+
+def merge_regions(regions):
+    """Merges overlapping regions into their bounding region, so no part of the frame is detected twice.
+
+    Args:
+        regions ([(int, int, int, int)]): Regions in pixels in the form (x1, y1, x2, y2).
+
+    Returns:
+        [(int, int, int, int)]: Regions that do not overlap, covering all given regions.
+    """
+    merged = []
+    for x1, y1, x2, y2 in regions:
+        # Grow the region with every merged region it overlaps, until it overlaps none of them.
+        overlapping = True
+        while overlapping:
+            overlapping = [other for other in merged
+                           if x1 < other[2] and other[0] < x2 and y1 < other[3] and other[1] < y2]
+            for other in overlapping:
+                merged.remove(other)
+                x1, y1, x2, y2 = min(x1, other[0]), min(y1, other[1]), max(x2, other[2]), max(y2, other[3])
+        merged.append((x1, y1, x2, y2))
+    return merged
+
+
+class RegionOfInterestDetector(IDetector):
+    """Detector wrapper that only detects the regions of interest of a camera.
+
+    Cameras often show sky, walls or road that never contain relevant objects. Only the bounding crops of the
+    polygons of the regions of interest are detected, in a single batch when there are multiple crops. The boxes
+    are mapped back onto the full frame, and boxes of which the anchor point is outside all polygons are dropped.
+
+    Attributes:
+        detector (IDetector): Detector running on the crops.
+        config (SectionProxy): RegionOfInterest section of the configurations.
+        polygons ([np.ndarray]): Normalized points of the polygons of the regions of interest.
+    """
+
+    def __init__(self, detector, config):
+        """Inits the regions of interest in front of the detector.
+
+        Args:
+            detector (IDetector): Detector running on the crops.
+            config (SectionProxy): RegionOfInterest section of the configurations.
+
+        Raises:
+            ValueError: There is no polygon, or the anchor is unknown.
+        """
+        self.detector = detector
+        self.config = config
+        self.polygons = parse_polygons(config.get('polygons', ''))
+        if len(self.polygons) == 0:
+            raise ValueError('At least one region of interest polygon is needed')
+
+        self.__crop_padding = config.getfloat('crop_padding', 0.02)
+        self.__anchor = config.get('anchor', 'center')
+        if self.__anchor not in ('center', 'bottom'):
+            raise ValueError(f'Region of interest anchor {self.__anchor} is not center or bottom')
+
+        # Crops and mask of the polygons of the last frame shape.
+        self.__shape = None
+        self.__regions = None
+        self.__mask = None
+
+    def regions(self, shape):
+        """Gets the crops detected of a frame.
+
+        Args:
+            shape ((int, int)): Width and height of the frame.
+
+        Returns:
+            [(int, int, int, int)]: Regions in pixels in the form (x1, y1, x2, y2).
+        """
+        self.__update_shape(shape)
+        return self.__regions
+
+    def detect(self, frame_obj):
+        """Detects the regions of interest of the frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: detections inside the regions of interest, normalized to the full frame.
+        """
+        regions = self.regions(frame_obj.shape)
+
+        if len(regions) == 1 and regions[0] == (0, 0, *frame_obj.shape):
+            boxes = list(self.detector.detect(frame_obj))
+        else:
+            crops = [crop_frame(frame_obj, region) for region in regions]
+            crop_boxes = self.detector.detect_batch(crops) if len(crops) > 1 else [self.detector.detect(crops[0])]
+
+            boxes = []
+            for bounding_boxes, region in zip(crop_boxes, regions):
+                boxes.extend(boxes_from_crop(bounding_boxes, region, frame_obj.shape))
+
+        # Number the boxes again, as the boxes of every crop start at 0.
+        return BoundingBoxes(
+            [BoundingBox(i, box.rectangle, box.classification, box.certainty, box.object_id)
+             for i, box in enumerate(box for box in boxes if self.__inside(box, frame_obj.shape))]
+        )
+
+    def __inside(self, box, shape):
+        """Checks whether the anchor point of a box lies inside a region of interest.
+
+        Args:
+            box (BoundingBox): box normalized to the full frame.
+            shape ((int, int)): width and height of the frame.
+
+        Returns:
+            bool: Whether the anchor is inside a polygon.
+        """
+        width, height = shape
+        x = (box.rectangle.x1 + box.rectangle.x2) / 2
+        y = box.rectangle.y2 if self.__anchor == 'bottom' else (box.rectangle.y1 + box.rectangle.y2) / 2
+        return bool(self.__mask[min(int(y * height), height - 1), min(int(x * width), width - 1)])
+
+    def __update_shape(self, shape):
+        """Calculates the crops and the mask of the polygons when the frame shape changed.
+
+        Args:
+            shape ((int, int)): width and height of the frame.
+        """
+        if shape == self.__shape:
+            return
+
+        width, height = shape
+        scale = np.array([width, height])
+        pixel_polygons = [np.round(polygon * scale).astype(np.int32) for polygon in self.polygons]
+
+        self.__mask = np.zeros((height, width), dtype=np.uint8)
+        cv2.fillPoly(self.__mask, pixel_polygons, 1)
+
+        padding = self.__crop_padding * scale
+        self.__regions = merge_regions(
+            (int(max(polygon[:, 0].min() - padding[0], 0)), int(max(polygon[:, 1].min() - padding[1], 0)),
+             int(min(np.ceil(polygon[:, 0].max() + padding[0]), width)),
+             int(min(np.ceil(polygon[:, 1].max() + padding[1]), height)))
+            for polygon in pixel_polygons
+        )
+        self.__shape = shape
+
+        area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in self.__regions)
+        logging.info(f'Detecting {area / (width * height):.0%} of the {width}x{height} frames '
+                     f'in {len(self.__regions)} crops')
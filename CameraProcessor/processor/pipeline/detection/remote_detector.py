@@ -0,0 +1,79 @@
+"""Contains the remote detector, which lets a detection server detect the frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from multiprocessing.connection import Client
+
+import cv2
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.i_detector import IDetector
+from processor.pipeline.detection.detection_server import parse_address, parse_authkey
+
+
+class RemoteDetector(IDetector):
+    """Detector sending the frames to a detection server shared by multiple camera processors.
+
+    Bounding boxes are stored relative to the frame size, so frames are downscaled before sending them
+    to reduce the amount of data that is transferred, without changing the meaning of the returned boxes.
+
+    Attributes:
+        config (SectionProxy): Configurations of the detection server.
+        max_frame_size (int): Maximum width and height of the frames sent to the server, 0 sends full frames.
+    """
+
+    def __init__(self, config, filters):
+        """Connects to the detection server.
+
+        Args:
+            config (SectionProxy): DetectionServer section of the configurations.
+            filters (SectionProxy): Filter configurations, the detection server filters the boxes itself.
+        """
+        # pylint: disable=unused-argument
+        self.config = config
+        self.max_frame_size = config.getint('max_frame_size', 0)
+
+        self.__connection = Client(parse_address(config['address']), authkey=parse_authkey(config.get('authkey')))
+
+    def detect(self, frame_obj):
+        """Sends the frame to the detection server and waits for the detections.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: returns BoundingBoxes object containing a list of BoundingBox objects.
+
+        Raises:
+            Exception: the detector on the server raised an exception.
+        """
+        self.__connection.send(self.__downscale(frame_obj))
+        result = self.__connection.recv()
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        """Closes the connection with the detection server."""
+        self.__connection.close()
+
+    def __downscale(self, frame_obj):
+        """Downscales the frame when it is larger than the maximum frame size.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            FrameObj: frame object with a frame of at most the maximum frame size.
+        """
+        width, height = frame_obj.shape
+        if self.max_frame_size <= 0 or max(width, height) <= self.max_frame_size:
+            return frame_obj
+
+        scale = self.max_frame_size / max(width, height)
+        frame = cv2.resize(frame_obj.frame, (round(width * scale), round(height * scale)),
+                           interpolation=cv2.INTER_AREA)
+        return FrameObj(frame, frame_obj.timestamp)
@@ -0,0 +1,171 @@
+"""Contains the tiled detector, which detects overlapping tiles of high-resolution frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+
+import numpy as np
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.pipeline.detection.crop_region import crop_frame, boxes_from_crop
+from processor.pipeline.detection.i_detector import IDetector
+
+
+def tile_starts(length, tile_size, overlap):
+    """Calculates the start positions of the tiles along one axis, spread evenly over it.
+
+    Args:
+        length (int): Length of the frame along the axis in pixels.
+        tile_size (int): Length of a tile in pixels.
+        overlap (int): Minimum overlap of two neighbouring tiles in pixels.
+
+    Returns:
+        [int]: Start position of every tile, the last tile ends at the end of the frame.
+    """
+    if length <= tile_size:
+        return [0]
+
+    count = int(np.ceil((length - overlap) / (tile_size - overlap)))
+    return np.linspace(0, length - tile_size, count).round().astype(int).tolist()
+
+
+def merge_detections(boxes, threshold=0.5, metric='ios'):
+    """Greedy non-maximum suppression of the boxes of all tiles, most certain box first.
+
+    Objects on the border of two tiles are detected in both, often cut off in one of them. With the intersection
+    over the smaller box (ios) as metric, a cut off box inside the full box is suppressed as well.
+
+    Args:
+        boxes ([BoundingBox]): Boxes of all tiles, normalized to the full frame.
+        threshold (float): Overlap above which the less certain box of the same class is suppressed.
+        metric (str): Overlap metric, ios (intersection over the smaller box) or iou (intersection over union).
+
+    Returns:
+        [BoundingBox]: Boxes that are kept, most certain first.
+    """
+    if len(boxes) == 0:
+        return []
+
+    boxes = sorted(boxes, key=lambda box: box.certainty, reverse=True)
+    rects = np.array([(box.rectangle.x1, box.rectangle.y1, box.rectangle.x2, box.rectangle.y2) for box in boxes])
+    classes = np.array([box.classification for box in boxes])
+    areas = (rects[:, 2] - rects[:, 0]) * (rects[:, 3] - rects[:, 1])
+
+    suppressed = np.zeros(len(boxes), dtype=bool)
+    for i in range(len(boxes)):
+        if suppressed[i]:
+            continue
+
+        # Overlap of the kept box with all less certain boxes.
+        width = np.minimum(rects[i, 2], rects[i + 1:, 2]) - np.maximum(rects[i, 0], rects[i + 1:, 0])
+        height = np.minimum(rects[i, 3], rects[i + 1:, 3]) - np.maximum(rects[i, 1], rects[i + 1:, 1])
+        intersection = np.clip(width, 0, None) * np.clip(height, 0, None)
+        if metric == 'ios':
+            overlap = intersection / np.maximum(np.minimum(areas[i], areas[i + 1:]), 1e-12)
+        else:
+            overlap = intersection / np.maximum(areas[i] + areas[i + 1:] - intersection, 1e-12)
+
+        suppressed[i + 1:] |= (overlap > threshold) & (classes[i + 1:] == classes[i])
+
+    return [box for box, suppress in zip(boxes, suppressed) if not suppress]
+
+
+class TiledDetector(IDetector):
+    """Detector wrapper that detects overlapping tiles of a frame, finding small objects in high-resolution frames.
+
+    Downscaling a 4K frame to the input size of the model loses small, distant people, while a larger input size
+    increases the latency quadratically. Instead, the frame is split into overlapping tiles of tile_size pixels,
+    which are detected in batches of at most max_batch_size, optionally together with the downscaled frame for
+    objects larger than a tile. The boxes of all tiles are merged by a non-maximum suppression over all tiles,
+    so the cost per frame is bounded by the number of tiles.
+
+    Attributes:
+        detector (IDetector): Detector running on the tiles, ideally with an input size equal to the tile size.
+        config (SectionProxy): Tiling section of the configurations.
+    """
+
+    def __init__(self, detector, config):
+        """Inits the tiling in front of the detector.
+
+        Args:
+            detector (IDetector): Detector running on the tiles.
+            config (SectionProxy): Tiling section of the configurations.
+
+        Raises:
+            ValueError: The overlap is not smaller than the tile size, or the merge metric is unknown.
+        """
+        self.detector = detector
+        self.config = config
+
+        self.__tile_size = config.getint('tile_size', 640)
+        self.__overlap = config.getint('overlap', 128)
+        self.__max_batch_size = config.getint('max_batch_size', 8)
+        self.__include_full_frame = config.getboolean('include_full_frame', True)
+        self.__merge_threshold = config.getfloat('merge_threshold', 0.5)
+        self.__merge_metric = config.get('merge_metric', 'ios')
+
+        if not 0 <= self.__overlap < self.__tile_size:
+            raise ValueError(f'The tile overlap {self.__overlap} should be smaller than the tile size')
+        if self.__merge_metric not in ('ios', 'iou'):
+            raise ValueError(f'Tile merge metric {self.__merge_metric} is not ios or iou')
+
+        # Tiles of the last frame shape.
+        self.__shape = None
+        self.__regions = None
+
+    def regions(self, shape):
+        """Gets the tiles of a frame.
+
+        Args:
+            shape ((int, int)): Width and height of the frame.
+
+        Returns:
+            [(int, int, int, int)]: Tiles in pixels in the form (x1, y1, x2, y2).
+        """
+        if shape != self.__shape:
+            width, height = shape
+            self.__regions = [
+                (x, y, min(x + self.__tile_size, width), min(y + self.__tile_size, height))
+                for y in tile_starts(height, self.__tile_size, self.__overlap)
+                for x in tile_starts(width, self.__tile_size, self.__overlap)
+            ]
+            self.__shape = shape
+            logging.info(f'Detecting {width}x{height} frames in {len(self.__regions)} tiles')
+        return self.__regions
+
+    def detect(self, frame_obj):
+        """Detects the tiles of the frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: merged detections of all tiles, normalized to the full frame.
+        """
+        regions = self.regions(frame_obj.shape)
+        if len(regions) == 1:
+            return self.detector.detect(frame_obj)
+
+        frame_objs = [crop_frame(frame_obj, region) for region in regions]
+        if self.__include_full_frame:
+            frame_objs.append(frame_obj)
+
+        # Detect the tiles in batches of at most the maximum batch size.
+        batch_boxes = []
+        for i in range(0, len(frame_objs), self.__max_batch_size):
+            batch_boxes.extend(self.detector.detect_batch(frame_objs[i:i + self.__max_batch_size]))
+
+        boxes = []
+        for bounding_boxes, region in zip(batch_boxes, regions):
+            boxes.extend(boxes_from_crop(bounding_boxes, region, frame_obj.shape))
+        if self.__include_full_frame:
+            boxes.extend(batch_boxes[-1])
+
+        # Number the boxes again, as the boxes of every tile start at 0.
+        return BoundingBoxes(
+            [BoundingBox(i, box.rectangle, box.classification, box.certainty, box.object_id)
+             for i, box in enumerate(merge_detections(boxes, self.__merge_threshold, self.__merge_metric))]
+        )
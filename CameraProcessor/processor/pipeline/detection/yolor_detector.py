@@ -11,9 +11,8 @@ import logging
 import torch
 import gdown
 
-from processor.data_object.bounding_boxes import BoundingBoxes
 from processor.pipeline.detection.i_yolo_detector import IYoloDetector
-from processor.pipeline.detection.yolor.utils.datasets import letterbox
+from processor.pipeline.detection.letterbox_buffer import LetterboxBuffer
 from processor.pipeline.detection.yolor.utils.general import apply_classifier
 from processor.pipeline.detection.yolor.utils.torch_utils import select_device, load_classifier
 from processor.pipeline.detection.yolor.models.models import Darknet
@@ -29,6 +28,10 @@ class YolorDetector(IYoloDetector):
         half (bool): Whether to half the model or not.
         classify (bool): Whether to classify.
         names ([str]): List of names, which that should get detected.
+        filter_classes (Tensor): Indices of the names in the filter.
+        nms_classes ([int]): Indices of the names in the filter, only these candidates go through the non-maximum
+            suppression.
+        letterbox_buffer (LetterboxBuffer): Letterboxes the frames into the input tensor.
     """
     def __init__(self, config, filters):
         """Initiate the YolorDetector.
@@ -88,6 +91,12 @@ class YolorDetector(IYoloDetector):
 
         # Get names.
         self.names = self.load_classes(config['names_path'])
+        self.filter_classes = self.class_indices(self.names, self.filter)
+        self.nms_classes = self.filter_classes.tolist()
+
+        # Reuse the input tensor of the model, instead of allocating it for every frame.
+        self.letterbox_buffer = LetterboxBuffer(self.config.getint('img-size'), self.config.getint('stride'),
+                                                self.device, self.half)
 
         img = torch.zeros((1, 3, self.config.getint('img-size'), self.config.getint('img-size')), device=self.device)
         _ = self.model(img.half() if self.half else img) if self.device.type != 'cpu' else None  # run once.
@@ -102,24 +111,18 @@ class YolorDetector(IYoloDetector):
         Returns:
             BoundingBoxes: a BoundingBoxes object containing a list of BoundingBox objects.
         """
-        bounding_boxes = []
-
-        # Resize.
-        img = letterbox(frame_obj.frame, self.config.getint('img-size'),
-                        auto_size=self.config.getint('stride'))[0]
+        # Resize and convert.
+        img = self.letterbox_buffer.convert([frame_obj.frame])
 
         # Generate predictions and create corresponding bounding boxes.
-        img = self.convert_image(img, self.device, self.half)
-        pred = self.generate_predictions(img, self.model, self.config)
+        pred = self.generate_predictions(img, self.model, self.config, self.nms_classes)
 
         # Apply a secondary Classifier.
         if self.classify:
             pred = apply_classifier(pred, self.modelc, img, frame_obj.frame)
 
         # Create bounding boxes based on the predictions.
-        self.create_bounding_boxes(pred, img, frame_obj, bounding_boxes, self.filter, self.names)
-
-        return BoundingBoxes(bounding_boxes)
+        return self.create_bounding_boxes(pred[0], img, frame_obj, self.filter_classes, self.names)
 
     @staticmethod
     def load_classes(path):
@@ -11,14 +11,13 @@ import logging
 from numpy import random
 import torch
 
-from processor.data_object.bounding_boxes import BoundingBoxes
 from processor.pipeline.detection.yolov5.models.experimental import attempt_load
-from processor.pipeline.detection.yolov5.utils.datasets import letterbox
 from processor.pipeline.detection.yolov5.utils.general import check_img_size,\
     apply_classifier
 from processor.pipeline.detection.yolov5.utils.torch_utils import select_device,\
     load_classifier
 from processor.pipeline.detection.i_yolo_detector import IYoloDetector
+from processor.pipeline.detection.letterbox_buffer import LetterboxBuffer
 
 
 class Yolov5Detector(IYoloDetector):
@@ -31,6 +30,12 @@ class Yolov5Detector(IYoloDetector):
         half (bool): Whether to half the model or not.
         classify (bool): Whether to classify.
         names ([str]): List of names, which that should get detected.
+        filter_classes (Tensor): Indices of the names in the filter.
+        nms_classes ([int]): Indices of the names in the filter, only these candidates go through the non-maximum
+            suppression.
+        letterbox_buffer (LetterboxBuffer): Letterboxes single frames into the input tensor.
+        batch_letterbox_buffers (dict[(int, int), LetterboxBuffer]): Letterboxes batches of frames into the input
+            tensor of their letterbox shape.
     """
 
     def __init__(self, config, filters):
@@ -70,6 +75,10 @@ class Yolov5Detector(IYoloDetector):
         if self.half:
             self.model.half()  # to FP16
 
+        # Reuse the input tensors of the model, instead of allocating them for every frame.
+        self.letterbox_buffer = LetterboxBuffer(self.config.getint('img-size'), self.stride, self.device, self.half)
+        self.batch_letterbox_buffers = {}
+
         # Set secondary classification, by default off.
         self.classify = False
         if self.classify:
@@ -82,6 +91,8 @@ class Yolov5Detector(IYoloDetector):
         # Get names and colors.
         self.names = self.model.module.names if hasattr(self.model, 'module') else self.model.names
         self.colors = [[random.randint(0, 255) for _ in range(3)] for _ in self.names]
+        self.filter_classes = self.class_indices(self.names, self.filter)
+        self.nms_classes = self.filter_classes.tolist()
 
         if self.device.type != 'cpu':
             self.model(
@@ -106,20 +117,67 @@ class Yolov5Detector(IYoloDetector):
         Returns:
             BoundingBoxes: a BoundingBoxes object containing a list of BoundingBox objects
         """
-        bounding_boxes = []
-
         # Resize the image and convert it.
-        img = letterbox(frame_obj.frame, self.config.getint('img-size'), stride=self.stride)[0]
+        img = self.letterbox_buffer.convert([frame_obj.frame])
 
         # Generate predictions and create corresponding bounding boxes.
-        img = self.convert_image(img, self.device, self.half)
-        pred = self.generate_predictions(img, self.model, self.config)
+        pred = self.generate_predictions(img, self.model, self.config, self.nms_classes)
 
         # Apply secondary Classifier.
         if self.classify:
             pred = apply_classifier(pred, self.modelc, img, frame_obj.frame)
 
         # Create bounding boxes based on the predictions.
-        self.create_bounding_boxes(pred, img, frame_obj, bounding_boxes, self.filter, self.names)
+        return self.create_bounding_boxes(pred[0], img, frame_obj, self.filter_classes, self.names)
+
+    def detect_batch(self, frame_objs):
+        """Run detection on multiple frames, using a single forward pass per letterbox shape.
+
+        The frames are grouped on the shape of their letterbox (trimmed to the stride like in detect), so frames
+        with the same aspect ratio are not padded further and get the same detections as with detect.
+        Frames of cameras with different aspect ratios are detected in a forward pass per shape.
+
+        Args:
+            frame_objs ([FrameObj]): information objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: a BoundingBoxes object for every frame, in the same order as the frames.
+        """
+        groups = {}
+        for i, frame_obj in enumerate(frame_objs):
+            shape, _ = self.letterbox_buffer.layout(frame_obj.frame.shape[:2])
+            groups.setdefault(shape, []).append(i)
+
+        bounding_boxes = [None] * len(frame_objs)
+        for shape, indices in groups.items():
+            group = [frame_objs[i] for i in indices]
+            for i, boxes in zip(indices, self.__detect_group(shape, group)):
+                bounding_boxes[i] = boxes
+        return bounding_boxes
+
+    def __detect_group(self, shape, frame_objs):
+        """Run detection on frames with the same letterbox shape using a single forward pass.
+
+        Args:
+            shape ((int, int)): Height and width of the letterbox of the frames.
+            frame_objs ([FrameObj]): information objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: a BoundingBoxes object for every frame, in the same order as the frames.
+        """
+        # Every shape has its own buffer, so alternating shapes do not reallocate the input tensor.
+        if shape not in self.batch_letterbox_buffers:
+            self.batch_letterbox_buffers[shape] = LetterboxBuffer(self.config.getint('img-size'), self.stride,
+                                                                  self.device, self.half)
+
+        # Resize the images to the same shape into a single tensor.
+        img = self.batch_letterbox_buffers[shape].convert([frame_obj.frame for frame_obj in frame_objs])
+        pred = self.generate_predictions(img, self.model, self.config, self.nms_classes)
+
+        # Apply secondary Classifier.
+        if self.classify:
+            pred = apply_classifier(pred, self.modelc, img, [frame_obj.frame for frame_obj in frame_objs])
 
-        return BoundingBoxes(bounding_boxes)
+        # Scatter the predictions back to the frames they belong to.
+        return [self.create_bounding_boxes(det, img, frame_obj, self.filter_classes, self.names)
+                for det, frame_obj in zip(pred, frame_objs)]
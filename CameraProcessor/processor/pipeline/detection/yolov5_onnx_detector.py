@@ -0,0 +1,168 @@
+"""Contains the YOLOv5 detector running an exported ONNX graph with ONNX Runtime on the CPU.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import sys
+import json
+import logging
+
+import onnx
+import onnxruntime
+import torch
+
+from processor.pipeline.detection.yolov5.models.experimental import attempt_load
+from processor.pipeline.detection.yolov5.utils.general import check_img_size
+from processor.pipeline.detection.i_yolo_detector import IYoloDetector
+from processor.pipeline.detection.letterbox_buffer import LetterboxBuffer
+
+
+def export_onnx(weights_path, onnx_path, img_size, opset=12):
+    """Exports YOLOv5 weights to an ONNX graph with a dynamic batch size.
+
+    The class names, stride and input size of the model are stored in the metadata of the graph,
+    so the graph can be used without loading the PyTorch model.
+
+    Args:
+        weights_path (str): Path to the YOLOv5 weights file.
+        onnx_path (str): Path the ONNX graph is written to.
+        img_size (int): Width and height of the (letterboxed) input images, rounded up to a multiple of the stride.
+        opset (int): ONNX operator set version to export to.
+    """
+    model = attempt_load(weights_path, map_location=torch.device('cpu'))
+    model.eval()
+    stride = int(model.stride.max())
+    img_size = check_img_size(img_size, s=stride)
+
+    # Let the detection layer output the decoded boxes, like the eager model.
+    model.model[-1].export = False
+
+    image = torch.zeros(1, 3, img_size, img_size)
+    torch.onnx.export(model, image, onnx_path, opset_version=opset,
+                      input_names=['images'], output_names=['output'],
+                      dynamic_axes={'images': {0: 'batch'}, 'output': {0: 'batch'}})
+
+    # Store the names, stride and input size in the graph.
+    graph = onnx.load(onnx_path)
+    names = model.module.names if hasattr(model, 'module') else model.names
+    for key, value in (('names', json.dumps(list(names))), ('stride', str(stride)), ('img_size', str(img_size))):
+        metadata = graph.metadata_props.add()
+        metadata.key, metadata.value = key, value
+    onnx.save(graph, onnx_path)
+
+
+class Yolov5OnnxDetector(IYoloDetector):
+    """YOLOv5 detector running an ONNX graph of the weights with ONNX Runtime, optimised for the CPU.
+
+    The weights are exported to ONNX once, the graph is cached next to the weights and exported again when the
+    weights are newer. Frames are letterboxed to a fixed square size, the predictions go through the same
+    non-maximum suppression and conversion as the eager detector, so the same BoundingBoxes are returned.
+
+    Attributes:
+        config (SectionProxy): Yolov5Onnx section of the configurations.
+        filter ([str]): List of objects types to detect.
+        names ([str]): List of names of all classes of the model.
+        filter_classes (Tensor): Indices of the names in the filter.
+        nms_classes ([int]): Indices of the names in the filter, only these candidates go through the non-maximum
+            suppression.
+        stride (int): Stride of the model.
+        img_size (int): Width and height of the letterboxed input images.
+        session (onnxruntime.InferenceSession): Session running the graph.
+        letterbox_buffer (LetterboxBuffer): Letterboxes the frames into the input of the graph.
+    """
+
+    def __init__(self, config, filters):
+        """Exports the weights if there is no up to date graph and starts an inference session.
+
+        Args:
+            config (SectionProxy): Yolov5Onnx section of the configurations.
+            filters (SectionProxy): Filter configurations for boundingBoxes.
+        """
+        curr_dir = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, os.path.join(curr_dir, './yolov5'))
+
+        self.config = config
+        with open(filters['targets_path']) as filter_names:
+            self.filter = filter_names.read().splitlines()
+
+        onnx_path = self.onnx_path(config['weights_path'], config.getint('img-size'))
+        if not os.path.exists(onnx_path) or os.path.getmtime(onnx_path) < os.path.getmtime(config['weights_path']):
+            logging.info(f'Exporting {config["weights_path"]} to {onnx_path}')
+            export_onnx(config['weights_path'], onnx_path, config.getint('img-size'), config.getint('opset', 12))
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = config.getint('intra_op_threads', 0)
+        options.inter_op_num_threads = config.getint('inter_op_threads', 0)
+        if options.inter_op_num_threads > 1:
+            options.execution_mode = onnxruntime.ExecutionMode.ORT_PARALLEL
+
+        self.session = onnxruntime.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+        self.__input_name = self.session.get_inputs()[0].name
+
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names = json.loads(metadata['names'])
+        self.stride = int(metadata['stride'])
+        self.img_size = int(metadata['img_size'])
+        self.filter_classes = self.class_indices(self.names, self.filter)
+        self.nms_classes = self.filter_classes.tolist()
+
+        # Reuse the input of the graph, instead of allocating it for every frame.
+        self.letterbox_buffer = LetterboxBuffer(self.img_size, self.stride, 'cpu', auto=False)
+
+    @staticmethod
+    def onnx_path(weights_path, img_size):
+        """Gets the path of the cached ONNX graph of the weights, next to the weights.
+
+        Args:
+            weights_path (str): Path to the YOLOv5 weights file.
+            img_size (int): Width and height of the input images of the graph.
+
+        Returns:
+            str: Path of the ONNX graph.
+        """
+        return f'{os.path.splitext(weights_path)[0]}_{img_size}.onnx'
+
+    def detect(self, frame_obj):
+        """Run detection on a frame.
+
+        Args:
+            frame_obj (FrameObj): information object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: a BoundingBoxes object containing a list of BoundingBox objects
+        """
+        return self.detect_batch([frame_obj])[0]
+
+    def detect_batch(self, frame_objs):
+        """Run detection on multiple frames using a single run of the graph.
+
+        Args:
+            frame_objs ([FrameObj]): information objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: a BoundingBoxes object for every frame, in the same order as the frames.
+        """
+        images = self.letterbox_buffer.convert([frame_obj.frame for frame_obj in frame_objs]).numpy()
+
+        # Use the same non-maximum suppression as the eager detector.
+        pred = self.generate_predictions(images, self.__run, self.config, self.nms_classes)
+
+        return [self.create_bounding_boxes(det, images, frame_obj, self.filter_classes, self.names)
+                for det, frame_obj in zip(pred, frame_objs)]
+
+    def __run(self, images, augment=False):
+        """Runs the graph, called like the eager model.
+
+        Args:
+            images (np.ndarray): (N, 3, size, size) float32 images.
+            augment (bool): Augmented inference, which is not part of the graph.
+
+        Returns:
+            (Tensor,): predictions of all images.
+        """
+        if augment:
+            logging.warning('Augmented inference is not supported by the ONNX graph')
+        return (torch.from_numpy(self.session.run(None, {self.__input_name: images})[0]),)
@@ -0,0 +1,134 @@
+"""Contains the detection stride, which decides on which frames the detector runs.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class DetectionStride:
+    """Runs the detector on every n-th frame, the tracker predicts the boxes of the frames in between.
+
+    The stride is fixed when the maximum stride equals the stride. Otherwise it adapts to the motion in the scene:
+    the fastest tracked object may move at most max_motion times its size in between two detections,
+    so the detections still overlap the predicted boxes enough to be matched.
+    Slow scenes are detected every max_stride frames, fast scenes every stride frames.
+
+    Attributes:
+        stride (int): Number of frames in between two detected frames, the minimum when it adapts to the motion.
+        max_stride (int): Maximum number of frames in between two detected frames.
+        max_motion (float): Maximum distance, as a fraction of its size, an object may move in between two detections.
+        interval (int): Current number of frames in between two detected frames.
+        motion (float): Distance, as a fraction of its size, the fastest tracked object moved in the last frame.
+        frames (int): Number of frames that were decided on.
+        skipped_detections (int): Number of frames that were not detected.
+    """
+
+    def __init__(self, stride=1, max_stride=None, max_motion=0.5):
+        """Inits the detection stride, which starts by detecting every stride frames.
+
+        Args:
+            stride (int): Number of frames in between two detected frames, the minimum when it adapts to the motion.
+            max_stride (int): Maximum number of frames in between two detected frames, None for a fixed stride.
+            max_motion (float): Maximum distance, as a fraction of its size, an object may move in between two
+                detections.
+
+        Raises:
+            ValueError: The stride is smaller than 1, the maximum stride is smaller than the stride
+                or the maximum motion is not positive.
+        """
+        max_stride = stride if max_stride is None else max_stride
+        if stride < 1 or max_stride < stride:
+            raise ValueError('The stride should be at least 1 and at most the maximum stride')
+        if max_motion <= 0:
+            raise ValueError('The maximum motion should be positive')
+
+        self.stride = stride
+        self.max_stride = max_stride
+        self.max_motion = max_motion
+
+        self.interval = stride
+        self.motion = 0.
+        self.frames = 0
+        self.skipped_detections = 0
+
+        # Rectangles of the tracked boxes in the last frame, by identifier.
+        self.__previous = {}
+        self.__frames_since_detection = 0
+
+    @property
+    def adaptive(self):
+        """Gets whether the stride adapts to the motion in the scene.
+
+        Returns:
+            bool: Whether the maximum stride is larger than the stride.
+        """
+        return self.max_stride > self.stride
+
+    def should_detect(self):
+        """Decides whether the next frame is detected, the first frame is always detected.
+
+        Returns:
+            bool: Whether the detector should run on the next frame.
+        """
+        self.frames += 1
+        detect = self.frames == 1 or self.__frames_since_detection + 1 >= self.interval
+        if detect:
+            self.__frames_since_detection = 0
+        else:
+            self.__frames_since_detection += 1
+            self.skipped_detections += 1
+        return detect
+
+    def observe(self, tracked_boxes):
+        """Measures the motion of the tracked boxes since the last frame, adapting the interval to it.
+
+        Args:
+            tracked_boxes (BoundingBoxes): Tracked (or predicted) boxes of the frame, identified by their track.
+        """
+        if not self.adaptive:
+            return
+
+        rectangles = {box.identifier: box.rectangle for box in tracked_boxes}
+
+        self.motion = 0.
+        for identifier, rectangle in rectangles.items():
+            previous = self.__previous.get(identifier)
+            if previous is not None:
+                self.motion = max(self.motion, self.__relative_motion(previous, rectangle))
+        self.__previous = rectangles
+
+        if self.motion == 0:
+            self.interval = self.max_stride
+        else:
+            self.interval = min(max(int(self.max_motion / self.motion), self.stride), self.max_stride)
+
+    def stats(self):
+        """Gets the counters of the detection stride.
+
+        Returns:
+            dict[str, float]: Counters of the frames, skipped detections, interval and motion.
+        """
+        return {
+            'frames': self.frames,
+            'skipped_detections': self.skipped_detections,
+            'interval': self.interval,
+            'motion': self.motion
+        }
+
+    @staticmethod
+    def __relative_motion(previous, rectangle):
+        """Calculates how far the centre of a box moved, relative to its size.
+
+        Args:
+            previous (Rectangle): Rectangle of the box in the previous frame.
+            rectangle (Rectangle): Rectangle of the box in the current frame.
+
+        Returns:
+            float: Largest movement along an axis, as a fraction of the width or height of the box.
+        """
+        width = max(rectangle.x2 - rectangle.x1, 1e-6)
+        height = max(rectangle.y2 - rectangle.y1, 1e-6)
+        delta_x = (rectangle.x1 + rectangle.x2 - previous.x1 - previous.x2) / 2
+        delta_y = (rectangle.y1 + rectangle.y2 - previous.y1 - previous.y2) / 2
+        return max(abs(delta_x) / width, abs(delta_y) / height)
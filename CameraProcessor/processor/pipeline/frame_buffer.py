@@ -5,27 +5,38 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 from collections import OrderedDict
+from processor.pipeline.frame_storage.full_frame_storage import FullFrameStorage
 from processor.scheduling.component.i_component import IComponent
 
 
 class FrameBuffer(IComponent):
     """Class that handles frame buffering logic and holds the buffer.
 
-    The buffer maps frame_ids to a tuple of frame_obj and tracked_boxes,
+    The buffer maps frame_ids to a tuple of the stored frame and tracked_boxes,
     thus it contains frames, and their tracked bounding boxes.
+    The storage decides how a frame is stored, by default the frame object itself.
+    Other storages store compressed or downscaled frames, or only the cutouts of the tracked boxes.
 
     Attributes:
         __buffer_size (int): Size of the buffer.
+        __max_bytes (int): Maximum number of bytes of the stored image data, 0 for no limit.
+        __storage (IFrameStorage): Storage policy of the frames.
         __buffer (OrderedDict): Dictionary containing the frames.
+        __nbytes (int): Number of bytes of the stored image data.
     """
-    def __init__(self, size):
+    def __init__(self, size, storage=None, max_bytes=0):
         """Set buffer size and initialize the dictionary.
 
         Args:
             size (int): Size of the buffer.
+            storage (IFrameStorage): Storage policy of the frames, None stores the frame objects.
+            max_bytes (int): Maximum number of bytes of the stored image data, 0 for no limit.
         """
         self.__buffer_size = size
+        self.__max_bytes = max_bytes
+        self.__storage = storage if storage is not None else FullFrameStorage()
         self.__buffer = OrderedDict()
+        self.__nbytes = 0
 
     def execute_component(self):
         """Function given to scheduler so the scheduler can add the frame with frame information to the frame buffer.
@@ -42,10 +53,19 @@ class FrameBuffer(IComponent):
             frame (FrameObj): Frame object containing frame timestamp and frame np array.
             tracked_boxes (BoundingBoxes): Boxes generated by the tracking.
         """
-        self.__buffer[frame.timestamp] = (frame, tracked_boxes)
-        # If the buffer exceeds the maximum size, pop its first element.
-        while len(self.__buffer) > self.__buffer_size:
-            self.__buffer.popitem(last=False)
+        if frame.timestamp in self.__buffer:
+            self.__nbytes -= self.__storage.nbytes(self.__buffer.pop(frame.timestamp)[0])
+
+        entry = self.__storage.store(frame, tracked_boxes)
+        self.__buffer[frame.timestamp] = (entry, tracked_boxes)
+        self.__nbytes += self.__storage.nbytes(entry)
+
+        # If the buffer exceeds the maximum size or number of bytes, pop its first element.
+        # The newest frame is always kept.
+        while len(self.__buffer) > self.__buffer_size or \
+                (0 < self.__max_bytes < self.__nbytes and len(self.__buffer) > 1):
+            _, (old_entry, _) = self.__buffer.popitem(last=False)
+            self.__nbytes -= self.__storage.nbytes(old_entry)
 
     def _get_element(self, frame_id):
         """Internal getter to get frame and bounding boxes given frame_id.
@@ -71,10 +91,13 @@ class FrameBuffer(IComponent):
             frame_id (float): Frame timestamp.
 
         Returns:
-            FrameObj: The frame object at the given timestamp.
+            FrameObj: The (reconstructed) frame object at the given timestamp.
+
+        Raises:
+            ValueError: The storage does not store the frames.
         """
-        frame, _ = self._get_element(frame_id)
-        return frame
+        entry, _ = self._get_element(frame_id)
+        return self.__storage.frame(entry)
 
     def get_boxes(self, frame_id):
         """Returns the bounding boxes of a given frame.
@@ -107,6 +130,28 @@ class FrameBuffer(IComponent):
 
         raise ValueError('Box id was not found in the boxes list.')
 
+    def get_cutout(self, frame_id, box_id):
+        """Returns the cutout of the bounding box of a given frame and a box id.
+
+        Args:
+            frame_id (float): Frame timestamp.
+            box_id (Int): Box number.
+
+        Returns:
+            (np.ndarray): Cutout of the box containing the box_id at the given frame timestamp.
+        """
+        entry, _ = self._get_element(frame_id)
+        return self.__storage.cutout(entry, self.get_box(frame_id, box_id))
+
+    @property
+    def nbytes(self):
+        """Property for the number of bytes of the stored image data.
+
+        Returns:
+            (int): Number of bytes of the stored frames or cutouts.
+        """
+        return self.__nbytes
+
     @property
     def buffer(self):
         """Property for the buffer, used for testing.
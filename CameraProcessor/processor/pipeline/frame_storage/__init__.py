@@ -0,0 +1,6 @@
+"""Contains the storage policies of the frame buffer.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,68 @@
+"""Contains the cutout storage, which only stores the cutouts of the tracked boxes.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.pipeline.frame_storage.i_frame_storage import IFrameStorage
+from processor.utils.features import slice_bounding_box
+
+
+class CutoutStorage(IFrameStorage):
+    """Stores only copies of the cutouts of the tracked boxes, the rest of the frame is dropped.
+
+    The memory used scales with the number and size of the tracked objects instead of the resolution,
+    but the frames themselves can no longer be retrieved.
+    """
+
+    def store(self, frame_obj, tracked_boxes):
+        """Copies the cutouts of the tracked boxes, so the frame itself can be freed.
+
+        Args:
+            frame_obj (FrameObj): Frame object containing frame timestamp and frame np array.
+            tracked_boxes (BoundingBoxes): Boxes generated by the tracking.
+
+        Returns:
+            dict: Cutout of every box identifier.
+        """
+        return {box.identifier: slice_bounding_box(box, frame_obj.frame).copy()
+                for box in tracked_boxes}
+
+    def frame(self, entry):
+        """The frames are not stored.
+
+        Args:
+            entry (dict): Cutout of every box identifier.
+
+        Raises:
+            ValueError: Always, only the cutouts are stored.
+        """
+        raise ValueError('The frame buffer only stores the cutouts of the tracked boxes, not the frames.')
+
+    def cutout(self, entry, box):
+        """Gets the stored cutout of a box.
+
+        Args:
+            entry (dict): Cutout of every box identifier.
+            box (BoundingBox): Tracked box of the frame.
+
+        Returns:
+            np.ndarray: BGR cutout of the box.
+
+        Raises:
+            ValueError: There is no cutout of the box.
+        """
+        if box.identifier not in entry:
+            raise ValueError('Box id was not found in the stored cutouts.')
+        return entry[box.identifier]
+
+    def nbytes(self, entry):
+        """Gets the size of the cutouts.
+
+        Args:
+            entry (dict): Cutout of every box identifier.
+
+        Returns:
+            int: Number of bytes of the cutouts.
+        """
+        return sum(cutout.nbytes for cutout in entry.values())
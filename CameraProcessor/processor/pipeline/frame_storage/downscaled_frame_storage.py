@@ -0,0 +1,73 @@
+"""Contains the downscaled frame storage, which stores downscaled frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import cv2
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.frame_storage.i_frame_storage import IFrameStorage
+
+
+class DownscaledFrameStorage(IFrameStorage):
+    """Stores the frames downscaled, using scale^2 of the memory of the full frames.
+
+    The boxes are normalized, so the cutouts are sliced out of the downscaled frames in the same way.
+    The re-identification resizes the cutouts to the input size of its model anyway.
+
+    Attributes:
+        scale (float): Factor the width and height of the frames are scaled by, 0 < scale <= 1.
+    """
+
+    def __init__(self, scale=0.5):
+        """Inits the downscaled storage.
+
+        Args:
+            scale (float): Factor the width and height of the frames are scaled by, 0 < scale <= 1.
+
+        Raises:
+            ValueError: The scale is not in (0, 1].
+        """
+        if not 0 < scale <= 1:
+            raise ValueError(f'Frame buffer scale {scale} should be larger than 0 and at most 1')
+        self.scale = scale
+
+    def store(self, frame_obj, tracked_boxes):
+        """Downscales the frame.
+
+        Args:
+            frame_obj (FrameObj): Frame object containing frame timestamp and frame np array.
+            tracked_boxes (BoundingBoxes): Boxes generated by the tracking.
+
+        Returns:
+            FrameObj: The downscaled frame.
+        """
+        if self.scale == 1:
+            return frame_obj
+
+        width, height = frame_obj.shape
+        size = (max(int(round(width * self.scale)), 1), max(int(round(height * self.scale)), 1))
+        return FrameObj(cv2.resize(frame_obj.frame, size, interpolation=cv2.INTER_AREA), frame_obj.timestamp)
+
+    def frame(self, entry):
+        """Gets the downscaled frame.
+
+        Args:
+            entry (FrameObj): Downscaled frame.
+
+        Returns:
+            FrameObj: The downscaled frame.
+        """
+        return entry
+
+    def nbytes(self, entry):
+        """Gets the size of the downscaled frame.
+
+        Args:
+            entry (FrameObj): Downscaled frame.
+
+        Returns:
+            int: Number of bytes of the downscaled frame.
+        """
+        return entry.frame.nbytes
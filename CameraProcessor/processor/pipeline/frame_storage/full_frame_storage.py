@@ -0,0 +1,45 @@
+"""Contains the full frame storage, which stores the frames as they are.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.pipeline.frame_storage.i_frame_storage import IFrameStorage
+
+
+class FullFrameStorage(IFrameStorage):
+    """Stores the full-resolution frames, using width x height x 3 bytes per frame."""
+
+    def store(self, frame_obj, tracked_boxes):
+        """Stores the frame object itself.
+
+        Args:
+            frame_obj (FrameObj): Frame object containing frame timestamp and frame np array.
+            tracked_boxes (BoundingBoxes): Boxes generated by the tracking.
+
+        Returns:
+            FrameObj: The frame object.
+        """
+        return frame_obj
+
+    def frame(self, entry):
+        """Gets the stored frame object.
+
+        Args:
+            entry (FrameObj): Stored frame object.
+
+        Returns:
+            FrameObj: The frame object.
+        """
+        return entry
+
+    def nbytes(self, entry):
+        """Gets the size of the frame.
+
+        Args:
+            entry (FrameObj): Stored frame object.
+
+        Returns:
+            int: Number of bytes of the frame.
+        """
+        return entry.frame.nbytes
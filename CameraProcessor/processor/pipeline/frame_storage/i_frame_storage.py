@@ -0,0 +1,68 @@
+"""Frame storage abstract class.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.utils.features import slice_bounding_box
+
+
+class IFrameStorage:
+    """Decides how the frame buffer stores a frame, so the cutout of a tracked box can be made later on."""
+
+    def store(self, frame_obj, tracked_boxes):
+        """Converts a frame to the entry stored in the frame buffer.
+
+        Args:
+            frame_obj (FrameObj): Frame object containing frame timestamp and frame np array.
+            tracked_boxes (BoundingBoxes): Boxes generated by the tracking.
+
+        Returns:
+            object: Entry stored in the frame buffer.
+
+        Raises:
+            NotImplementedError: The function is not overridden in the subclass.
+        """
+        raise NotImplementedError('Store function not implemented')
+
+    def frame(self, entry):
+        """Gets the frame of a stored entry.
+
+        Args:
+            entry (object): Entry stored in the frame buffer.
+
+        Returns:
+            FrameObj: The (reconstructed) frame.
+
+        Raises:
+            NotImplementedError: The function is not overridden in the subclass.
+        """
+        raise NotImplementedError('Frame function not implemented')
+
+    def cutout(self, entry, box):
+        """Gets the cutout of a tracked box from a stored entry.
+
+        By default the box is sliced out of the frame of the entry.
+
+        Args:
+            entry (object): Entry stored in the frame buffer.
+            box (BoundingBox): Tracked box of the frame.
+
+        Returns:
+            np.ndarray: BGR cutout of the box.
+        """
+        return slice_bounding_box(box, self.frame(entry).frame)
+
+    def nbytes(self, entry):
+        """Gets the memory used by the image data of a stored entry.
+
+        Args:
+            entry (object): Entry stored in the frame buffer.
+
+        Returns:
+            int: Number of bytes of the image data.
+
+        Raises:
+            NotImplementedError: The function is not overridden in the subclass.
+        """
+        raise NotImplementedError('Nbytes function not implemented')
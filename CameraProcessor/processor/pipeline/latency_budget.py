@@ -0,0 +1,112 @@
+"""Contains the latency budget, which decides on which frames detection is skipped to keep up with a live stream.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class LatencyBudget:
+    """Keeps the time from capturing a frame to its output within a budget by detecting fewer frames.
+
+    The lag of a frame starts when the capture read it, so the time a frame waited in the capture counts as well.
+    Detection is by far the slowest stage, so when the smoothed lag of the processed frames exceeds the budget,
+    the detector only runs on every n-th frame, and the tracker predicts the boxes of the frames in between.
+    The detection interval grows by one after every detected frame while the lag is over budget,
+    and shrinks again once the lag is comfortably below it (half the budget), so detection recovers
+    when the load drops.
+
+    Attributes:
+        budget (float): Target lag (in s) from the capture reading a frame until its output.
+        max_interval (int): Maximum number of frames in between two detected frames.
+        smoothing (float): Weight of the newest lag in the smoothed lag, between 0 and 1.
+        detection_interval (int): Current number of frames in between two detected frames.
+        frames (int): Number of processed frames.
+        skipped_detections (int): Number of processed frames that were not detected.
+        lag (float): Smoothed lag (in s) of the processed frames.
+        max_lag (float): Highest lag (in s) of a processed frame.
+    """
+
+    def __init__(self, budget, max_interval=5, smoothing=0.1):
+        """Inits the latency budget, detecting every frame until the lag exceeds the budget.
+
+        Args:
+            budget (float): Target lag (in s) from the capture reading a frame until its output.
+            max_interval (int): Maximum number of frames in between two detected frames.
+            smoothing (float): Weight of the newest lag in the smoothed lag, between 0 and 1.
+
+        Raises:
+            ValueError: The budget is not positive, the maximum interval is smaller than 1
+                or the smoothing is not between 0 and 1.
+        """
+        if budget <= 0:
+            raise ValueError('The latency budget should be positive')
+        if max_interval < 1:
+            raise ValueError('The maximum detection interval should be at least 1')
+        if not 0 < smoothing <= 1:
+            raise ValueError('The smoothing should be between 0 and 1')
+
+        self.budget = budget
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+
+        self.detection_interval = 1
+        self.frames = 0
+        self.skipped_detections = 0
+        self.lag = 0.
+        self.max_lag = 0.
+
+        self.__frames_since_detection = 0
+
+    def should_detect(self):
+        """Decides whether the next frame is detected, counting the frames of which detection is skipped.
+
+        Returns:
+            bool: Whether the detector should run on the next frame.
+        """
+        self.__frames_since_detection += 1
+        if self.__frames_since_detection >= self.detection_interval:
+            self.__frames_since_detection = 0
+            return True
+
+        self.skipped_detections += 1
+        return False
+
+    def record(self, lag, detected):
+        """Records the lag of a processed frame, adapting the detection interval after a detected frame.
+
+        Args:
+            lag (float): Time (in s) from the capture reading the frame until its output.
+            detected (bool): Whether the detector ran on the frame.
+        """
+        self.lag = lag if self.frames == 0 else self.smoothing * lag + (1 - self.smoothing) * self.lag
+        self.max_lag = max(self.max_lag, lag)
+        self.frames += 1
+
+        if not detected:
+            return
+
+        if self.lag > self.budget:
+            self.detection_interval = min(self.detection_interval + 1, self.max_interval)
+        elif self.lag < self.budget / 2:
+            self.detection_interval = max(self.detection_interval - 1, 1)
+
+    def stats(self, capture=None):
+        """Gets the counters of the latency budget.
+
+        Args:
+            capture (ICapture): Capture of the processed frames, adds the frames it dropped if it counts them.
+
+        Returns:
+            dict[str, float]: Counters of the processed frames, skipped detections and (smoothed) lag.
+        """
+        stats = {
+            'frames': self.frames,
+            'skipped_detections': self.skipped_detections,
+            'detection_interval': self.detection_interval,
+            'lag': self.lag,
+            'max_lag': self.max_lag
+        }
+        if capture is not None and hasattr(capture, 'dropped_frames'):
+            stats['dropped_frames'] = capture.dropped_frames
+        return stats
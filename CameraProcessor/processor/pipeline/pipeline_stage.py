@@ -0,0 +1,121 @@
+"""Contains a pipeline stage that runs a single step of the pipeline on its own thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import logging
+import threading
+from queue import Queue, Empty, Full
+
+# Item that is passed through the queues to signal the end of the stream.
+END_OF_STREAM = object()
+
+
+class PipelineStage:
+    """Stage of a pipelined stream that takes items from an input queue and puts results on an output queue.
+
+    Each stage owns a single worker thread, so items leave the stage in the same order in which they entered it.
+    The queues are bounded, a slow stage therefore blocks the stages in front of it instead of buffering frames.
+
+    Attributes:
+        name (str): Name of the stage, used for the thread name and logging.
+        input_queue (Queue): Queue the stage reads its items from, None for a source stage.
+        output_queue (Queue): Bounded queue the stage writes its results to.
+        error (Exception): Exception raised by the work function, None if the stage did not fail.
+    """
+
+    def __init__(self, name, work, input_queue=None, queue_size=2):
+        """Inits the stage with a work function and creates the bounded output queue.
+
+        Args:
+            name (str): Name of the stage, used for the thread name and logging.
+            work (function): Function applied to every item of the input queue. When the stage has no input queue,
+                the function is called without arguments, returns None when no item is available yet,
+                and returns END_OF_STREAM once it is exhausted.
+            input_queue (Queue): Queue the stage reads its items from, None for a source stage.
+            queue_size (int): Maximum number of items waiting in the output queue.
+        """
+        self.name = name
+        self.input_queue = input_queue
+        self.output_queue = Queue(maxsize=queue_size)
+        self.error = None
+
+        self.__work = work
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+
+    def start(self):
+        """Starts the worker thread of the stage."""
+        self.__thread.start()
+
+    def stop(self):
+        """Signals the worker thread to stop and waits for it to finish."""
+        self.__stopped.set()
+        self.__thread.join()
+
+    @property
+    def running(self):
+        """Whether the worker thread of the stage is still alive.
+
+        Returns:
+            bool: True if the worker thread is running.
+        """
+        return self.__thread.is_alive()
+
+    def __run(self):
+        """Worker loop that processes items until the end of the stream is reached or the stage is stopped."""
+        try:
+            while not self.__stopped.is_set():
+                # Source stages produce items themselves, other stages transform the items of their input queue.
+                if self.input_queue is None:
+                    item = self.__work()
+
+                    # Nothing was produced yet, back off shortly instead of spinning.
+                    if item is None:
+                        self.__stopped.wait(0.005)
+                        continue
+                else:
+                    item = self.__get()
+                    if item is None:
+                        continue
+                    if item is not END_OF_STREAM:
+                        item = self.__work(item)
+
+                # The stage is done once the end of the stream is passed on.
+                if self.__put(item) and item is END_OF_STREAM:
+                    break
+
+        # pylint: disable=broad-except
+        except Exception as error:
+            logging.error(f'Pipeline stage {self.name} failed: {error}')
+            self.error = error
+            self.__put(END_OF_STREAM)
+
+    def __get(self):
+        """Takes the next item from the input queue, waking up regularly to check whether the stage was stopped.
+
+        Returns:
+            object: The next item, or None if no item arrived in time.
+        """
+        try:
+            return self.input_queue.get(timeout=0.1)
+        except Empty:
+            return None
+
+    def __put(self, item):
+        """Puts an item on the output queue, waiting for space as long as the stage is not stopped.
+
+        Args:
+            item (object): Item to put on the output queue.
+
+        Returns:
+            bool: Whether the item was put on the queue.
+        """
+        while not self.__stopped.is_set():
+            try:
+                self.output_queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
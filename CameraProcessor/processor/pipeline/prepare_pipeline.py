@@ -11,12 +11,18 @@ from processor.input.cam_capture import CamCapture
 from processor.input.hls_capture import HlsCapture
 from processor.input.image_capture import ImageCapture
 from processor.input.video_capture import VideoCapture
+from processor.input.prefetch_capture import PrefetchCapture
+
+from processor.pipeline.detection.motion_gated_detector import MotionGatedDetector
+from processor.pipeline.detection.region_of_interest_detector import RegionOfInterestDetector
+from processor.pipeline.detection.tiled_detector import TiledDetector
 
 from processor.utils.create_runners import \
     create_detector, create_tracker, create_reidentifier, DETECTOR_SWITCH, TRACKER_SWITCH, REID_SWITCH
 
 import processor.scheduling.plan.pipeline_plan as pipeline_plan
 from processor.scheduling.scheduler import Scheduler
+from processor.scheduling.parallel_scheduler import ParallelScheduler
 
 
 def prepare_objects(configs):
@@ -58,9 +64,23 @@ def prepare_detector(configs):
         raise NameError(f'Incorrect detector. Detector {configs["Main"].get("detector")} not found.')
 
     # Detector exists, so it is created.
-    return create_detector(configs['Main'].get('detector'),
-                           configs
-                           )
+    detector = create_detector(configs['Main'].get('detector'),
+                               configs
+                               )
+
+    # Detect overlapping tiles of high-resolution frames.
+    if configs.has_section('Tiling') and configs['Tiling'].getboolean('enabled', False):
+        detector = TiledDetector(detector, configs['Tiling'])
+
+    # Only detect the regions of interest of the camera.
+    if configs.has_section('RegionOfInterest') and configs['RegionOfInterest'].getboolean('enabled', False):
+        detector = RegionOfInterestDetector(detector, configs['RegionOfInterest'])
+
+    # Put the motion gate in front of the detector, so unchanged frames are not detected.
+    if configs.has_section('MotionGate') and configs['MotionGate'].getboolean('enabled', False):
+        detector = MotionGatedDetector(detector, configs['MotionGate'])
+
+    return detector
 
 
 def prepare_tracker(configs):
@@ -109,6 +129,8 @@ def prepare_reidentifier(configs):
 def prepare_capture(input_config):
     """Prepares the capture of the stream.
 
+    Images and video files are decoded ahead in the background when prefetching is enabled.
+
     Args:
         input_config (SectionProxy): Configurations of the capture.
 
@@ -124,17 +146,36 @@ def prepare_capture(input_config):
     if capture_type == 'webcam':
         return CamCapture(int(input_config['webcam_device_nr']))
     if capture_type == 'images':
-        return ImageCapture(input_config['images_dir_path'])
+        return prefetch_capture(ImageCapture(input_config['images_dir_path']), input_config)
     if capture_type == 'video':
-        return VideoCapture(input_config['video_file_path'])
+        return prefetch_capture(VideoCapture(input_config['video_file_path']), input_config)
     if capture_type == 'hls':
-        return HlsCapture(input_config['hls_url'])
+        return HlsCapture(input_config['hls_url'],
+                          frame_mode=input_config.get('hls_frame_mode', 'latest'),
+                          max_buffered_frames=input_config.getint('hls_max_buffered_frames', 64))
 
     # No cv2.VideoCapture returned.
     raise NameError(f'Input type "{capture_type}" is unknown')
 
 
-def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer):
+def prefetch_capture(capture, input_config):
+    """Wraps the capture in a PrefetchCapture when prefetching is enabled.
+
+    Args:
+        capture (ICapture): Capture of which every frame is processed (images or video file).
+        input_config (SectionProxy): Configurations of the capture.
+
+    Returns:
+        ICapture: The prefetching capture, or the given capture when prefetching is disabled.
+    """
+    buffer_size = input_config.getint('prefetch_size', 0)
+    if buffer_size <= 0:
+        return capture
+
+    return PrefetchCapture(capture, buffer_size, input_config.getint('prefetch_workers', 1))
+
+
+def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer, scheduler_config=None):
     """Prepare the Scheduler with a valid plan configuration.
 
     Args:
@@ -143,9 +184,13 @@ def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, fram
         re_identifier (IReIdentifier): re-identifier performing the re-identification stage.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         frame_buffer (FrameBuffer): buffer of frames and stage information associated with the frame.
+        scheduler_config (SectionProxy): Configurations of the scheduler, None uses the sequential scheduler.
 
     Returns:
-        Scheduler: Scheduler that has been configured with a plan.
+        Scheduler or ParallelScheduler: Scheduler that has been configured with a plan.
+
+    Raises:
+        NameError: The scheduler type is unknown.
     """
     # Get args dict from the used plan.
     plan_args = pipeline_plan.plan_inputs
@@ -160,5 +205,17 @@ def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, fram
     # Apply configuration to plan.
     start_node = pipeline_plan.create_plan(plan_args)
 
+    scheduler_type = 'sequential' if scheduler_config is None else scheduler_config.get('type', 'sequential').lower()
+
     # Return Scheduler.
-    return Scheduler(start_node)
+    if scheduler_type == 'sequential':
+        return Scheduler(start_node)
+    if scheduler_type == 'parallel':
+        # An empty number of workers lets the executor decide.
+        max_workers = scheduler_config.get('max_workers')
+        return ParallelScheduler(start_node,
+                                 executor=scheduler_config.get('executor', 'thread').lower(),
+                                 max_workers=int(max_workers) if max_workers else None,
+                                 max_iterations=scheduler_config.getint('max_iterations', 1))
+
+    raise NameError(f'Scheduler type "{scheduler_type}" is unknown')
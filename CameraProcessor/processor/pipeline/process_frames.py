@@ -7,8 +7,20 @@ Utrecht University within the Software Project course.
 
 import logging
 import asyncio
+import functools
+import threading
+import time
+from queue import Empty
 
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.pipeline.detection_stride import DetectionStride
 from processor.pipeline.frame_buffer import FrameBuffer
+from processor.pipeline.frame_storage.full_frame_storage import FullFrameStorage
+from processor.pipeline.frame_storage.jpeg_frame_storage import JpegFrameStorage
+from processor.pipeline.frame_storage.downscaled_frame_storage import DownscaledFrameStorage
+from processor.pipeline.frame_storage.cutout_storage import CutoutStorage
+from processor.pipeline.latency_budget import LatencyBudget
+from processor.pipeline.pipeline_stage import PipelineStage, END_OF_STREAM
 
 from processor.pipeline.reidentification.reid_data import ReidData
 
@@ -19,13 +31,21 @@ from processor.websocket.update_message import UpdateMessage
 from processor.pipeline.prepare_pipeline import prepare_scheduler
 from processor.scheduling.plan.pipeline_plan import plan_globals
 
+# Number of frames in between two logs of the latency budget counters.
+LATENCY_LOG_INTERVAL = 100
 
-async def process_stream(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None):
+
+async def process_stream(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                         latency_budget=None, detection_stride=None, frame_buffer=None):
     """Processes a stream of frames, outputs to frame or sends to client.
 
     Outputs to frame using OpenCV if not client is used.
     Sends detections to client if client is used (HlsCapture).
 
+    With a detection stride, only every n-th frame is detected. With a latency budget, detection is skipped on some
+    (more) frames when the lag from the capture reading a frame until its output exceeds the budget.
+    The tracker predicts the tracked boxes of the frames that are not detected.
+
     Args:
         capture (ICapture): capture object to process a stream of frames.
         detector (IDetector): detector performing the detections on a given frame.
@@ -33,9 +53,17 @@ async def process_stream(capture, detector, tracker, re_identifier, on_processed
         re_identifier (IReIdentifier): re-identifier extracting features and comparing them.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        latency_budget (LatencyBudget): Decides which frames are detected and counts the lag,
+            None detects every frame.
+        detection_stride (DetectionStride): Decides which frames are detected based on the motion in the scene,
+            None detects every frame.
+        frame_buffer (FrameBuffer): Buffer of the processed frames used for the cutouts of start commands,
+            None buffers the last 150 frames.
     """
-    # Frame buffer that stores 150 frames (flushes older frames if new frames are added over the limit.
-    frame_buffer = FrameBuffer(150)
+    # pylint: disable=too-many-arguments
+    # Without a configured frame buffer, store 150 frames (flushes older frames if new frames are added over the limit).
+    if frame_buffer is None:
+        frame_buffer = FrameBuffer(150)
 
     frame_nr = 0
 
@@ -43,16 +71,31 @@ async def process_stream(capture, detector, tracker, re_identifier, on_processed
     re_id_data = ReidData()
 
     while capture.opened():
-        ret, frame_obj = capture.get_next_frame()
+        # Waits for the next frame of a live stream without blocking the event loop.
+        ret, frame_obj = await capture.get_next_frame_async()
 
         if not ret:
             continue
 
-        # Get detections from running detection stage.
-        detected_boxes = detector.detect(frame_obj)
+        # The lag starts when the capture read the frame, including the time it waited in the capture.
+        received = frame_obj.received if frame_obj.received is not None else time.monotonic()
+        detect = detection_stride is None or detection_stride.should_detect()
+        if detect and latency_budget is not None:
+            detect = latency_budget.should_detect()
+
+        if detect:
+            # Get detections from running detection stage.
+            detected_boxes = detector.detect(frame_obj)
+
+            # Get objects tracked in the current frame from tracking stage.
+            tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+        else:
+            # Skip detection, the tracker predicts where the objects are.
+            detected_boxes = BoundingBoxes([])
+            tracked_boxes = tracker.predict(frame_obj, re_id_data)
 
-        # Get objects tracked in the current frame from tracking stage.
-        tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+        if detection_stride is not None:
+            detection_stride.observe(tracked_boxes)
 
         # Get objects where re-id is performed on the tracked objects.
         re_id_tracked_boxes = re_identifier.re_identify(frame_obj, tracked_boxes, re_id_data)
@@ -63,18 +106,187 @@ async def process_stream(capture, detector, tracker, re_identifier, on_processed
         # Handle side effects of frame processing.
         on_processed_frame(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
 
+        if latency_budget is not None:
+            latency_budget.record(time.monotonic() - received, detect)
+
         # Process the message queue if there is a websocket connection.
         if ws_client is not None:
             process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
 
         frame_nr += 1
 
+        if latency_budget is not None and frame_nr % LATENCY_LOG_INTERVAL == 0:
+            logging.info(f'latency budget: {latency_budget.stats(capture)}')
+
         await asyncio.sleep(0)
 
     logging.info(f'capture object stopped after {frame_nr} frames')
+    if latency_budget is not None:
+        logging.info(f'latency budget: {latency_budget.stats(capture)}')
+    if detection_stride is not None:
+        logging.info(f'detection stride: {detection_stride.stats()}')
+
+
+async def process_stream_pipelined(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                                   queue_size=2, detection_stride=None, frame_buffer=None):
+    """Processes a stream of frames with every stage on its own thread, outputs to frame or sends to client.
+
+    Capture, detection, tracking and re-identification run as separate stages connected by bounded queues,
+    so frame N + 1 is detected while frame N is tracked and re-identified.
+    Every stage handles its frames in order, so frames reach the frame buffer and on_processed_frame in capture order.
+    Buffering, the side effects and the message queue are handled on the calling (event loop) thread.
+    With a detection stride, frames that are not detected pass the detection stage and the tracker predicts their
+    boxes. The stride adapts to the motion measured by the tracking stage, which is a few frames behind.
+
+    Args:
+        capture (ICapture): capture object to process a stream of frames.
+        detector (IDetector): detector performing the detections on a given frame.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them.
+        on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
+        ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        queue_size (int): Maximum number of frames waiting in between two stages.
+        detection_stride (DetectionStride): Decides which frames are detected based on the motion in the scene,
+            None detects every frame.
+        frame_buffer (FrameBuffer): Buffer of the processed frames used for the cutouts of start commands,
+            None buffers the last 150 frames.
+
+    Raises:
+        Exception: Re-raises the exception of a stage that failed.
+    """
+    # pylint: disable=too-many-arguments
+    # Without a configured frame buffer, store 150 frames (flushes older frames if new frames are added over the limit).
+    if frame_buffer is None:
+        frame_buffer = FrameBuffer(150)
+
+    frame_nr = 0
+
+    # Contains re-identification data.
+    re_id_data = ReidData()
+
+    # The tracking and re-identification stages read the re-id data, which the message queue modifies.
+    # The re-identification stage and the message queue both use the re-identifier.
+    re_id_lock = threading.Lock()
+
+    def capture_frame():
+        """Gets the next frame of the capture.
+
+        Returns:
+            FrameObj: The next frame, None if no new frame is available yet or END_OF_STREAM once closed.
+        """
+        if not capture.opened():
+            return END_OF_STREAM
+
+        # Block shortly until a live stream has a new frame, instead of polling it.
+        if not capture.wait_for_frame(0.1):
+            return None
+        ret, frame_obj = capture.get_next_frame()
+        return frame_obj if ret else None
+
+    def detect(frame_obj):
+        """Runs the detection stage on the frame.
+
+        Args:
+            frame_obj (FrameObj): Frame produced by the capture stage.
+
+        Returns:
+            (FrameObj, BoundingBoxes): The frame and its detected boxes, None if the frame is not detected.
+        """
+        if detection_stride is not None and not detection_stride.should_detect():
+            return frame_obj, None
+        return frame_obj, detector.detect(frame_obj)
+
+    def track(stage_output):
+        """Runs the tracking stage on the output of the detection stage.
+
+        Args:
+            stage_output ((FrameObj, BoundingBoxes)): The frame and its detected boxes, None if it is not detected.
+
+        Returns:
+            (FrameObj, BoundingBoxes, BoundingBoxes): The frame, its detected boxes and its tracked boxes.
+        """
+        frame_obj, detected_boxes = stage_output
+
+        # The tracker reads the query boxes of the re-id data, which the message queue changes.
+        with re_id_lock:
+            if detected_boxes is None:
+                detected_boxes = BoundingBoxes([])
+                tracked_boxes = tracker.predict(frame_obj, re_id_data)
+            else:
+                tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+
+        if detection_stride is not None:
+            detection_stride.observe(tracked_boxes)
+        return frame_obj, detected_boxes, tracked_boxes
+
+    def re_identify(stage_output):
+        """Runs the re-identification stage on the output of the tracking stage.
+
+        Args:
+            stage_output ((FrameObj, BoundingBoxes, BoundingBoxes)): The frame, its detected and tracked boxes.
+
+        Returns:
+            (FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes): The stage output extended with re-id boxes.
+        """
+        frame_obj, detected_boxes, tracked_boxes = stage_output
+        with re_id_lock:
+            re_id_tracked_boxes = re_identifier.re_identify(frame_obj, tracked_boxes, re_id_data)
+        return frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes
+
+    # Chain the stages, each stage reads from the output queue of the previous one.
+    stages = []
+    input_queue = None
+    for name, work in [('capture', capture_frame), ('detection', detect), ('tracking', track),
+                       ('re-identification', re_identify)]:
+        stage = PipelineStage(name, work, input_queue, queue_size)
+        input_queue = stage.output_queue
+        stages.append(stage)
+
+    for stage in stages:
+        stage.start()
+
+    try:
+        while True:
+            # Process the message queue if there is a websocket connection.
+            if ws_client is not None and len(ws_client.message_queue) > 0:
+                with re_id_lock:
+                    process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
+
+            # Wait for the next processed frame without blocking the event loop.
+            try:
+                stage_output = input_queue.get_nowait()
+            except Empty:
+                await asyncio.sleep(0.001)
+                continue
+
+            if stage_output is END_OF_STREAM:
+                break
+
+            frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes = stage_output
+
+            # Buffer the tracked object.
+            frame_buffer.add_frame(frame_obj, re_id_tracked_boxes)
+
+            # Handle side effects of frame processing.
+            on_processed_frame(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
 
+            frame_nr += 1
 
-async def process_stream_scheduler(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None):
+            await asyncio.sleep(0)
+    finally:
+        for stage in stages:
+            stage.stop()
+
+    # Surface the first failure, the stages behind it only stopped because of it.
+    for stage in stages:
+        if stage.error is not None:
+            raise stage.error
+
+    logging.info(f'capture object stopped after {frame_nr} frames')
+
+
+async def process_stream_scheduler(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                                   scheduler_config=None, frame_buffer=None):
     """Processes a stream of frames using the scheduler, outputs to frame or sends to client.
 
     Outputs to frame using OpenCV if not client is used.
@@ -91,43 +303,141 @@ async def process_stream_scheduler(capture, detector, tracker, re_identifier, on
         re_identifier (IReIdentifier): re-identifier extracting features and comparing them.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        scheduler_config (SectionProxy): Configurations of the scheduler, None uses the sequential scheduler.
+        frame_buffer (FrameBuffer): Buffer of the processed frames used for the cutouts of start commands,
+            None buffers the last 150 frames.
     """
-    # Frame buffer that stores 150 frames (flushes older frames if new frames are added over the limit.
-    frame_buffer = FrameBuffer(150)
+    # Without a configured frame buffer, store 150 frames (flushes older frames if new frames are added over the limit).
+    if frame_buffer is None:
+        frame_buffer = FrameBuffer(150)
 
     # Create Scheduler by passing all information to construct the schedule nodes and its components.
-    scheduler = prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer)
+    scheduler = prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer,
+                                  scheduler_config)
 
     frame_nr = 0
 
     # Contains re-identification data.
     re_id_data = ReidData()
 
-    while capture.opened():
-        ret, frame_obj = capture.get_next_frame()
+    try:
+        while capture.opened():
+            # Waits for the next frame of a live stream without blocking the event loop.
+            ret, frame_obj = await capture.get_next_frame_async()
 
-        if not ret:
-            continue
+            if not ret:
+                continue
 
-        # Enforce keys of used plan globals.
-        globals_readonly = plan_globals
-        globals_readonly['frame_obj'] = frame_obj
-        globals_readonly['re_id_data'] = re_id_data
+            # Enforce keys of used plan globals.
+            globals_readonly = plan_globals
+            globals_readonly['frame_obj'] = frame_obj
+            globals_readonly['re_id_data'] = re_id_data
 
-        # Execute scheduler plan on current frame.
-        scheduler.schedule_graph([], globals_readonly)
+            # Execute scheduler plan on current frame.
+            scheduler.schedule_graph([], globals_readonly)
 
-        # Process the message queue if there is a websocket connection.
-        if ws_client is not None:
-            process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
+            # Process the message queue if there is a websocket connection.
+            if ws_client is not None and len(ws_client.message_queue) > 0:
+                # Iterations that are still running use the re-identification data, so they have to finish first.
+                scheduler.wait()
+                process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
 
-        frame_nr += 1
+            frame_nr += 1
 
-        await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # Finish the iterations that are still running.
+        scheduler.wait()
+    finally:
+        # Stop the workers of the scheduler, also when the stream or an iteration failed.
+        scheduler.shutdown()
 
     logging.info(f'capture object stopped after {frame_nr} frames')
 
 
+def get_stream_processor(main_config):
+    """Gets the stream processing function selected in the main configuration.
+
+    Args:
+        main_config (configparser.SectionProxy): Main section of the configurations.
+
+    Returns:
+        function: process_stream, process_stream_pipelined or process_stream_scheduler, taking the same arguments.
+            The latency budget is only used by process_stream, the detection stride by process_stream
+            and process_stream_pipelined.
+
+    Raises:
+        NameError: The pipeline mode is unknown.
+    """
+    pipeline_mode = main_config.get('pipeline', 'serial').lower()
+    frame_buffer = None
+    if main_config.parser.has_section('FrameBuffer'):
+        frame_buffer = create_frame_buffer(main_config.parser['FrameBuffer'])
+
+    if pipeline_mode == 'serial':
+        budget = main_config.getfloat('latency_budget', 0.)
+        latency_budget = None
+        if budget > 0:
+            latency_budget = LatencyBudget(budget, max_interval=main_config.getint('max_detection_interval', 5))
+        return functools.partial(process_stream, latency_budget=latency_budget,
+                                 detection_stride=create_detection_stride(main_config), frame_buffer=frame_buffer)
+    if pipeline_mode == 'pipelined':
+        return functools.partial(process_stream_pipelined,
+                                 queue_size=main_config.getint('pipeline_queue_size', 2),
+                                 detection_stride=create_detection_stride(main_config), frame_buffer=frame_buffer)
+    if pipeline_mode == 'scheduler':
+        return functools.partial(process_stream_scheduler, scheduler_config=main_config.parser['Scheduler'],
+                                 frame_buffer=frame_buffer)
+
+    raise NameError(f'Pipeline mode "{pipeline_mode}" is unknown')
+
+
+def create_detection_stride(main_config):
+    """Creates the detection stride configured in the main configuration.
+
+    Args:
+        main_config (configparser.SectionProxy): Main section of the configurations.
+
+    Returns:
+        DetectionStride: Decides which frames are detected, None when every frame is detected.
+    """
+    stride = main_config.getint('detection_stride', 1)
+    # A maximum stride up to the stride keeps the stride fixed.
+    max_stride = max(main_config.getint('max_detection_stride', stride), stride)
+    if stride == 1 and max_stride == 1:
+        return None
+    return DetectionStride(stride, max_stride, main_config.getfloat('max_motion', 0.5))
+
+
+def create_frame_buffer(buffer_config):
+    """Creates the frame buffer configured in the FrameBuffer section.
+
+    Args:
+        buffer_config (configparser.SectionProxy): FrameBuffer section of the configurations.
+
+    Returns:
+        FrameBuffer: Buffer of the processed frames with the configured storage and capacity.
+
+    Raises:
+        NameError: The storage is unknown.
+    """
+    storage_type = buffer_config.get('storage', 'frame').lower()
+
+    if storage_type == 'frame':
+        storage = FullFrameStorage()
+    elif storage_type == 'jpeg':
+        storage = JpegFrameStorage(buffer_config.getint('jpeg_quality', 90))
+    elif storage_type == 'downscaled':
+        storage = DownscaledFrameStorage(buffer_config.getfloat('scale', 0.5))
+    elif storage_type == 'cutouts':
+        storage = CutoutStorage()
+    else:
+        raise NameError(f'Frame buffer storage "{storage_type}" is unknown')
+
+    return FrameBuffer(buffer_config.getint('size', 150), storage,
+                       int(buffer_config.getfloat('max_megabytes', 0) * 1024 * 1024))
+
+
 def process_message_queue(ws_client, framebuffer, re_identifier, re_id_data):
     """Processes the message queue processing each start and stop command.
 
@@ -7,12 +7,15 @@ Utrecht University within the Software Project course.
 import os
 import argparse
 import logging
+import cv2
 import gdown
+import numpy as np
 import torch
 
 from processor.pipeline.reidentification.fastreid.fastreid.config import get_cfg
 from processor.pipeline.reidentification.fastreid.demo.predictor import FeatureExtractionDemo
 from processor.pipeline.reidentification.pytorch_re_identifier import PytorchReIdentifier
+from processor.pipeline.reidentification.quantization import load_quantized, read_calibration_batches
 from processor.utils.features import resize_cutout
 
 
@@ -23,6 +26,7 @@ class FastReIdentifier(PytorchReIdentifier):
         extractor (FeatureExtractionDemo): Extractor for the feature vectors.
         config (configparser.SectionProxy): Re-ID configuration.
         threshold (float): Threshold from which a re-identification is included.
+        max_batch_size (int): Maximum number of cutouts passed through the model at once.
     """
 
     def __init__(self, config):
@@ -43,7 +47,9 @@ class FastReIdentifier(PytorchReIdentifier):
         weight_path = os.path.join(config['weights_dir_path'], weight_name)
         cfg.MODEL.WEIGHTS = weight_path
 
-        if not torch.cuda.is_available():
+        # Quantized models only run on the CPU.
+        quantization = config.get('quantization', 'none')
+        if not torch.cuda.is_available() or quantization != 'none':
             logging.info('Fast-Reid is using CPU')
             cfg.MODEL.DEVICE = 'cpu'
         else:
@@ -62,20 +68,55 @@ class FastReIdentifier(PytorchReIdentifier):
         extractor = FeatureExtractionDemo(cfg, parallel=args.parallel)
         super().__init__(config, extractor)
 
+        self.max_batch_size = config.getint('max_batch_size', 32)
+
+        # Replace the backbone, which does almost all the work, by its INT8 version.
+        if quantization != 'none':
+            model = self.extractor.predictor.model
+            model.backbone = load_quantized(model.backbone, quantization, weight_path,
+                                            lambda: read_calibration_batches(config, self.__backbone_input))
+
+    def __backbone_input(self, cutout):
+        """Preprocesses a cutout to an input of the backbone, like the model does before running the backbone.
+
+        Args:
+            cutout (np.ndarray): BGR cutout.
+
+        Returns:
+            Tensor: (3, height, width) normalized RGB image.
+        """
+        height, width = self.extractor.cfg.INPUT.SIZE_TEST
+        image = cv2.resize(cutout[:, :, ::-1], (width, height), interpolation=cv2.INTER_CUBIC)
+        image = torch.from_numpy(np.ascontiguousarray(image.astype(np.float32).transpose(2, 0, 1)))
+
+        model = self.extractor.predictor.model
+        return (image - model.pixel_mean.cpu()[0]) / model.pixel_std.cpu()[0]
+
     def extract_features(self, cutouts):
         """Given cutouts, extracts the features from it.
 
         Args:
-            cutouts (np.ndarray): cutout of the object to extract features from.
+            cutouts ([np.ndarray]): cutouts of the objects to extract features from.
 
         Returns:
-            [float]: Feature vector of a single bounding box.
+            np.ndarray: Matrix containing the feature vector of cutout i on row i.
         """
-        features = []
-        for cutout in cutouts:
-            features.append(self.extractor.run_on_image(cutout).cpu().numpy().tolist())
-
-        return features
+        if len(cutouts) == 0:
+            return np.empty((0, 0), dtype=self.feature_dtype)
+
+        # Same preprocessing as FeatureExtractionDemo.run_on_image, but for all cutouts at once.
+        height, width = self.extractor.cfg.INPUT.SIZE_TEST
+        images = np.stack([
+            cv2.resize(cutout[:, :, ::-1], (width, height), interpolation=cv2.INTER_CUBIC) for cutout in cutouts
+        ]).astype(np.float32).transpose(0, 3, 1, 2)
+
+        # Run the model on batches of at most the maximum batch size.
+        features = [
+            self.extractor.predictor(torch.from_numpy(np.ascontiguousarray(images[i:i + self.max_batch_size])))
+            .cpu().numpy()
+            for i in range(0, len(images), self.max_batch_size)
+        ]
+        return np.concatenate(features).astype(self.feature_dtype, copy=False)
 
     def extract_features_from_image(self, image):
         """Extract features from an image.
@@ -84,8 +125,8 @@ class FastReIdentifier(PytorchReIdentifier):
             image (np.ndarray): the image of the object to extract features from.
 
         Returns:
-            [float]: Feature vector of an image.
+            np.ndarray: Feature vector of an image.
         """
         resized_image = resize_cutout(image, self.config)
 
-        return self.extractor.run_on_image(resized_image).cpu().numpy().tolist()[0]
+        return self.extractor.run_on_image(resized_image).cpu().numpy()[0].astype(self.feature_dtype, copy=False)
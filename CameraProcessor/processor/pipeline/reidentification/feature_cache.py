@@ -0,0 +1,104 @@
+"""Contains the feature cache, which stores the feature vectors of tracked boxes for the next frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class FeatureCache:
+    """Cache storing the latest feature vector of every track, keyed on the identifier given by the tracker.
+
+    The appearance of a stable track barely changes between consecutive frames, so its feature vector can be reused.
+    A cached feature vector is refreshed once it is too old, when the box moved or resized too much
+    (intersection over union with the box it was extracted from), or when the certainty of the box changed too much.
+
+    Attributes:
+        max_age (int): Number of frames a feature vector is reused, 0 disables the cache.
+        min_iou (float): Minimum intersection over union with the box the feature vector was extracted from.
+        max_certainty_change (float): Maximum change of the certainty since the feature vector was extracted.
+    """
+
+    def __init__(self, max_age=10, min_iou=0.7, max_certainty_change=0.2):
+        """Inits an empty feature cache.
+
+        Args:
+            max_age (int): Number of frames a feature vector is reused, 0 disables the cache.
+            min_iou (float): Minimum intersection over union with the box the feature vector was extracted from.
+            max_certainty_change (float): Maximum change of the certainty since the feature vector was extracted.
+        """
+        self.max_age = max_age
+        self.min_iou = min_iou
+        self.max_certainty_change = max_certainty_change
+
+        # Dictionary that maps from track id -> (feature vector, rectangle, certainty, frame number).
+        self.__entries = {}
+        self.__frame_nr = 0
+
+    def next_frame(self):
+        """Moves to the next frame, removing the feature vectors that are too old to be reused."""
+        self.__frame_nr += 1
+        self.__entries = {
+            track_id: entry for track_id, entry in self.__entries.items()
+            if self.__frame_nr - entry[3] <= self.max_age
+        }
+
+    def get(self, box):
+        """Gets the cached feature vector of the track of the box, if it is still fresh.
+
+        Args:
+            box (BoundingBox): Tracked box, the identifier is the id of the track.
+
+        Returns:
+            np.ndarray: Cached feature vector, None if there is no fresh feature vector for the track.
+        """
+        entry = self.__entries.get(box.identifier)
+        if entry is None:
+            return None
+
+        feature, rectangle, certainty, frame_nr = entry
+        if (self.__frame_nr - frame_nr > self.max_age
+                or abs(box.certainty - certainty) > self.max_certainty_change
+                or self.__iou(box.rectangle, rectangle) < self.min_iou):
+            return None
+
+        return feature
+
+    def put(self, box, feature):
+        """Stores the feature vector extracted from the box for its track.
+
+        Args:
+            box (BoundingBox): Tracked box, the identifier is the id of the track.
+            feature (np.ndarray): Feature vector extracted from the box in the current frame.
+        """
+        if self.max_age > 0:
+            self.__entries[box.identifier] = (feature, box.rectangle, box.certainty, self.__frame_nr)
+
+    def __len__(self):
+        """Gets the number of tracks with a cached feature vector.
+
+        Returns:
+            int: number of cached feature vectors.
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def __iou(rectangle, other):
+        """Calculates the intersection over union of two rectangles.
+
+        Args:
+            rectangle (Rectangle): First rectangle.
+            other (Rectangle): Second rectangle.
+
+        Returns:
+            float: Intersection over union, between 0 and 1.
+        """
+        width = min(rectangle.x2, other.x2) - max(rectangle.x1, other.x1)
+        height = min(rectangle.y2, other.y2) - max(rectangle.y1, other.y1)
+        if width <= 0 or height <= 0:
+            return 0.
+
+        intersection = width * height
+        union = ((rectangle.x2 - rectangle.x1) * (rectangle.y2 - rectangle.y1)
+                 + (other.x2 - other.x1) * (other.y2 - other.y1) - intersection)
+        return intersection / union
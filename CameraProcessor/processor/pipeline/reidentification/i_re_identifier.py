@@ -12,12 +12,12 @@ class IReIdentifier(IComponent):
     """Superclass for identifiers."""
 
     def execute_component(self):
-        """Function given to scheduler, so the scheduler can run the tracking stage.
+        """Function given to scheduler, so the scheduler can run the re-identification stage.
 
         Returns:
             function: function that the scheduler can run.
         """
-        raise NotImplementedError('execute_component not implemented')
+        return self.re_identify
 
     @property
     def feature_map_size(self):
@@ -35,7 +35,7 @@ class IReIdentifier(IComponent):
             cutouts ([np.ndarray]): A list of cutouts of the objects to extract features from.
 
         Returns:
-             [[float]]: Feature vectors of the cutouts.
+             np.ndarray: Matrix containing the feature vector of cutout i on row i.
         """
         raise NotImplementedError('Extract features function not implemented')
 
@@ -46,7 +46,7 @@ class IReIdentifier(IComponent):
             image (np.ndarray): the image of the object to extract features from.
 
         Returns:
-            [float]: Feature vector of an image.
+            np.ndarray: Feature vector of an image.
         """
         raise NotImplementedError('Extract features from image function not implemented')
 
@@ -72,8 +72,8 @@ class IReIdentifier(IComponent):
             Uses euclidean distance or cosine similarity to determine the similarity.
 
         Args:
-            query_features ([float]): the feature vector of the query image.
-            gallery_features ([float]): the feature vector of the gallery image.
+            query_features (np.ndarray): the feature vector of the query image.
+            gallery_features (np.ndarray): the feature vector of the gallery image.
 
         Returns:
             float: The similarity value of two feature vectors.
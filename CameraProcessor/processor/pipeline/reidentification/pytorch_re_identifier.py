@@ -4,15 +4,19 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
-from scipy.spatial.distance import euclidean, cosine
+import numpy as np
 
 from processor.pipeline.reidentification.i_re_identifier import IReIdentifier
-from processor.data_object.bounding_box import BoundingBox
+from processor.pipeline.reidentification.feature_cache import FeatureCache
 import processor.utils.features as UtilsFeatures
 
 
 class PytorchReIdentifier(IReIdentifier):
-    """Superclass for identifiers."""
+    """Superclass for identifiers.
+
+    Attributes:
+        feature_cache (FeatureCache): Feature vectors of the tracks of previous frames that can be reused.
+    """
 
     def __init__(self, config, extractor):
         """Init for Pytorch Re-identifier which saves config.
@@ -20,11 +24,27 @@ class PytorchReIdentifier(IReIdentifier):
         Args:
             config (configparser.SectionProxy): the re-id configuration to pass
             extractor (FeatureExtractor): The feature extractor used by the re-identifier
+
+        Raises:
+            ValueError: The distance metric or feature data type in the configuration is not valid.
         """
         self.config = config
         self.extractor = extractor
         self.threshold = float(self.config['threshold'])
 
+        # Feature vectors are kept as arrays of this type, instead of lists of floats.
+        self.feature_dtype = np.dtype(self.config.get('feature_dtype', 'float32'))
+        if self.feature_dtype not in (np.float32, np.float16):
+            raise ValueError(f'Feature data type {self.feature_dtype} is not supported.')
+
+        self.distance = self.config.get('distance')
+        if self.distance not in ('euclidean', 'cosine'):
+            raise ValueError(f'Distance metric {self.distance} is not a valid distance metric.')
+
+        self.feature_cache = FeatureCache(self.config.getint('cache_max_age', 0),
+                                          self.config.getfloat('cache_min_iou', 0.7),
+                                          self.config.getfloat('cache_max_certainty_change', 0.2))
+
     def execute_component(self):
         """Function given to scheduler, so the scheduler can run the tracking stage.
 
@@ -51,9 +71,38 @@ class PytorchReIdentifier(IReIdentifier):
 
         return cutouts
 
+    def extract_box_features(self, frame_obj, boxes):
+        """Gets the feature vectors of the tracked boxes, only extracting them for tracks without fresh cached features.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            boxes ([BoundingBox]): bounding boxes of the tracking stage.
+
+        Returns:
+            np.ndarray: Matrix containing the feature vector of box i on row i.
+        """
+        features = [self.feature_cache.get(box) for box in boxes]
+
+        # Run the model only on the boxes of which the track has no fresh features.
+        missing = [i for i, feature in enumerate(features) if feature is None]
+        if len(missing) > 0:
+            missing_boxes = [boxes[i] for i in missing]
+            extracted = self.extract_features(self.extract_cutouts(frame_obj, missing_boxes))
+            for i, box, feature in zip(missing, missing_boxes, extracted):
+                self.feature_cache.put(box, feature)
+                features[i] = feature
+
+        if len(features) == 0:
+            return np.empty((0, 0), dtype=self.feature_dtype)
+        return np.stack(features)
+
     def re_identify(self, frame_obj, track_obj, re_id_data):
         """Performing re-identification using a re-identification implementation.
 
+        Features are only extracted when objects are being followed, and only for the boxes that are not assigned
+        to an object yet. The similarity between all queries and all unassigned boxes is calculated at once.
+        Every box matching at least one query is assigned to the query it is the most similar to.
+
         Args:
             frame_obj (FrameObj):  frame object storing OpenCV frame and timestamp.
             track_obj (BoundingBoxes): List of bounding boxes from tracking stage.
@@ -66,44 +115,40 @@ class PytorchReIdentifier(IReIdentifier):
         """
 
         tracked_bounding_boxes = track_obj.bounding_boxes
-        cutouts = self.extract_cutouts(frame_obj, tracked_bounding_boxes)
-        box_features = self.extract_features(cutouts)
-
-        # Loop over all objects being followed.
-        for query_id in re_id_data.get_queries():
-            query_feature = re_id_data.get_feature_for_query(query_id)
-
-            # List 'track_features' contains feature vectors in same order as bounding boxes.
-            # Loop over the detected features in the frame.
-            for i, feature in enumerate(box_features):
-                # If the bounding box is already assigned to an object, don't compare it.
-                if tracked_bounding_boxes[i].object_id is None:
-                    # Calculate the similarity value of the 2 feature vectors.
-                    similarity_value = self.similarity(query_feature, feature)
-                    if self.config.get('distance') == 'euclidean':
-                        similarity_bool = similarity_value < self.threshold
-                    elif self.config.get('distance') == 'cosine':
-                        similarity_bool = similarity_value > self.threshold
-                    else:
-                        similarity_bool = False
-                        raise ValueError(f'Distance metric {self.config.get("distance")} '
-                                         f'is not a valid distance metric.')
-                    if similarity_bool:
-                        box_id = tracked_bounding_boxes[i].identifier
-
-                        # Store that this box id belongs to a certain object id.
-                        re_id_data.add_query_box(box_id, query_id)
-
-                        # Update object id of the box.
-                        tracked_bounding_boxes[i] = BoundingBox(
-                            identifier=box_id,
-                            rectangle=tracked_bounding_boxes[i].rectangle,
-                            classification=tracked_bounding_boxes[i].classification,
-                            certainty=tracked_bounding_boxes[i].certainty,
-                            object_id=query_id
-                        )
-
-                        print(f'Re-Id of object {query_id} in box {box_id}')
+        self.feature_cache.next_frame()
+
+        # Nothing has to be compared while no object is being followed.
+        query_ids, query_features = re_id_data.get_query_features()
+        if len(query_ids) == 0:
+            return track_obj
+
+        # If the bounding box is already assigned to an object, don't compare it.
+        unassigned = [i for i, box in enumerate(tracked_bounding_boxes) if box.object_id is None]
+        if len(unassigned) == 0:
+            return track_obj
+
+        # Similarity of every query (rows) with every unassigned box (columns).
+        box_features = self.extract_box_features(frame_obj, [tracked_bounding_boxes[i] for i in unassigned])
+        similarities = self.similarity_matrix(query_features, box_features)
+        if self.distance == 'euclidean':
+            matches = similarities < self.threshold
+            best_queries = np.where(matches, similarities, np.inf).argmin(axis=0)
+        else:
+            matches = similarities > self.threshold
+            best_queries = np.where(matches, similarities, -np.inf).argmax(axis=0)
+
+        for column in np.flatnonzero(matches.any(axis=0)):
+            i = unassigned[column]
+            query_id = query_ids[best_queries[column]]
+            box_id = tracked_bounding_boxes[i].identifier
+
+            # Store that this box id belongs to a certain object id.
+            re_id_data.add_query_box(box_id, query_id)
+
+            # Update object id of the box.
+            track_obj.set_object_id(i, query_id)
+
+            print(f'Re-Id of object {query_id} in box {box_id}')
 
         return track_obj
 
@@ -114,16 +159,38 @@ class PytorchReIdentifier(IReIdentifier):
             Uses euclidean distance or cosine similarity to determine the similarity.
 
         Args:
-            query_features ([float]): the feature vector of the query image.
-            gallery_features ([float]): the feature vector of the gallery image.
+            query_features (np.ndarray): the feature vector of the query image.
+            gallery_features (np.ndarray): the feature vector of the gallery image.
 
         Returns:
             float: The similarity value of two feature vectors.
         """
-        # pylint: disable=no-else-return.
-        if self.config.get('distance') == 'euclidean':
-            return euclidean(query_features, gallery_features)
-        elif self.config.get('distance') == 'cosine':
-            return 1 - cosine(query_features, gallery_features)
-        raise ValueError(f'Distance metric {self.config.get("distance")} is not a valid distance metric.')
-        # pylint: enable=no-else-return.
+        return float(self.similarity_matrix([query_features], [gallery_features])[0, 0])
+
+    def similarity_matrix(self, query_features, gallery_features):
+        """Calculates the similarity rates between all query and all gallery feature vectors at once.
+
+        Note:
+            Uses euclidean distance or cosine similarity to determine the similarity.
+
+        Args:
+            query_features (np.ndarray): matrix containing a feature vector of a query image on every row.
+            gallery_features (np.ndarray): matrix containing a feature vector of a gallery image on every row.
+
+        Returns:
+            np.ndarray: Matrix with the similarity value of query i and gallery image j at index [i, j].
+        """
+        dtype = np.result_type(np.asarray(query_features), np.asarray(gallery_features), np.float32)
+        query_features = np.asarray(query_features, dtype=dtype)
+        gallery_features = np.asarray(gallery_features, dtype=dtype)
+        products = query_features @ gallery_features.T
+
+        if self.distance == 'euclidean':
+            # Squared distance |q - g|^2 = |q|^2 + |g|^2 - 2 q.g, clipped since rounding can make it slightly negative.
+            squared_distances = (np.einsum('ij,ij->i', query_features, query_features)[:, np.newaxis]
+                                 + np.einsum('ij,ij->i', gallery_features, gallery_features)[np.newaxis, :]
+                                 - 2 * products)
+            return np.sqrt(np.maximum(squared_distances, 0))
+
+        norms = np.linalg.norm(query_features, axis=1)[:, np.newaxis] * np.linalg.norm(gallery_features, axis=1)
+        return products / norms
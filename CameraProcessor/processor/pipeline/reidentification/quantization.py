@@ -0,0 +1,158 @@
+"""Contains the functions to quantize the re-identification models to INT8 for faster inference on the CPU.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import copy
+import inspect
+import logging
+
+import cv2
+import numpy as np
+import torch
+from torch.quantization import get_default_qconfig, quantize_dynamic
+from torch.quantization.quantize_fx import prepare_fx, convert_fx
+
+QUANTIZATION_MODES = ('none', 'dynamic', 'static')
+
+
+def quantized_path(weights_path, mode):
+    """Gets the path of the cached quantized model, next to the weights.
+
+    Args:
+        weights_path (str): Path to the weights file of the model.
+        mode (str): Quantization mode, dynamic or static.
+
+    Returns:
+        str: Path of the quantized TorchScript model.
+    """
+    return f'{os.path.splitext(weights_path)[0]}_{mode}_int8.pt'
+
+
+def read_calibration_cutouts(calibration_dir, max_cutouts=256):
+    """Reads the cutouts used to calibrate static quantization, e.g. cutouts of people in our own footage.
+
+    Args:
+        calibration_dir (str): Folder containing the cutout images.
+        max_cutouts (int): Maximum number of cutouts read.
+
+    Returns:
+        [np.ndarray]: BGR cutouts, like the cutouts of the pipeline.
+    """
+    if not calibration_dir or not os.path.isdir(calibration_dir):
+        return []
+
+    cutouts = []
+    for file_name in sorted(os.listdir(calibration_dir)):
+        cutout = cv2.imread(os.path.join(calibration_dir, file_name))
+        if cutout is not None:
+            cutouts.append(cutout)
+        if len(cutouts) >= max_cutouts:
+            break
+    return cutouts
+
+
+def calibration_batches(cutouts, transform, batch_size=32):
+    """Converts the calibration cutouts to input batches of the model.
+
+    Args:
+        cutouts ([object]): Calibration cutouts.
+        transform (function): Converts a cutout to a (3, height, width) input tensor of the model.
+        batch_size (int): Maximum number of cutouts in a batch.
+
+    Returns:
+        [Tensor]: (N, 3, height, width) input batches.
+    """
+    inputs = [transform(cutout) for cutout in cutouts]
+    return [torch.stack(inputs[i:i + batch_size]) for i in range(0, len(inputs), batch_size)]
+
+
+def read_calibration_batches(config, transform):
+    """Reads the calibration cutouts configured in a re-identification section as input batches of the model.
+
+    Args:
+        config (SectionProxy): Re-identification configuration with the quantization settings.
+        transform (function): Converts a BGR cutout to a (3, height, width) input tensor of the model.
+
+    Returns:
+        [Tensor]: (N, 3, height, width) input batches.
+    """
+    cutouts = read_calibration_cutouts(config.get('quantization_calibration_dir'),
+                                       config.getint('quantization_calibration_size', 256))
+
+    # Dynamic quantization only needs an example input to trace the model.
+    if len(cutouts) == 0 and config.get('quantization') == 'dynamic':
+        height, width = config.gettuple('size')
+        cutouts = [np.zeros((height, width, 3), dtype=np.uint8)]
+
+    return calibration_batches(cutouts, transform)
+
+
+def quantize(model, mode, batches):
+    """Quantizes a model taking a single image tensor to INT8, without changing the given model.
+
+    Dynamic quantization only quantizes the linear layers, and quantizes their activations while running.
+    Static quantization also quantizes the convolutions, with activation ranges observed on the calibration batches.
+
+    Args:
+        model (torch.nn.Module): Model to quantize.
+        mode (str): Quantization mode, dynamic or static.
+        batches ([Tensor]): Input batches, used to calibrate static quantization and to trace the quantized model.
+
+    Returns:
+        torch.jit.ScriptModule: Traced quantized model, which runs on the CPU.
+
+    Raises:
+        ValueError: The mode is unknown or there are no input batches.
+    """
+    if mode not in QUANTIZATION_MODES[1:]:
+        raise ValueError(f'Quantization mode "{mode}" is unknown, use one of {QUANTIZATION_MODES[1:]}')
+    if len(batches) == 0:
+        raise ValueError('Quantization needs calibration cutouts')
+
+    model = copy.deepcopy(model).cpu().eval()
+
+    if mode == 'dynamic':
+        quantized = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    else:
+        qconfig_dict = {'': get_default_qconfig(torch.backends.quantized.engine)}
+
+        # Newer versions of PyTorch need example inputs to prepare the model.
+        if 'example_inputs' in inspect.signature(prepare_fx).parameters:
+            prepared = prepare_fx(model, qconfig_dict, example_inputs=(batches[0],))
+        else:
+            prepared = prepare_fx(model, qconfig_dict)
+
+        with torch.no_grad():
+            for batch in batches:
+                prepared(batch)
+        quantized = convert_fx(prepared)
+
+    with torch.no_grad():
+        return torch.jit.trace(quantized, batches[0])
+
+
+def load_quantized(model, mode, weights_path, create_batches):
+    """Loads the cached quantized model, quantizing and caching it when there is no cache newer than the weights.
+
+    Args:
+        model (torch.nn.Module): Model to quantize.
+        mode (str): Quantization mode, dynamic or static.
+        weights_path (str): Path to the weights of the model, the quantized model is cached next to it.
+        create_batches (function): Creates the calibration batches, only called when the model is quantized.
+
+    Returns:
+        torch.jit.ScriptModule: Quantized model, which runs on the CPU.
+    """
+    path = quantized_path(weights_path, mode)
+    if os.path.exists(path) and (not os.path.exists(weights_path)
+                                 or os.path.getmtime(path) >= os.path.getmtime(weights_path)):
+        logging.info(f'Loading quantized model {path}')
+        return torch.jit.load(path, map_location='cpu')
+
+    logging.info(f'Quantizing {weights_path} ({mode})')
+    quantized = quantize(model, mode, create_batches())
+    torch.jit.save(quantized, path)
+    return quantized
@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import numpy as np
 
 
 class ReidData:
@@ -15,7 +16,8 @@ class ReidData:
 
     Attributes:
         __query_boxes (dict[int, int]): Dictionary that maps from box_id to an object_id.
-        __query_features (dict[int, [float]]): Maps from an object_id to a feature vector.
+        __query_features (dict[int, np.ndarray]): Maps from an object_id to a feature vector.
+        __query_matrix (([int], np.ndarray)): Object ids and feature vectors of all queries as a matrix.
     """
     def __init__(self):
         """Initializer for the class."""
@@ -25,6 +27,9 @@ class ReidData:
         # Dictionary that maps from object_id -> feature vector.
         self.__query_features = {}
 
+        # Object ids and feature vectors of all queries as a matrix, None when the queries changed.
+        self.__query_matrix = None
+
     def add_query_box(self, box_id, object_id):
         """Link the object id to the box id in a dictionary.
 
@@ -37,11 +42,17 @@ class ReidData:
     def add_query_feature(self, object_id, feature_vector):
         """Store the feature vector of a queried object in a dictionary.
 
+        Feature vectors are stored as contiguous arrays, feature vectors received as list (e.g. from the websocket)
+        are converted to float32.
+
         Args:
             object_id (int): The id of the queried object.
-            feature_vector ([float]): the feature vector of the queried object.
+            feature_vector (np.ndarray or [float]): the feature vector of the queried object.
         """
-        self.__query_features[object_id] = feature_vector
+        is_float_array = isinstance(feature_vector, np.ndarray) and np.issubdtype(feature_vector.dtype, np.floating)
+        dtype = feature_vector.dtype if is_float_array else np.float32
+        self.__query_features[object_id] = np.ascontiguousarray(feature_vector, dtype=dtype)
+        self.__query_matrix = None
 
     def remove_query(self, object_id):
         """Removes the items of query_boxes and query_features containing the object_id.
@@ -53,6 +64,7 @@ class ReidData:
         """
         # Delete the feature vector from the object ID.
         del self.__query_features[object_id]
+        self.__query_matrix = None
 
         # Store all box ids that map to the object ID.
         del_box_ids = []
@@ -91,6 +103,21 @@ class ReidData:
             object_id (int): id of the object.
 
         Returns:
-            [float]: Feature vector for the object
+            np.ndarray: Feature vector for the object
         """
         return self.__query_features[object_id]
+
+    def get_query_features(self):
+        """Returns the feature vectors of all queries stacked into a single matrix.
+
+        The matrix is only rebuilt when a query got added or removed.
+
+        Returns:
+            [int], np.ndarray: The object ids of the queries, and a matrix with the feature vector of the query
+                with the same index on every row.
+        """
+        if self.__query_matrix is None:
+            object_ids = list(self.__query_features.keys())
+            features = np.asarray([self.__query_features[object_id] for object_id in object_ids])
+            self.__query_matrix = object_ids, features
+        return self.__query_matrix
@@ -5,9 +5,12 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 import os
+import logging
 import gdown
+import numpy as np
 
 from processor.pipeline.reidentification.pytorch_re_identifier import PytorchReIdentifier
+from processor.pipeline.reidentification.quantization import load_quantized, read_calibration_batches
 from processor.pipeline.reidentification.torchreid.torchreid.utils import FeatureExtractor
 from processor.utils.features import resize_cutout
 
@@ -39,11 +42,25 @@ class TorchReIdentifier(PytorchReIdentifier):
             url = 'https://drive.google.com/u/0/uc?id=1vduhq5DpN2q1g4fYEZfPI17MJeh9qyrA&export=download'
             gdown.download(url, weights_path, quiet=False)
 
+        # Quantized models only run on the CPU.
+        quantization = config.get('quantization', 'none')
+        device = config['device']
+        if quantization != 'none' and device != 'cpu':
+            logging.warning(f'Torchreid is quantized ({quantization}), so it is using CPU instead of {device}')
+            device = 'cpu'
+
         # Initialize the feature extractor of torch re-id.
         extractor = FeatureExtractor(
             model_name=config['model_name'],
             model_path=weights_path,
-            device=config['device'])
+            device=device)
+
+        # Replace the model by its INT8 version, preprocessed calibration cutouts like the cutouts of the pipeline.
+        if quantization != 'none':
+            extractor.model = load_quantized(
+                extractor.model, quantization, weights_path,
+                lambda: read_calibration_batches(config, lambda cutout: extractor.preprocess(extractor.to_pil(cutout)))
+            )
 
         super().__init__(config, extractor)
 
@@ -54,12 +71,12 @@ class TorchReIdentifier(PytorchReIdentifier):
             cutouts ([np.ndarray]): A list of cutouts of the objects to extract features from.
 
         Returns:
-             [[float]]: Feature vectors of the cutouts.
+             np.ndarray: Matrix containing the feature vector of cutout i on row i.
         """
         if len(cutouts) == 0:
-            return []
+            return np.empty((0, 0), dtype=self.feature_dtype)
 
-        return self.extractor(cutouts).cpu().numpy().tolist()
+        return self.extractor(cutouts).cpu().numpy().astype(self.feature_dtype, copy=False)
 
     def extract_features_from_image(self, image):
         """Extract features from an image.
@@ -68,7 +85,7 @@ class TorchReIdentifier(PytorchReIdentifier):
             image (np.ndarray): the image of the object to extract features from.
 
         Returns:
-            [float]: Feature vector of an image.
+            np.ndarray: Feature vector of an image.
         """
         resized_image = resize_cutout(image, self.config)
-        return self.extractor(resized_image).cpu().numpy().tolist()[0]
+        return self.extractor(resized_image).cpu().numpy()[0].astype(self.feature_dtype, copy=False)
@@ -0,0 +1,59 @@
+"""Contains the batch sort tracker.
+
+This tracker is the same as the sort tracker, but predicts and updates all tracks at once.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.tracking.sort.batch_sort import BatchSort
+from processor.pipeline.tracking.i_sort_tracker import ISortTracker
+
+
+class BatchSortTracker(ISortTracker):
+    """Tracker of vectorized SORT tracking.
+
+    Contains the BatchSort tracking class and gets trackers from this class with each track() call.
+
+    Attributes:
+        config (configparser.SectionProxy): SORT tracker configuration.
+        sort (BatchSort): Vectorized sort tracking class.
+    """
+    def __init__(self, config):
+        """Inits BatchSortTracker with SORT tracker configuration.
+
+        Args:
+            config (configparser.SectionProxy): SORT tracker configuration.
+        """
+        self.config = config
+        self.sort = BatchSort(max_age=config.getint('max_age'),
+                              min_hits=config.getint('min_hits'),
+                              iou_threshold=config.getfloat('iou_threshold'))
+
+    def track(self, frame_obj, detection_boxes, re_id_data):
+        """Performing tracking using vectorized SORT tracking to get a tracking ID for all tracked detections.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            detection_boxes (BoundingBoxes): BoundingBoxes object that has the bounding boxes of detection stage
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
+        """
+        detections = self.convert_boxes_to_sort(detection_boxes, frame_obj.shape)
+        sort_detections = self.sort.update(detections)
+        return self.parse_boxes_from_sort(sort_detections, frame_obj.shape, re_id_data)
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts the boxes of the tracks on a frame that is not detected, without aging the tracks.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted boxes of the tracks returned on the last tracked frame.
+        """
+        return self.parse_boxes_from_sort(self.sort.predict(), frame_obj.shape, re_id_data)
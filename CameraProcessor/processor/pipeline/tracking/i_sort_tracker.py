@@ -6,10 +6,8 @@ Utrecht University within the Software Project course.
 """
 import numpy as np
 
-from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes, NO_OBJECT_ID
 from processor.pipeline.tracking.i_tracker import ITracker
-from processor.data_object.bounding_boxes import BoundingBoxes
-from processor.data_object.rectangle import Rectangle
 
 
 class ISortTracker(ITracker):
@@ -43,58 +41,63 @@ class ISortTracker(ITracker):
     def parse_boxes_from_sort(tracked_boxes, shape, re_id_data):
         """Parses the boxes from sort into the correct format.
 
+        The coordinates of all boxes are converted at once into the columns of an ArrayBoundingBoxes.
+
         Args:
-            tracked_boxes ([BoundingBox]): Boxes generated by the sort tracker.
+            tracked_boxes ([(np.ndarray, str, float)]): Boxes generated by the sort tracker.
             shape (int, int): Width and height of the image
             re_id_data (ReidData): Object containing data necessary for re-identification.
 
         Returns:
-            [BoundingBox]: object containing all trackers (bounding boxes of tracked objects).
+            ArrayBoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
         """
-        bounding_boxes = []
+        if len(tracked_boxes) == 0:
+            return ArrayBoundingBoxes(np.empty((0, 4)), [], [], [])
+
         width, height = shape
+        sort_boxes = np.stack([box[0] for box in tracked_boxes])
+        identifiers = sort_boxes[:, 4].astype(int)
+
+        # Truncate to whole pixels and normalize, keeping the boxes inside the frame.
+        rects = np.trunc(sort_boxes[:, :4]) / (width, height, width, height)
+        rects[:, :2] = np.maximum(rects[:, :2], 0)
+        rects[:, 2:] = np.minimum(rects[:, 2:], 1)
+
+        class_names = list(dict.fromkeys(box[1] for box in tracked_boxes))
+        class_lookup = {name: i for i, name in enumerate(class_names)}
 
-        # Parse each box.
-        for box in tracked_boxes:
-            bounding_box = BoundingBox(
-                identifier=int(box[0][4]),
-                rectangle=Rectangle(
-                    max(int(box[0][0]) / width, 0),
-                    max(int(box[0][1]) / height, 0),
-                    min(int(box[0][2]) / width, 1),
-                    min(int(box[0][3]) / height, 1),
-                ),
-                classification=box[1],
-                certainty=box[2],
-                object_id=re_id_data.get_object_id_for_box(int(box[0][4]))
-            )
-            bounding_boxes.append(bounding_box)
-
-        return BoundingBoxes(bounding_boxes)
+        object_ids = [re_id_data.get_object_id_for_box(identifier) for identifier in identifiers.tolist()]
+
+        return ArrayBoundingBoxes(
+            rects=rects,
+            identifiers=identifiers,
+            class_indices=[class_lookup[box[1]] for box in tracked_boxes],
+            certainties=[box[2] for box in tracked_boxes],
+            object_ids=[NO_OBJECT_ID if object_id is None else object_id for object_id in object_ids],
+            class_names=class_names,
+            validate=False
+        )
 
     @staticmethod
     def convert_boxes_to_sort(detection_boxes, shape):
         """Converts the bounding boxes to the format used by sort.
 
         Args:
-             detection_boxes ([BoundingBox]): A list of bounding boxes from our detection method
+             detection_boxes (BoundingBoxes): The bounding boxes from our detection method
              shape (int, int): Width and height of the image
 
         Returns:
-            (np.array, string, float): A numpy array for the bounding box, a string for the
+            [(np.array, string, float)]: A numpy array for the bounding box, a string for the
                 classification and a float for the certainty,
         """
+        if not isinstance(detection_boxes, ArrayBoundingBoxes):
+            detection_boxes = ArrayBoundingBoxes.from_bounding_boxes(detection_boxes)
+
         width, height = shape
-        sort_detections = []
-
-        for bounding_box in detection_boxes:
-            # Include box, classification, and certainty.
-            sort_detections.append((np.asarray([
-                bounding_box.rectangle.x1 * width,
-                bounding_box.rectangle.y1 * height,
-                bounding_box.rectangle.x2 * width,
-                bounding_box.rectangle.y2 * height,
-                bounding_box.certainty]),
-                bounding_box.classification,
-                bounding_box.certainty))
-        return sort_detections
+
+        # Include box, classification, and certainty.
+        sort_boxes = np.empty((len(detection_boxes), 5))
+        sort_boxes[:, :4] = detection_boxes.rects * (width, height, width, height)
+        sort_boxes[:, 4] = detection_boxes.certainties
+
+        return list(zip(sort_boxes, detection_boxes.classifications, detection_boxes.certainties.tolist()))
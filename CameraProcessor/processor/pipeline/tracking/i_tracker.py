@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+from processor.data_object.bounding_boxes import BoundingBoxes
 from processor.scheduling.component.i_component import IComponent
 
 
@@ -30,3 +31,17 @@ class ITracker(IComponent):
             BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
         """
         raise NotImplementedError('Tracking stage not implemented')
+
+    def predict(self, frame_obj, re_id_data):
+        """Tracks a frame that is not detected, e.g. because detection is skipped to keep up with a live stream.
+
+        By default the frame is tracked without detections, trackers that can predict their tracks override this.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
+        """
+        return self.track(frame_obj, BoundingBoxes([]), re_id_data)
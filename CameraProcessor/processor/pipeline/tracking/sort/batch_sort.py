@@ -0,0 +1,255 @@
+"""Contains a vectorized version of SORT, which keeps the Kalman filters of all tracks in stacked arrays.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+
+from processor.pipeline.tracking.sort.sort import associate_detections_to_trackers
+
+# Constant velocity model on the state [x, y, s, r, vx, vy, vs], see KalmanBoxTracker.
+STATE_TRANSITION = np.array([
+    [1, 0, 0, 0, 1, 0, 0],
+    [0, 1, 0, 0, 0, 1, 0],
+    [0, 0, 1, 0, 0, 0, 1],
+    [0, 0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0, 0],
+    [0, 0, 0, 0, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0, 1]], dtype=float)
+MEASUREMENT_NOISE = np.diag([1., 1., 10., 10.])
+PROCESS_NOISE = np.diag([1., 1., 1., 1., .01, .01, .0001])
+INITIAL_COVARIANCE = np.diag([10., 10., 10., 10., 10000., 10000., 10000.])
+
+
+def boxes_to_measurements(boxes):
+    """Converts boxes to the measurements of the Kalman filters.
+
+    Args:
+        boxes (np.ndarray): (N, >=4) array of boxes in the form [x1, y1, x2, y2, ...].
+
+    Returns:
+        np.ndarray: (N, 4) array of measurements in the form [x, y, s, r], the centre, area and aspect ratio.
+    """
+    width = boxes[:, 2] - boxes[:, 0]
+    height = boxes[:, 3] - boxes[:, 1]
+    return np.stack([boxes[:, 0] + width / 2., boxes[:, 1] + height / 2., width * height, width / height], axis=1)
+
+
+def states_to_boxes(states):
+    """Converts the states of the Kalman filters to boxes.
+
+    Args:
+        states (np.ndarray): (N, >=4) array of states starting with [x, y, s, r].
+
+    Returns:
+        np.ndarray: (N, 4) array of boxes in the form [x1, y1, x2, y2].
+    """
+    width = np.sqrt(states[:, 2] * states[:, 3])
+    height = states[:, 2] / width
+    return np.stack([states[:, 0] - width / 2., states[:, 1] - height / 2.,
+                     states[:, 0] + width / 2., states[:, 1] + height / 2.], axis=1)
+
+
+class BatchSort:
+    """SORT tracker that predicts and updates all tracks at once.
+
+    The original SORT keeps a KalmanFilter object per track and loops over them in Python on every frame.
+    This version stacks the states (N, 7) and covariances (N, 7, 7) of all tracks, so predicting and updating
+    the tracks are a few batched matrix operations, which keeps the cost per frame low with many tracks.
+    The filter parameters, the association and the output are the same as those of Sort.
+
+    Attributes:
+        max_age (int): Amount of frames a track persists while it is not matched to a detection.
+        min_hits (int): Consecutive hits before a track is returned.
+        iou_threshold (float): Minimum intersection over union of a predicted box and a matched detection.
+        frame_count (int): Number of frames processed.
+    """
+
+    def __init__(self, max_age=1, min_hits=3, iou_threshold=0.3):
+        """Inits BatchSort without any tracks.
+
+        Args:
+            max_age (int): Amount of frames a track persists while it is not matched to a detection.
+            min_hits (int): Consecutive hits before a track is returned.
+            iou_threshold (float): Minimum intersection over union of a predicted box and a matched detection.
+        """
+        self.max_age = max_age
+        self.min_hits = min_hits
+        self.iou_threshold = iou_threshold
+        self.frame_count = 0
+
+        self.__next_id = 0
+        self.__states = np.empty((0, 7))
+        self.__covariances = np.empty((0, 7, 7))
+        self.__ids = np.empty(0, dtype=int)
+        self.__time_since_update = np.empty(0, dtype=int)
+        self.__hit_streak = np.empty(0, dtype=int)
+        self.__classifications = []
+        self.__certainties = []
+
+    def __len__(self):
+        """Gets the number of tracks, including the tracks that are not returned.
+
+        Returns:
+            int: number of tracks.
+        """
+        return len(self.__ids)
+
+    def update(self, dets):
+        """Updates the tracks with the detections of the next frame.
+
+        Must be called once for every frame, also for frames without detections.
+
+        Args:
+            dets ([(np.ndarray, str, float)]): detections in the form ([x1, y1, x2, y2, score], classification,
+                certainty), like the detections passed to Sort.
+
+        Returns:
+            [(np.ndarray, str, float)]: tracked boxes in the form ([x1, y1, x2, y2, id], classification, certainty),
+                an empty (0, 5) array if no box is tracked.
+        """
+        self.frame_count += 1
+        boxes = np.asarray([det[0] for det in dets], dtype=float).reshape(-1, 5)
+
+        predicted = self.__predict()
+        matched, unmatched_dets, _ = associate_detections_to_trackers(boxes, predicted, self.iou_threshold)
+        matched = matched.astype(int)
+
+        if len(matched) > 0:
+            self.__update(matched[:, 1], boxes[matched[:, 0]])
+            for det_i, track_i in matched:
+                self.__classifications[track_i] = dets[det_i][1]
+                self.__certainties[track_i] = dets[det_i][2]
+
+        self.__add_tracks(boxes[np.asarray(unmatched_dets, dtype=int)],
+                          [dets[i][1:3] for i in np.asarray(unmatched_dets, dtype=int)])
+
+        tracked = self.__tracked_boxes()
+
+        # Remove tracks that are not matched for too long.
+        self.__keep(self.__time_since_update <= self.max_age)
+
+        return tracked if tracked else np.empty((0, 5))
+
+    def predict(self):
+        """Advances all tracks by a frame that is not detected, like Sort.predict.
+
+        The tracks are not aged, as a frame without detections is not a missed detection.
+
+        Returns:
+            [(np.ndarray, str, float)]: predicted boxes of the tracks returned by the last update, in the same
+                format as update.
+        """
+        self.__advance()
+        tracked = self.__tracked_boxes(~np.isnan(states_to_boxes(self.__states)).any(axis=1))
+        return tracked if tracked else np.empty((0, 5))
+
+    def __advance(self):
+        """Advances the states and covariances of all tracks by a frame."""
+        # Prevent the area from becoming negative.
+        self.__states[self.__states[:, 6] + self.__states[:, 2] <= 0, 6] = 0.
+
+        self.__states = self.__states @ STATE_TRANSITION.T
+        self.__covariances = STATE_TRANSITION @ self.__covariances @ STATE_TRANSITION.T + PROCESS_NOISE
+
+    def __predict(self):
+        """Advances the states of all tracks by a frame, removing tracks of which the prediction is invalid.
+
+        Returns:
+            np.ndarray: (N, 4) array of predicted boxes of the remaining tracks.
+        """
+        self.__advance()
+
+        self.__hit_streak[self.__time_since_update > 0] = 0
+        self.__time_since_update += 1
+
+        predicted = states_to_boxes(self.__states)
+        valid = ~np.isnan(predicted).any(axis=1)
+        self.__keep(valid)
+        return predicted[valid]
+
+    def __update(self, tracks, boxes):
+        """Corrects the states of the matched tracks with their detections.
+
+        Args:
+            tracks (np.ndarray): indices of the matched tracks.
+            boxes (np.ndarray): (M, >=4) array with the detected box for every matched track.
+        """
+        states = self.__states[tracks]
+        covariances = self.__covariances[tracks]
+
+        # The measurement is the first 4 entries of the state, so H @ P @ H.T is the upper left block of P.
+        residuals = boxes_to_measurements(boxes) - states[:, :4]
+        innovations = covariances[:, :4, :4] + MEASUREMENT_NOISE
+        gains = covariances[:, :, :4] @ np.linalg.inv(innovations)
+
+        # Joseph form of the covariance update, like filterpy.
+        gains_measurement = np.zeros_like(covariances)
+        gains_measurement[:, :, :4] = gains
+        correction = np.eye(7) - gains_measurement
+        covariances = (correction @ covariances @ correction.transpose(0, 2, 1)
+                       + gains @ MEASUREMENT_NOISE @ gains.transpose(0, 2, 1))
+
+        self.__states[tracks] = states + (gains @ residuals[:, :, None])[:, :, 0]
+        self.__covariances[tracks] = covariances
+        self.__time_since_update[tracks] = 0
+        self.__hit_streak[tracks] += 1
+
+    def __add_tracks(self, boxes, labels):
+        """Starts a new track for every unmatched detection.
+
+        Args:
+            boxes (np.ndarray): (K, >=4) array of unmatched detected boxes.
+            labels ([(str, float)]): classification and certainty of every unmatched detection.
+        """
+        count = len(boxes)
+        if count == 0:
+            return
+
+        states = np.zeros((count, 7))
+        states[:, :4] = boxes_to_measurements(boxes)
+
+        self.__states = np.concatenate([self.__states, states])
+        self.__covariances = np.concatenate([self.__covariances, np.repeat(INITIAL_COVARIANCE[None], count, axis=0)])
+        self.__ids = np.concatenate([self.__ids, np.arange(self.__next_id, self.__next_id + count)])
+        self.__time_since_update = np.concatenate([self.__time_since_update, np.zeros(count, dtype=int)])
+        self.__hit_streak = np.concatenate([self.__hit_streak, np.zeros(count, dtype=int)])
+        self.__classifications.extend(classification for classification, _ in labels)
+        self.__certainties.extend(certainty for _, certainty in labels)
+        self.__next_id += count
+
+    def __tracked_boxes(self, valid=True):
+        """Gets the boxes of the tracks that were matched in this frame and have enough hits.
+
+        Args:
+            valid (np.ndarray): boolean array, False for tracks that should not be returned.
+
+        Returns:
+            [(np.ndarray, str, float)]: tracked boxes in the form ([x1, y1, x2, y2, id], classification, certainty),
+                newest track first like Sort.
+        """
+        output = valid & (self.__time_since_update < 1) & \
+            ((self.__hit_streak >= self.min_hits) | (self.frame_count <= self.min_hits))
+        indices = np.flatnonzero(output)[::-1]
+
+        # Ids start at 1, as the MOT benchmark requires positive ids.
+        boxes = np.concatenate([states_to_boxes(self.__states[indices]), self.__ids[indices, None] + 1.], axis=1)
+        return [(box, self.__classifications[i], self.__certainties[i]) for box, i in zip(boxes, indices)]
+
+    def __keep(self, mask):
+        """Removes the tracks that are not selected by the mask.
+
+        Args:
+            mask (np.ndarray): boolean array, True for every track to keep.
+        """
+        if mask.all():
+            return
+
+        self.__states = self.__states[mask]
+        self.__covariances = self.__covariances[mask]
+        self.__ids = self.__ids[mask]
+        self.__time_since_update = self.__time_since_update[mask]
+        self.__hit_streak = self.__hit_streak[mask]
+        self.__classifications = [label for label, keep in zip(self.__classifications, mask) if keep]
+        self.__certainties = [certainty for certainty, keep in zip(self.__certainties, mask) if keep]
@@ -19,6 +19,8 @@ from __future__ import print_function
 
 import numpy as np
 from filterpy.kalman import KalmanFilter
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 np.random.seed(0)
 
@@ -149,51 +151,108 @@ class KalmanBoxTracker(object):
         return convert_x_to_bbox(self.kf.x)
 
 
+def iou_pairs(bb_test, bb_gt):
+    """
+    Computes the IOU between every row of bb_test and the same row of bb_gt, boxes in the form [x1,y1,x2,y2]
+    """
+    w = np.maximum(0., np.minimum(bb_test[:, 2], bb_gt[:, 2]) - np.maximum(bb_test[:, 0], bb_gt[:, 0]))
+    h = np.maximum(0., np.minimum(bb_test[:, 3], bb_gt[:, 3]) - np.maximum(bb_test[:, 1], bb_gt[:, 1]))
+    wh = w * h
+    return wh / ((bb_test[:, 2] - bb_test[:, 0]) * (bb_test[:, 3] - bb_test[:, 1])
+                 + (bb_gt[:, 2] - bb_gt[:, 0]) * (bb_gt[:, 3] - bb_gt[:, 1]) - wh)
+
+
+def gated_iou_pairs(detections, trackers, iou_threshold):
+    """
+    Finds the detection/tracker pairs that overlap with an IOU of at least iou_threshold.
+      Trackers are sorted on x1, so for every detection only the trackers that can overlap with it horizontally
+      are compared, instead of computing the dense IOU matrix.
+
+    Returns 3 arrays with the detection index, tracker index and IOU of every kept pair
+    """
+    order = np.argsort(trackers[:, 0], kind='stable')
+    sorted_x1 = trackers[order, 0]
+    max_width = np.max(trackers[:, 2] - trackers[:, 0])
+
+    # a tracker overlaps horizontally when det.x1 - width < x1 < det.x2
+    lower = np.searchsorted(sorted_x1, detections[:, 0] - max_width, side='right')
+    upper = np.searchsorted(sorted_x1, detections[:, 2], side='left')
+    counts = np.maximum(upper - lower, 0)
+
+    rows = np.repeat(np.arange(len(detections)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cols = order[np.repeat(lower, counts) + offsets]
+
+    ious = iou_pairs(detections[rows], trackers[cols])
+    keep = (ious > 0) & (ious >= iou_threshold)
+    return rows[keep], cols[keep], ious[keep]
+
+
 def associate_detections_to_trackers(detections, trackers, iou_threshold=0.3):
     """
     Assigns detections to tracked object (both represented as bounding boxes)
 
-    Returns 3 lists of matches, unmatched_detections and unmatched_trackers
+    Only pairs that pass the IOU gate can be matched. Pairs of which the detection and the tracker have no other
+      candidate are matched directly, the linear assignment is only solved for each group of contested pairs.
+
+    Returns 3 arrays of matches, unmatched_detections and unmatched_trackers
     """
-    if len(trackers) == 0:
-        return np.empty((0, 2), dtype=int), np.arange(len(detections)), np.empty((0, 5), dtype=int)
-
-    iou_matrix = np.asarray([])
-    if len(detections) > 0:
-        iou_matrix = iou_batch(detections, trackers)
-
-    if min(iou_matrix.shape) > 0:
-        a = (iou_matrix > iou_threshold).astype(np.int32)
-        if a.sum(1).max() == 1 and a.sum(0).max() == 1:
-            matched_indices = np.stack(np.where(a), axis=1)
-        else:
-            matched_indices = linear_assignment(-iou_matrix)
-    else:
-        matched_indices = np.empty(shape=(0, 2))
-
-    unmatched_detections = []
-    for d, det in enumerate(detections):
-        if d not in matched_indices[:, 0]:
-            unmatched_detections.append(d)
-    unmatched_trackers = []
-    for t, trk in enumerate(trackers):
-        if t not in matched_indices[:, 1]:
-            unmatched_trackers.append(t)
-
-    # filter out matched with low IOU
-    matches = []
-    for m in matched_indices:
-        if iou_matrix[m[0], m[1]] < iou_threshold:
-            unmatched_detections.append(m[0])
-            unmatched_trackers.append(m[1])
-        else:
-            matches.append(m.reshape(1, 2))
-    if len(matches) == 0:
-        matches = np.empty((0, 2), dtype=int)
-    else:
-        matches = np.concatenate(matches, axis=0)
+    unmatched_detections = np.ones(len(detections), dtype=bool)
+    unmatched_trackers = np.ones(len(trackers), dtype=bool)
+    matches = np.empty((0, 2), dtype=int)
+
+    if len(detections) > 0 and len(trackers) > 0:
+        rows, cols, ious = gated_iou_pairs(detections, trackers, iou_threshold)
+
+        # a pair is uncontested when neither the detection nor the tracker is part of another pair
+        row_counts = np.bincount(rows, minlength=len(detections))
+        col_counts = np.bincount(cols, minlength=len(trackers))
+        uncontested = (row_counts[rows] == 1) & (col_counts[cols] == 1)
+        matched = [np.stack((rows[uncontested], cols[uncontested]), axis=1)]
 
-    return matches, np.array(unmatched_detections), np.array(unmatched_trackers)
+        contested = ~uncontested
+        if contested.any():
+            matched.extend(assign_contested(rows[contested], cols[contested], ious[contested]))
+
+        matches = np.concatenate(matched, axis=0).astype(int)
+        unmatched_detections[matches[:, 0]] = False
+        unmatched_trackers[matches[:, 1]] = False
+
+    return matches, np.flatnonzero(unmatched_detections), np.flatnonzero(unmatched_trackers)
+
+
+def assign_contested(rows, cols, ious):
+    """
+    Solves the linear assignment separately for every connected group of contested detection/tracker pairs
+
+    Returns a list of arrays with the matched detection and tracker indices
+    """
+    detection_ids, local_rows = np.unique(rows, return_inverse=True)
+    tracker_ids, local_cols = np.unique(cols, return_inverse=True)
+    n_det = len(detection_ids)
+
+    # bipartite graph with the detections as the first nodes and the trackers as the last nodes
+    graph = coo_matrix((np.ones(len(rows)), (local_rows, local_cols + n_det)),
+                       shape=(n_det + len(tracker_ids),) * 2)
+    _, labels = connected_components(graph, directed=False)
+
+    matched = []
+    pair_labels = labels[local_rows]
+    for label in np.unique(pair_labels):
+        in_group = pair_labels == label
+        group_rows, group_rows_local = np.unique(local_rows[in_group], return_inverse=True)
+        group_cols, group_cols_local = np.unique(local_cols[in_group], return_inverse=True)
+
+        iou_matrix = np.zeros((len(group_rows), len(group_cols)))
+        iou_matrix[group_rows_local, group_cols_local] = ious[in_group]
+        gated = np.zeros(iou_matrix.shape, dtype=bool)
+        gated[group_rows_local, group_cols_local] = True
+
+        assigned = linear_assignment(-iou_matrix).reshape(-1, 2).astype(int)
+        assigned = assigned[gated[assigned[:, 0], assigned[:, 1]]]
+        matched.append(np.stack((detection_ids[group_rows[assigned[:, 0]]],
+                                 tracker_ids[group_cols[assigned[:, 1]]]), axis=1))
+    return matched
 
 
 class Sort(object):
@@ -260,3 +319,24 @@ class Sort(object):
         if len(ret) > 0:
             return ret
         return np.empty((0, 5))
+
+    def predict(self):
+        """
+        Advances all trackers by a frame that is not detected, e.g. to save time on a live stream.
+        Unlike update with empty detections, the trackers are not aged, as a frame without detections
+        is not a missed detection.
+        Returns the predicted boxes of the trackers returned by the last update, in the same format as update.
+        """
+        ret = []
+        for trk in reversed(self.trackers):
+            if (trk.kf.x[6] + trk.kf.x[2]) <= 0:
+                trk.kf.x[6] *= 0.0
+            trk.kf.predict()
+            d = trk.get_state()[0]
+            if np.any(np.isnan(d)):
+                continue
+            if (trk.time_since_update < 1) and (trk.hit_streak >= self.min_hits or self.frame_count <= self.min_hits):
+                ret.append(((np.concatenate((d, [trk.id + 1])).reshape(1, -1))[0], trk.classification, trk.certainty))
+        if len(ret) > 0:
+            return ret
+        return np.empty((0, 5))
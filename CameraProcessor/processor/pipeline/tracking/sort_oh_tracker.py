@@ -8,6 +8,8 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 
+import numpy as np
+
 from processor.pipeline.tracking.sort_oh.libs.tracker import Sort_OH
 from processor.pipeline.tracking.i_sort_tracker import ISortTracker
 
@@ -32,6 +34,9 @@ class SortOhTracker(ISortTracker):
                                min_hits=config.getint('min_hits'),
                                iou_threshold=config.getfloat('iou_threshold'))
 
+        # Ids of the tracks returned on the last tracked frame.
+        self.__returned_ids = set()
+
     def track(self, frame_obj, detection_boxes, re_id_data):
         """Performing tracking using SORT tracking to get a tracking ID for all tracked detections.
 
@@ -52,5 +57,33 @@ class SortOhTracker(ISortTracker):
 
         # Get all tracked objects found in current frame.
         sort_detections = self.sort_oh.update(detections, (width, height))
+        self.__returned_ids = {int(box[0][4]) for box in sort_detections}
+
+        return self.parse_boxes_from_sort(sort_detections, frame_obj.shape, re_id_data)
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts the boxes of the tracks on a frame that is not detected, without aging the tracks.
+
+        Sort_OH has no predict-only step, so the Kalman filters of its trackers are advanced directly,
+        the same way as Sort.predict does. Only the tracks returned on the last tracked frame are returned.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted boxes of the tracks returned on the last tracked frame.
+        """
+        sort_detections = []
+        for tracker in reversed(self.sort_oh.trackers):
+            # Prevent the area from becoming negative.
+            if (tracker.kf.x[6] + tracker.kf.x[2]) <= 0:
+                tracker.kf.x[6] *= 0.0
+            tracker.kf.predict()
+
+            box = tracker.get_state()[0]
+            if tracker.id + 1 in self.__returned_ids and not np.any(np.isnan(box)):
+                sort_detections.append((np.concatenate((box[:4], [tracker.id + 1])),
+                                        tracker.classification, tracker.certainty))
 
         return self.parse_boxes_from_sort(sort_detections, frame_obj.shape, re_id_data)
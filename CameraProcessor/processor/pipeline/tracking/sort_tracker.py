@@ -54,3 +54,15 @@ class SortTracker(ISortTracker):
         sort_detections = self.sort.update(detections)
 
         return self.parse_boxes_from_sort(sort_detections, frame_obj.shape, re_id_data)
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts the boxes of the tracks on a frame that is not detected, without aging the tracks.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted boxes of the tracks returned on the last tracked frame.
+        """
+        return self.parse_boxes_from_sort(self.sort.predict(), frame_obj.shape, re_id_data)
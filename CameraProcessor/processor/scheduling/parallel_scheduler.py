@@ -0,0 +1,201 @@
+"""Defines the parallel scheduler class, which executes independent nodes of the graph concurrently.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from processor.scheduling.scheduler_iteration import SchedulerIteration
+
+EXECUTOR_SWITCH = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor
+}
+
+
+class ParallelScheduler:
+    """Scheduler that runs all ready nodes of the graph concurrently on an executor.
+
+    Nodes whose arguments are complete are submitted to the executor directly, so independent branches of the
+    plan run at the same time. Consecutive iterations may overlap as well: a node can start on the next iteration
+    while other nodes are still busy with the previous one. A node always runs its iterations one at a time and
+    in the order they were scheduled, so stateful components (e.g. a tracker) still see the frames in order.
+
+    The argument bookkeeping is kept per iteration inside the scheduler instead of inside the nodes,
+    so the graph has to consist of ScheduleNode objects (or nodes exposing the same attributes).
+
+    Note:
+        A process pool pickles the component together with its arguments on every call,
+        state changes of the component inside the worker process are therefore lost.
+        Only use it for plans of which the components are stateless.
+
+    Attributes:
+        start_node (ScheduleNode): Node representing the initial input node, starting point of the graph.
+        max_iterations (int): Maximum number of iterations that are executed at the same time.
+    """
+
+    def __init__(self, start_node, executor='thread', max_workers=None, max_iterations=1):
+        """Inits ParallelScheduler with a starting node and creates the executor running the components.
+
+        Args:
+            start_node (ScheduleNode): Node representing the initial input node, starting point of the graph.
+            executor (str): Type of executor used to run the components, 'thread' or 'process'.
+            max_workers (int): Maximum number of workers of the executor, None lets the executor decide.
+            max_iterations (int): Maximum number of iterations that are executed at the same time,
+                1 makes schedule_graph return once the iteration is done.
+
+        Raises:
+            NameError: The executor type is unknown.
+            ValueError: The maximum number of iterations is smaller than 1.
+        """
+        if executor not in EXECUTOR_SWITCH:
+            raise NameError(f'Executor type "{executor}" is unknown')
+        if max_iterations < 1:
+            raise ValueError('At least one iteration should be able to run')
+
+        self.start_node = start_node
+        self.max_iterations = max_iterations
+
+        self.__executor = EXECUTOR_SWITCH[executor](max_workers=max_workers)
+
+        # Guards all bookkeeping below, which is updated from the executor callbacks.
+        self.__condition = threading.Condition()
+
+        # Number of the next iteration, and the iterations that are not finished yet.
+        self.__iteration_nr = 0
+        self.__iterations = {}
+
+        # Per node whether it is running, and the iterations it is ready for.
+        self.__node_running = set()
+        self.__node_ready = {}
+
+        self.__error = None
+
+    def schedule_graph(self, inputs, global_readonly):
+        """Starts an iteration on the graph.
+
+        Assigns the input objects to the start node and submits the start node to the executor.
+        Blocks while the maximum number of iterations is running, and until the iteration is done
+        when only a single iteration may run at once.
+
+        Args:
+            inputs ([object]): list of objects passed to the starting node to start an iteration.
+            global_readonly (dict[str, object]): objects that can be used by all nodes, copied for the iteration,
+                so the caller can reuse the dictionary for the next iteration.
+
+        Raises:
+            Exception: the start node is not executable with the given inputs, or a component raised an exception.
+        """
+        with self.__condition:
+            # Wait for space for another iteration, failing early when an earlier iteration failed.
+            self.__condition.wait_for(lambda: len(self.__iterations) < self.max_iterations or self.__error)
+            self.__raise_error()
+
+            iteration = SchedulerIteration(self.__iteration_nr, dict(global_readonly))
+            self.__iteration_nr += 1
+
+            # Assign inputs to initial/start node.
+            for i, node_input in enumerate(inputs):
+                iteration.assign(self.start_node, node_input, i)
+
+            if not iteration.executable(self.start_node):
+                raise Exception('Node in queue should be executable.')
+
+            self.__iterations[iteration.number] = iteration
+            self.__ready(self.start_node, iteration)
+
+        if self.max_iterations == 1:
+            self.wait()
+
+    def wait(self):
+        """Waits until all scheduled iterations are done.
+
+        Raises:
+            Exception: a component raised an exception during one of the iterations.
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: len(self.__iterations) == 0 or self.__error)
+            self.__raise_error()
+
+    def shutdown(self):
+        """Waits for the running components and shuts down the executor."""
+        self.__executor.shutdown(wait=True)
+
+    def __raise_error(self):
+        """Raises the exception of a failed component, the scheduler can not be used anymore afterwards.
+
+        Raises:
+            Exception: a component raised an exception.
+        """
+        if self.__error is not None:
+            raise self.__error
+
+    def __ready(self, node, iteration):
+        """Marks a node as ready for an iteration and runs it once it is the turn of that iteration.
+
+        Must be called while holding the condition.
+
+        Args:
+            node (ScheduleNode): node of which all arguments are available for the iteration.
+            iteration (SchedulerIteration): iteration the node is ready for.
+        """
+        self.__node_ready.setdefault(id(node), {})[iteration.number] = (node, iteration)
+        self.__try_submit(node)
+
+    def __try_submit(self, node):
+        """Submits the node to the executor when it is idle, running the oldest iteration it is ready for.
+
+        A node becomes ready for the iterations in order, since the nodes in front of it also run in order.
+
+        Must be called while holding the condition.
+
+        Args:
+            node (ScheduleNode): node to submit.
+        """
+        node_id = id(node)
+        ready = self.__node_ready.get(node_id, {})
+        if node_id in self.__node_running or not ready:
+            return
+
+        _, iteration = ready.pop(min(ready))
+        self.__node_running.add(node_id)
+
+        arguments = iteration.arguments(node)
+        future = self.__executor.submit(node.component.execute_component(), *arguments)
+        future.add_done_callback(lambda done: self.__on_done(node, iteration, done))
+
+    def __on_done(self, node, iteration, future):
+        """Passes the output of a finished component to the next layer and submits nodes that became ready.
+
+        Args:
+            node (ScheduleNode): node whose component finished.
+            iteration (SchedulerIteration): iteration the component ran for.
+            future (Future): finished future containing the output of the component.
+        """
+        with self.__condition:
+            self.__node_running.discard(id(node))
+
+            try:
+                out = future.result()
+                iteration.finish(node)
+
+                # Assign output of component to all nodes in the next layer and run those that are ready.
+                for out_node, arg_nr in node.out_nodes:
+                    iteration.assign(out_node, out, arg_nr)
+                    if iteration.executable(out_node):
+                        self.__ready(out_node, iteration)
+
+                # The node might already be ready for the next iteration.
+                self.__try_submit(node)
+            # pylint: disable=broad-except
+            except Exception as error:
+                # Keep the first error, the waiting callers raise it.
+                self.__error = self.__error or error
+                self.__condition.notify_all()
+                return
+
+            if iteration.done():
+                del self.__iterations[iteration.number]
+                self.__condition.notify_all()
@@ -56,6 +56,20 @@ class Scheduler:
             else:
                 raise Exception('Node in queue should be executable.')
 
+    def wait(self):
+        """Waits until all scheduled iterations are done.
+
+        The sequential scheduler finishes each iteration inside schedule_graph, so there is nothing to wait for.
+        Exists so the sequential and parallel scheduler can be used interchangeably.
+        """
+
+    def shutdown(self):
+        """Releases the resources of the scheduler.
+
+        The sequential scheduler runs the nodes on the calling thread, so there is nothing to release.
+        Exists so the sequential and parallel scheduler can be used interchangeably.
+        """
+
     def notify(self, ready_nodes):
         """Queues nodes that are ready to be executed.
 
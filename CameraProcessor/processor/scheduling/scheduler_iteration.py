@@ -0,0 +1,118 @@
+"""Defines the arguments of all nodes in a single iteration of a schedule.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+
+
+class SchedulerIteration:
+    """Arguments of the nodes in a single iteration of the graph.
+
+    Used by the ParallelScheduler, which runs multiple iterations at the same time,
+    so the arguments can not be stored inside the nodes themselves.
+
+    Attributes:
+        number (int): Number of the iteration.
+        global_readonly (dict[str, object]): objects that can be used by all nodes in this iteration.
+    """
+
+    def __init__(self, number, global_readonly):
+        """Inits the iteration without any arguments.
+
+        Args:
+            number (int): Number of the iteration.
+            global_readonly (dict[str, object]): objects that can be used by all nodes in this iteration.
+        """
+        self.number = number
+        self.global_readonly = global_readonly
+
+        self.__arguments = {}
+        self.__needed_args = {}
+        self.__running = 0
+
+    def __node_arguments(self, node):
+        """Gets the arguments array of the node, creating it when the node did not get arguments yet.
+
+        Args:
+            node (ScheduleNode): node to get the arguments of.
+
+        Returns:
+            np.ndarray: arguments of the node in this iteration.
+        """
+        if id(node) not in self.__arguments:
+            self.__arguments[id(node)] = np.empty(node.input_count, dtype=object)
+            self.__needed_args[id(node)] = node.input_count - len(node.global_map)
+        return self.__arguments[id(node)]
+
+    def assign(self, node, arg, arg_nr):
+        """Store argument for the execution of the node in this iteration.
+
+        Args:
+            node (ScheduleNode): node the argument belongs to.
+            arg (object): argument to store for when the component is executed.
+            arg_nr (int): index at which the argument is stored in the arguments array.
+
+        Raises:
+            IndexError: wrong index for the argument was given.
+            Exception: argument is provided twice, existing argument would be overwritten.
+        """
+        arguments = self.__node_arguments(node)
+        if len(arguments) <= arg_nr:
+            raise IndexError(f'Index {arg_nr} too large for arguments array with size {len(arguments)}')
+        if arguments[arg_nr] is not None:
+            raise Exception('Argument should only be provided once by the scheduler, '
+                            'this indicates unnecessary execution by the scheduler.')
+
+        arguments[arg_nr] = arg
+        self.__needed_args[id(node)] -= 1
+
+    def executable(self, node):
+        """Checks whether all arguments of the node are provided in this iteration.
+
+        Args:
+            node (ScheduleNode): node to check.
+
+        Returns:
+            bool: true if all arguments have been provided, false otherwise.
+        """
+        self.__node_arguments(node)
+        return self.__needed_args[id(node)] <= 0
+
+    def arguments(self, node):
+        """Gets the complete arguments of the node, including the globals, and marks the node as running.
+
+        Args:
+            node (ScheduleNode): node that is about to run.
+
+        Returns:
+            np.ndarray: arguments to call the work function of the component with.
+        """
+        arguments = self.__node_arguments(node)
+        for key, arg_nr in node.global_map.items():
+            if key in self.global_readonly:
+                arguments[arg_nr] = self.global_readonly[key]
+
+        self.__running += 1
+        return arguments
+
+    def finish(self, node):
+        """Removes the arguments of the node once it ran in this iteration.
+
+        Args:
+            node (ScheduleNode): node that finished.
+        """
+        del self.__arguments[id(node)]
+        del self.__needed_args[id(node)]
+        self.__running -= 1
+
+    def done(self):
+        """Checks whether no node is running or ready to run in this iteration anymore.
+
+        Returns:
+            bool: whether the iteration is done.
+        """
+        return self.__running == 0 and not any(
+            needed <= 0 for needed in self.__needed_args.values()
+        )
@@ -0,0 +1,173 @@
+"""Compares the latency and detections of two detectors on the frames of a video.
+
+Used to check a faster detector backend (e.g. yolov5_onnx) against the detector it replaces (e.g. yolov5):
+run with `python -m processor.training.detection.detector_benchmark` from the CameraProcessor folder,
+the settings are in the DetectorBenchmark section of the configs.ini.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+
+import numpy as np
+
+from processor.input.video_capture import VideoCapture
+from processor.utils.config_parser import ConfigParser
+from processor.utils.create_runners import create_detector
+
+
+def iou(rectangle, other):
+    """Calculates the intersection over union of two rectangles.
+
+    Args:
+        rectangle (Rectangle): First rectangle.
+        other (Rectangle): Second rectangle.
+
+    Returns:
+        float: Intersection over union, between 0 and 1.
+    """
+    width = min(rectangle.x2, other.x2) - max(rectangle.x1, other.x1)
+    height = min(rectangle.y2, other.y2) - max(rectangle.y1, other.y1)
+    if width <= 0 or height <= 0:
+        return 0.
+
+    intersection = width * height
+    union = ((rectangle.x2 - rectangle.x1) * (rectangle.y2 - rectangle.y1)
+             + (other.x2 - other.x1) * (other.y2 - other.y1) - intersection)
+    return intersection / union
+
+
+def match_detections(baseline, candidate, iou_threshold=0.5):
+    """Greedily matches the candidate boxes to baseline boxes of the same class, best overlap first.
+
+    Args:
+        baseline (BoundingBoxes): Boxes of the reference detector.
+        candidate (BoundingBoxes): Boxes of the compared detector.
+        iou_threshold (float): Minimum intersection over union of two matched boxes.
+
+    Returns:
+        [(float, float)]: Intersection over union and certainty difference of every matched pair.
+    """
+    pairs = sorted(
+        ((iou(base.rectangle, cand.rectangle), i, j)
+         for i, base in enumerate(baseline) for j, cand in enumerate(candidate)
+         if base.classification == cand.classification),
+        reverse=True
+    )
+
+    baseline_boxes, candidate_boxes = list(baseline), list(candidate)
+    matched_baseline, matched_candidate, matches = set(), set(), []
+    for overlap, i, j in pairs:
+        if overlap < iou_threshold:
+            break
+        if i in matched_baseline or j in matched_candidate:
+            continue
+        matched_baseline.add(i)
+        matched_candidate.add(j)
+        matches.append((overlap, abs(baseline_boxes[i].certainty - candidate_boxes[j].certainty)))
+    return matches
+
+
+def summarize_latency(latencies):
+    """Summarizes the latencies of a detector.
+
+    Args:
+        latencies ([float]): Time (in s) to detect every frame.
+
+    Returns:
+        dict[str, float]: Mean, median and 95th percentile latency in ms.
+    """
+    latencies = np.asarray(latencies) * 1000
+    return {
+        'mean_ms': float(latencies.mean()),
+        'median_ms': float(np.median(latencies)),
+        'p95_ms': float(np.percentile(latencies, 95))
+    }
+
+
+def benchmark(baseline_detector, candidate_detector, frames, warmup=5, iou_threshold=0.5):
+    """Detects the frames with both detectors, timing the detections and comparing the boxes.
+
+    Args:
+        baseline_detector (IDetector): Reference detector.
+        candidate_detector (IDetector): Compared detector.
+        frames ([FrameObj]): Frames detected by both detectors.
+        warmup (int): Number of frames detected before the latency is measured.
+        iou_threshold (float): Minimum intersection over union of a candidate box with a baseline box.
+
+    Returns:
+        dict[str, object]: Latency of both detectors, the speedup and the agreement of the candidate
+            with the baseline (precision, recall, mean intersection over union and certainty difference).
+    """
+    for frame_obj in frames[:warmup]:
+        baseline_detector.detect(frame_obj)
+        candidate_detector.detect(frame_obj)
+
+    baseline_latencies, candidate_latencies = [], []
+    baseline_count, candidate_count, matches = 0, 0, []
+    for frame_obj in frames[warmup:]:
+        start = time.perf_counter()
+        baseline_boxes = baseline_detector.detect(frame_obj)
+        baseline_latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        candidate_boxes = candidate_detector.detect(frame_obj)
+        candidate_latencies.append(time.perf_counter() - start)
+
+        baseline_count += len(baseline_boxes)
+        candidate_count += len(candidate_boxes)
+        matches.extend(match_detections(baseline_boxes, candidate_boxes, iou_threshold))
+
+    baseline_latency = summarize_latency(baseline_latencies)
+    candidate_latency = summarize_latency(candidate_latencies)
+    return {
+        'frames': len(baseline_latencies),
+        'baseline': baseline_latency,
+        'candidate': candidate_latency,
+        'speedup': baseline_latency['mean_ms'] / candidate_latency['mean_ms'],
+        'precision': len(matches) / candidate_count if candidate_count > 0 else 1.,
+        'recall': len(matches) / baseline_count if baseline_count > 0 else 1.,
+        'mean_iou': float(np.mean([match[0] for match in matches])) if matches else 0.,
+        'mean_certainty_difference': float(np.mean([match[1] for match in matches])) if matches else 0.
+    }
+
+
+def main(configs):
+    """Runs the benchmark configured in the DetectorBenchmark section and prints the results.
+
+    Args:
+        configs (ConfigParser): Configurations of the detectors and the benchmark.
+    """
+    benchmark_config = configs['DetectorBenchmark']
+
+    # Decode the frames up front, so decoding is not part of the latency.
+    capture = VideoCapture(benchmark_config['source_path'])
+    frames = []
+    while capture.opened() and len(frames) < benchmark_config.getint('frames'):
+        ret, frame_obj = capture.get_next_frame()
+        if ret:
+            frames.append(frame_obj)
+    capture.close()
+
+    print(f'Instantiating {benchmark_config["baseline"]} and {benchmark_config["candidate"]}...')
+    baseline_detector = create_detector(benchmark_config['baseline'], configs)
+    candidate_detector = create_detector(benchmark_config['candidate'], configs)
+
+    results = benchmark(baseline_detector, candidate_detector, frames, benchmark_config.getint('warmup'),
+                        benchmark_config.getfloat('iou_threshold'))
+
+    print(f'Detected {results["frames"]} frames')
+    for name in ('baseline', 'candidate'):
+        latency = results[name]
+        print(f'{benchmark_config[name]}: mean {latency["mean_ms"]:.1f} ms, median {latency["median_ms"]:.1f} ms, '
+              f'p95 {latency["p95_ms"]:.1f} ms')
+    print(f'Speedup: {results["speedup"]:.2f}x')
+    print(f'Agreement with {benchmark_config["baseline"]}: precision {results["precision"]:.3f}, '
+          f'recall {results["recall"]:.3f}, mean IoU {results["mean_iou"]:.3f}, '
+          f'mean certainty difference {results["mean_certainty_difference"]:.4f}')
+
+
+if __name__ == '__main__':
+    config_parser = ConfigParser('configs.ini', True)
+    main(config_parser.configs)
@@ -12,8 +12,10 @@ import gdown
 import torch
 import torch.nn as nn
 import torchreid
+from PIL import Image
 
 from processor.utils.config_parser import ConfigParser
+from processor.pipeline.reidentification.quantization import load_quantized, read_calibration_batches
 from processor.pipeline.reidentification.torchreid.scripts.default_config import get_default_config, optimizer_kwargs, \
     engine_run_kwargs, lr_scheduler_kwargs, imagedata_kwargs, videodata_kwargs
 from processor.pipeline.reidentification.torchreid.torchreid.utils import set_random_seed, Logger, collect_env_info, \
@@ -21,7 +23,11 @@ from processor.pipeline.reidentification.torchreid.torchreid.utils import set_ra
 
 
 class AccuracyObject:
-    """Re-id accuracy class for torchreid."""
+    """Re-id accuracy class for torchreid.
+
+    When quantization is enabled in the TorchReid section, the quantized model is evaluated as well,
+    reporting how much rank-1 and mAP is lost compared to the original model.
+    """
 
     def __init__(self, config_parser_func):
         """Initializes the configurations.
@@ -30,6 +36,7 @@ class AccuracyObject:
             config_parser_func (ConfigParser): Config parser to use.
         """
         configs = config_parser_func.configs["TorchReid"]
+        self.reid_config = configs
         # The path where the model weight file should be located.
         self.weights_path = os.path.join(configs['weights_dir_path'], configs['model_name'] + '.pth')
         check_weights(configs, self.weights_path, 'osnet_x1_0')
@@ -111,7 +118,35 @@ class AccuracyObject:
             'Building {}-engine for {}-reid'.format(self.cfg.loss.name, self.cfg.data.type)
         )
         engine = build_engine(self.cfg, datamanager, model, optimizer, scheduler)
-        engine.run(**engine_run_kwargs(self.cfg))
+
+        quantization = self.reid_config.get('quantization', 'none')
+        if quantization == 'none':
+            engine.run(**engine_run_kwargs(self.cfg))
+            return
+
+        rank1, mean_ap = engine.test(**engine_test_kwargs(self.cfg))
+
+        # Evaluate the quantized model on the CPU with the same engine.
+        model = model.module if isinstance(model, nn.DataParallel) else model
+        _, transform = torchreid.data.transforms.build_transforms(
+            self.cfg.data.height, self.cfg.data.width,
+            norm_mean=self.cfg.data.norm_mean, norm_std=self.cfg.data.norm_std
+        )
+
+        # The dataset images are RGB, the calibration cutouts BGR.
+        quantized = load_quantized(
+            model, quantization, self.weights_path,
+            lambda: read_calibration_batches(self.reid_config,
+                                             lambda cutout: transform(Image.fromarray(cutout[:, :, ::-1])))
+        )
+        engine.model = quantized
+        engine.register_model('model', quantized, optimizer, scheduler)
+        engine.use_gpu = False
+        quantized_rank1, quantized_mean_ap = engine.test(**engine_test_kwargs(self.cfg))
+
+        print(f'Quantization ({quantization}): rank-1 {rank1:.1%} -> {quantized_rank1:.1%} '
+              f'({quantized_rank1 - rank1:+.1%}), mAP {mean_ap:.1%} -> {quantized_mean_ap:.1%} '
+              f'({quantized_mean_ap - mean_ap:+.1%})')
 
 
 def check_weights(config_file, weights_path_str, weights_name):
@@ -136,6 +171,20 @@ def check_weights(config_file, weights_path_str, weights_name):
         gdown.download(url, weights_path_str, quiet=False)
 
 
+def engine_test_kwargs(cfg):
+    """Gets the keyword arguments of the evaluation of the engine.
+
+    Args:
+        cfg (CfgNode): Config.
+
+    Returns:
+        dict[str, object]: The evaluation arguments of the engine run arguments.
+    """
+    kwargs = engine_run_kwargs(cfg)
+    return {key: kwargs[key] for key in ('save_dir', 'dist_metric', 'normalize_feature', 'visrank', 'visrank_topk',
+                                         'use_metric_cuhk03', 'ranks', 'rerank')}
+
+
 def check_cfg(cfg):
     """Checks the cfg for some sort of error.
 
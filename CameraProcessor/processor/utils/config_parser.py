@@ -102,6 +102,13 @@ class ConfigParser:
             logging.info('Environment variable: HLS_STREAM_URL used.')
             self.configs['Input']['hls_url'] = hls_stream_url
 
+        # The regions of interest differ per camera, so they enable detecting only these regions.
+        roi_polygons = os.getenv('ROI_POLYGONS')
+        if roi_polygons is not None and self.configs.has_section('RegionOfInterest'):
+            logging.info('Environment variable: ROI_POLYGONS used.')
+            self.configs['RegionOfInterest']['polygons'] = roi_polygons
+            self.configs['RegionOfInterest']['enabled'] = 'true'
+
     @staticmethod
     def __parse_int_tuple(item):
         """Converter for parsing a tuple.
@@ -6,19 +6,25 @@ Utrecht University within the Software Project course.
 """
 
 from processor.pipeline.detection.yolov5_detector import Yolov5Detector
+from processor.pipeline.detection.yolov5_onnx_detector import Yolov5OnnxDetector
 from processor.pipeline.detection.yolor_detector import YolorDetector
+from processor.pipeline.detection.remote_detector import RemoteDetector
 from processor.pipeline.tracking.sort_tracker import SortTracker
 from processor.pipeline.tracking.sort_oh_tracker import SortOhTracker
+from processor.pipeline.tracking.batch_sort_tracker import BatchSortTracker
 from processor.pipeline.reidentification.torch_re_identifier import TorchReIdentifier
 from processor.pipeline.reidentification.fast_re_identifier import FastReIdentifier
 
 DETECTOR_SWITCH = {
     'yolov5': (Yolov5Detector, 'Yolov5'),
-    'yolor': (YolorDetector, 'Yolor')
+    'yolov5_onnx': (Yolov5OnnxDetector, 'Yolov5Onnx'),
+    'yolor': (YolorDetector, 'Yolor'),
+    'remote': (RemoteDetector, 'DetectionServer')
 }
 TRACKER_SWITCH = {
     'sort': (SortTracker, 'SORT'),
-    'sort_oh': (SortOhTracker, 'SORT')
+    'sort_oh': (SortOhTracker, 'SORT'),
+    'batch_sort': (BatchSortTracker, 'SORT')
 }
 REID_SWITCH = {
     'torchreid': (TorchReIdentifier, 'TorchReid'),
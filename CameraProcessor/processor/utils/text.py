@@ -7,6 +7,10 @@ Utrecht University within the Software Project course.
 
 import json
 
+import numpy as np
+
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
+
 
 def feature_map_to_json(feature_map=None, object_id=None):
     """Sends a feature_map to the orchestrator.
@@ -39,10 +43,26 @@ def bounding_boxes_to_dict(bounding_boxes, timestamp):
     return {
         'type': 'boundingBoxes',
         'frameId': timestamp,
-        'boxes': [bounding_box_to_dict(bounding_box) for bounding_box in bounding_boxes],
+        'boxes': bounding_boxes_to_dicts(bounding_boxes),
     }
 
 
+def bounding_boxes_to_dicts(bounding_boxes):
+    """Converts all bounding boxes to dict format according to API format.
+
+    The boxes of an ArrayBoundingBoxes are converted from its columns at once.
+
+    Args:
+        bounding_boxes (BoundingBoxes): boxes that get converted.
+
+    Returns:
+        [dict]: Representation of every BoundingBox object.
+    """
+    if isinstance(bounding_boxes, ArrayBoundingBoxes):
+        return bounding_boxes.to_dicts()
+    return [bounding_box_to_dict(bounding_box) for bounding_box in bounding_boxes]
+
+
 def bounding_box_to_dict(bounding_box):
     """Converts the bounding_box to dict format according to API format.
 
@@ -83,7 +103,7 @@ def boxes_to_accuracy_json(bounding_boxes, image_id):
       """
     return json.dumps({
         'imageId': image_id,
-        'boxes': [bounding_box_to_dict(bounding_box) for bounding_box in bounding_boxes],
+        'boxes': bounding_boxes_to_dicts(bounding_boxes),
     })
 
 
@@ -98,6 +118,9 @@ def boxes_to_txt(bounding_boxes, shape, frame_nr):
     Returns:
         str: Boxes in string format with comma separation
     """
+    if isinstance(bounding_boxes, ArrayBoundingBoxes):
+        return array_boxes_to_txt(bounding_boxes, shape, frame_nr)
+
     boxes_text_string = ""
     width, height = shape
 
@@ -111,3 +134,29 @@ def boxes_to_txt(bounding_boxes, shape, frame_nr):
             f'1,1,{"%.2f" % round(float(bounding_box.certainty), 2)} \n'  # certainty rounded to two decimals
 
     return boxes_text_string
+
+
+def array_boxes_to_txt(bounding_boxes, shape, frame_nr):
+    """Write the columns of the bounding boxes to the txt format of boxes_to_txt, converting all boxes at once.
+
+    Args:
+        bounding_boxes (ArrayBoundingBoxes): columns of the bounding boxes.
+        shape (int, int): shape of frame.
+        frame_nr (int): number of frame.
+
+    Returns:
+        str: Boxes in string format with comma separation
+    """
+    width, height = shape
+    rects = bounding_boxes.rects
+
+    # Top left corner, width and height in pixels.
+    pixels = np.stack([rects[:, 0] * width, rects[:, 1] * height,
+                       (rects[:, 2] - rects[:, 0]) * width, (rects[:, 3] - rects[:, 1]) * height], axis=1)
+    pixels = np.trunc(pixels).astype(int)
+
+    return ''.join(
+        f'{frame_nr},{identifier},{x},{y},{box_width},{box_height},1,1,{"%.2f" % round(certainty, 2)} \n'
+        for identifier, (x, y, box_width, box_height), certainty
+        in zip(bounding_boxes.identifiers.tolist(), pixels.tolist(), bounding_boxes.certainties.tolist())
+    )
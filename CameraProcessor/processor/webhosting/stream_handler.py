@@ -12,7 +12,7 @@ import tornado.gen
 import cv2
 
 import processor.utils.display as display
-from processor.pipeline.process_frames import process_stream
+from processor.pipeline.process_frames import get_stream_processor
 from processor.pipeline.prepare_pipeline import prepare_objects
 
 # Tornado example gotten from: https://github.com/wildfios/Tornado-mjpeg-streamer-python.
@@ -55,6 +55,7 @@ class StreamHandler(tornado.web.RequestHandler):
 
         # Get the objects needed for process_stream and starts the function.
         capture, detector, tracker, re_identifier, _ = prepare_objects(self.configs)
+        process_stream = get_stream_processor(self.configs['Main'])
         yield process_stream(capture, detector, tracker, re_identifier, self.__frame_processed, None)
 
         # Close capture and send response.
@@ -9,7 +9,6 @@ import base64
 import cv2
 import numpy as np
 
-from processor.utils.features import slice_bounding_box
 from processor.websocket.i_message import IMessage
 
 
@@ -129,9 +128,7 @@ class StartMessage(IMessage):
 
         if self.__frame_id is not None and self.__box_id is not None:
             try:
-                stored_frame = framebuffer.get_frame(self.__frame_id).frame
-                stored_box = framebuffer.get_box(self.__frame_id, self.__box_id)
-                self.__cutout = slice_bounding_box(stored_box, stored_frame)
+                self.__cutout = framebuffer.get_cutout(self.__frame_id, self.__box_id)
                 return self.__cutout
             # Frame could not be found in the frame buffer, it was probably too small.
             except IndexError as index_error:
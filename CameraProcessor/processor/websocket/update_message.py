@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import numpy as np
 
 from processor.websocket.i_message import IMessage
 
@@ -13,22 +14,30 @@ class UpdateMessage(IMessage):
     def __init__(self, object_id, feature_map):
         """Constructor for the UpdateMessage class.
 
+        Feature maps are kept as array until the message is converted to JSON.
+
         Args:
             object_id (int): Identifier of the object that should be followed.
-            feature_map ([float]): Feature map of the object that should be followed.
+            feature_map (np.ndarray or [float]): Feature map of the object that should be followed.
 
         Raises:
             TypeError: object_id is not an integer.
-                       feature_map should be a list of floats.
+                       feature_map should be a list of floats or a one dimensional float array.
             AttributeError: feature_map does not contain elements.
         """
         if not isinstance(object_id, int):
             raise TypeError('Object id should be an integer')
-        if not isinstance(feature_map, list):
+        if isinstance(feature_map, np.ndarray):
+            if feature_map.ndim != 1 or not np.issubdtype(feature_map.dtype, np.floating):
+                raise TypeError(f'feature_map is not a one dimensional float array but {feature_map.dtype} '
+                                f'with shape {feature_map.shape}')
+            if feature_map.size == 0:
+                raise AttributeError('feature_map array is empty')
+        elif not isinstance(feature_map, list):
             raise TypeError(f'feature_map is not a list but {type(feature_map)}')
-        if not feature_map:
+        elif not feature_map:
             raise AttributeError('feature_map list is empty')
-        if not isinstance(feature_map[-1], float):
+        elif not isinstance(feature_map[-1], float):
             raise TypeError(f'feature_map contains other than a float, namely: {type(feature_map[-1])}')
 
         self.__object_id = object_id
@@ -67,7 +76,9 @@ class UpdateMessage(IMessage):
         return {
             'type': 'featureMap',
             'objectId': self.__object_id,
-            'featureMap': self.__feature_map
+            # Arrays are only converted to lists of floats here, since JSON has no array type.
+            'featureMap': self.__feature_map.tolist()
+            if isinstance(self.__feature_map, np.ndarray) else self.__feature_map
         }
 
     @property
@@ -84,7 +95,7 @@ class UpdateMessage(IMessage):
         """Get feature map.
 
         Returns:
-            ([float]): Feature map of the object.
+            (np.ndarray or [float]): Feature map of the object.
         """
         return self.__feature_map
 
@@ -98,7 +109,7 @@ class UpdateMessage(IMessage):
             bool: Whether the messages are the same.
         """
         return (self.__object_id == other.object_id
-                and self.__feature_map == other.feature_map)
+                and np.array_equal(self.__feature_map, other.feature_map))
 
     def __repr__(self):
         """Converts the UpdateMessage to a string.
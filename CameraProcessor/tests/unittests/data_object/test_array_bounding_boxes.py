@@ -0,0 +1,97 @@
+"""Tests the columnar bounding boxes object.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes, NO_OBJECT_ID
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.utils.text import bounding_box_to_dict
+
+
+# pylint: disable=attribute-defined-outside-init
+class TestArrayBoundingBoxes:
+    """Tests array_bounding_boxes.py.
+
+    Attributes:
+        box_list (BoundingBoxes): Bounding boxes stored as a list of BoundingBox objects.
+        boxes (ArrayBoundingBoxes): The same bounding boxes stored as columns.
+    """
+
+    def setup_method(self):
+        """Sets up the bounding boxes for unit testing."""
+        self.box_list = BoundingBoxes([
+            BoundingBox(1, Rectangle(0, 0, 0.5, 0.5), 'person', 0.5),
+            BoundingBox(2, Rectangle(0.25, 0.5, 1, 1), 'car', 0.75, object_id=7),
+            BoundingBox(3, Rectangle(0.1, 0.2, 0.3, 0.4), 'person', 0.9)
+        ], 'test')
+        self.boxes = ArrayBoundingBoxes.from_bounding_boxes(self.box_list)
+
+    def test_columns(self):
+        """Tests that the columns contain the values of the boxes."""
+        assert self.boxes.image_id == 'test'
+        assert np.array_equal(self.boxes.rects, [[0, 0, 0.5, 0.5], [0.25, 0.5, 1, 1], [0.1, 0.2, 0.3, 0.4]])
+        assert list(self.boxes.identifiers) == [1, 2, 3]
+        assert self.boxes.classifications == ['person', 'car', 'person']
+        assert list(self.boxes.class_indices) == [0, 1, 0]
+        assert list(self.boxes.certainties) == [0.5, 0.75, 0.9]
+        assert list(self.boxes.object_ids) == [NO_OBJECT_ID, 7, NO_OBJECT_ID]
+
+    def test_compatible(self):
+        """Tests that iterating, len and equality work the same as for BoundingBoxes."""
+        assert len(self.boxes) == 3
+        assert list(self.boxes) == list(self.box_list)
+        assert self.boxes == self.box_list
+        assert self.boxes.bounding_boxes[1].object_id == 7
+        assert self.boxes.bounding_boxes[0].object_id is None
+
+    def test_empty(self):
+        """Tests bounding boxes without any box."""
+        boxes = ArrayBoundingBoxes(np.empty((0, 4)), [], [], [])
+        assert len(boxes) == 0
+        assert not list(boxes)
+        assert not boxes.to_dicts()
+
+    def test_set_object_id(self):
+        """Tests that setting the object id updates the column and the box objects."""
+        assert self.boxes.bounding_boxes[0].object_id is None
+        self.boxes.set_object_id(0, 4)
+        assert self.boxes.object_ids[0] == 4
+        assert self.boxes.bounding_boxes[0].object_id == 4
+
+        self.box_list.set_object_id(0, 4)
+        assert self.boxes == self.box_list
+
+    def test_select(self):
+        """Tests selecting a subset of the boxes with a mask."""
+        people = self.boxes.select(self.boxes.class_indices == 0)
+        assert list(people.identifiers) == [1, 3]
+        assert people.classifications == ['person', 'person']
+
+    def test_to_dicts(self):
+        """Tests that the dicts are the same as those of bounding_box_to_dict."""
+        assert self.boxes.to_dicts() == [bounding_box_to_dict(box) for box in self.box_list]
+
+    @pytest.mark.parametrize('rect', [[0.5, 0, 0.4, 1], [0, 0.5, 1, 0.4], [-0.1, 0, 1, 1], [0, 0, 1, 1.1]])
+    def test_invalid_rect(self, rect):
+        """Tests that invalid rectangles are rejected, like Rectangle does.
+
+        Args:
+            rect ([float]): invalid rectangle.
+        """
+        with pytest.raises(ValueError):
+            ArrayBoundingBoxes([rect], [1], [0], [0.5], class_names=['person'])
+
+    def test_column_lengths(self):
+        """Tests that all columns need a value for every box."""
+        with pytest.raises(ValueError):
+            ArrayBoundingBoxes([[0, 0, 1, 1]], [1, 2], [0], [0.5], class_names=['person'])
+
+
+if __name__ == '__main__':
+    pytest.main(TestArrayBoundingBoxes)
@@ -51,6 +51,13 @@ class TestBoundingBox:
         """Tests the __repr__ function."""
         assert str(self.box1).startswith('BoundingBox(')
 
+    def test_immutable(self):
+        """Tests that a bounding box can not be changed."""
+        with pytest.raises(AttributeError):
+            self.box1.object_id = 3
+        with pytest.raises(AttributeError):
+            self.box1.frame = 3  # pylint: disable=assigning-non-slot
+
 
 if __name__ == '__main__':
     pytest.main(TestBoundingBox)
@@ -36,6 +36,8 @@ class TestFrameObj:
         assert numpy.all(self.frame == self.frame1.frame)
         assert self.timestamp == self.frame1.timestamp
         assert self.shape == self.frame1.shape
+        assert self.frame1.received is None
+        assert FrameObj(self.frame, self.timestamp, 12.5).received == 12.5
 
     def test_repr(self):
         """Tests the __repr__ function."""
@@ -63,6 +63,19 @@ class TestRectangle:
         with pytest.raises(ValueError):
             Rectangle(0.5, 0.5, 0.1, 0.1)
 
+    def test_skip_validation(self):
+        """Tests that the coordinates are not checked when validation is skipped."""
+        rectangle = Rectangle(0.5, 0.5, 0.1, 1.1, validate=False)
+        assert rectangle.x2 == 0.1
+        assert rectangle.y2 == 1.1
+
+    def test_immutable(self):
+        """Tests that the coordinates of a rectangle can not be changed."""
+        with pytest.raises(AttributeError):
+            self.data.x1 = 0.5
+        with pytest.raises(AttributeError):
+            self.data.x3 = 0.5  # pylint: disable=assigning-non-slot
+
 
 if __name__ == '__main__':
     pytest.main(TestRectangle)
@@ -6,38 +6,38 @@ Utrecht University within the Software Project course.
 """
 import os.path
 
-from tests.conftest import root_path
 from processor.data_writer.json_data_writer import JsonDataWriter
 
 
 class TestJsonDataWriter:
     """Class for testing the MOT DataWriter."""
 
-    def test_writer(self, bounding_boxes_object_dict):
+    def test_writer(self, bounding_boxes_object_dict, tmp_path):
         """A function that tests all the functionality of the json DataWriter.
 
         Args:
             bounding_boxes_object_dict ({image_id: BoundingBoxes}): A dict containing bounding_boxes.
+            tmp_path (Path): Temporary folder the file is written to.
 
         Returns:
 
         """
-        written_file = self.write(bounding_boxes_object_dict)
+        written_file = self.write(bounding_boxes_object_dict, tmp_path)
         self.written_correctly(written_file)
 
     @staticmethod
-    def write(bboxes_dict):
+    def write(bboxes_dict, dest_dir):
         """Method for writing all detections to the file using the json datawriter.
 
         Args:
             bboxes_dict ({image_id: BoundingBoxes}): A dict containing bounding_boxes.
+            dest_dir (Path): Folder the file is written to.
 
         Returns:
             A file where the detections are written to.
 
         """
-        dest_path = os.path.realpath(os.path.join(root_path, 'data', 'tests',
-                                                  'unittests', 'data_writer_tests', 'json_data_writer'))
+        dest_path = os.path.join(dest_dir, 'json_data_writer')
         data_writer = JsonDataWriter(dest_path)
         for key in bboxes_dict.keys():
             data_writer.write(bboxes_dict[key], [1, 1])
@@ -6,37 +6,54 @@ Utrecht University within the Software Project course.
 """
 import os.path
 
-from tests.conftest import root_path
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
 from processor.data_writer.mot_data_writer import MotDataWriter
 
 
 class TestMotDataWriter:
     """Class for testing the MOT DataWriter."""
-    def test_writer(self, bounding_boxes_object_dict):
+    def test_writer(self, bounding_boxes_object_dict, tmp_path):
         """A function that tests all the functionality of the MOT DataWriter
 
         Args:
             bounding_boxes_object_dict ({image_id: BoundingBoxes}): A dict containing bounding_boxes
+            tmp_path (Path): Temporary folder the file is written to.
 
         Returns:
 
         """
-        written_file = self.write(bounding_boxes_object_dict)
+        written_file = self.write(bounding_boxes_object_dict, tmp_path)
         self.written_correctly(written_file)
 
+    def test_array_writer(self, bounding_boxes_object_dict, tmp_path):
+        """Tests whether boxes stored as columns are written the same as a list of boxes.
+
+        Args:
+            bounding_boxes_object_dict ({image_id: BoundingBoxes}): A dict containing bounding_boxes
+            tmp_path (Path): Temporary folder the files are written to.
+        """
+        array_dict = {image_id: ArrayBoundingBoxes.from_bounding_boxes(bounding_boxes)
+                      for image_id, bounding_boxes in bounding_boxes_object_dict.items()}
+
+        with self.write(bounding_boxes_object_dict, tmp_path) as written_file:
+            expected = written_file.read()
+        with self.write(array_dict, tmp_path / 'array') as written_file:
+            assert written_file.read() == expected
+
     @staticmethod
-    def write(bboxes_dict):
+    def write(bboxes_dict, dest_dir):
         """Method for writing all detections to the file using the MOT datawriter.
 
         Args:
             bboxes_dict ({image_id: BoundingBoxes}): A dict containing bounding_boxes.
+            dest_dir (Path): Folder the file is written to.
 
         Returns:
             A file where the detections are written to.
 
         """
-        dest_path = os.path.realpath(os.path.join(root_path, 'data', 'tests',
-                                                  'unittests', 'data_writer_tests', 'mot_data_writer'))
+        os.makedirs(dest_dir, exist_ok=True)
+        dest_path = os.path.join(dest_dir, 'mot_data_writer')
         data_writer = MotDataWriter(dest_path)
         for key in bboxes_dict.keys():
             data_writer.write(bboxes_dict[key], [1, 1])
@@ -4,6 +4,8 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import time
+
 import pytest
 
 from processor.input.hls_capture import HlsCapture
@@ -46,8 +48,12 @@ class TestCaptures:
         """
         self.capture = capture_implementation()
 
-        while not self.capture.get_next_frame()[0]:
-            pass
+        ret, frame_obj = self.capture.get_next_frame()
+        while not ret:
+            ret, frame_obj = self.capture.get_next_frame()
+
+        # The frame is stamped with the time it was read, so the time it waited can be measured.
+        assert frame_obj.received <= time.monotonic()
 
     @pytest.mark.timeout(60)
     def test_closed(self, capture_implementation):
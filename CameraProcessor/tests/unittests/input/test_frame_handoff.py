@@ -0,0 +1,91 @@
+"""Tests the handoff of frames from a reading thread to the processing thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.input.frame_handoff import FrameHandoff
+
+
+def create_frame(timestamp):
+    """Creates a small frame.
+
+    Args:
+        timestamp (float): timestamp of the frame.
+
+    Returns:
+        FrameObj: frame with the timestamp.
+    """
+    return FrameObj(np.zeros((2, 2, 3), dtype=np.uint8), timestamp)
+
+
+class TestFrameHandoff:
+    """Tests frame_handoff.py."""
+
+    def test_latest(self):
+        """Tests that only the newest frame is kept in latest mode, counting the dropped frames."""
+        handoff = FrameHandoff('latest')
+        for i in range(3):
+            handoff.publish(create_frame(i))
+
+        assert handoff.take().timestamp == 2
+        assert handoff.take() is None
+        assert handoff.dropped_frames == 2
+
+    def test_every(self):
+        """Tests that all frames are kept in order in every mode, up to the maximum."""
+        handoff = FrameHandoff('every', max_frames=3)
+        for i in range(5):
+            handoff.publish(create_frame(i))
+
+        assert [handoff.take().timestamp for _ in range(3)] == [2, 3, 4]
+        assert handoff.take() is None
+        assert handoff.dropped_frames == 2
+
+    @pytest.mark.timeout(5)
+    def test_wait_for_frame(self):
+        """Tests that wait blocks until a frame is published by another thread."""
+        handoff = FrameHandoff()
+        threading.Timer(0.1, lambda: handoff.publish(create_frame(1))).start()
+
+        start = time.monotonic()
+        assert handoff.wait(2)
+        assert time.monotonic() - start < 1
+        assert handoff.take().timestamp == 1
+
+    def test_wait_timeout(self):
+        """Tests that wait returns without a frame once the timeout passed."""
+        handoff = FrameHandoff()
+        start = time.monotonic()
+        assert not handoff.wait(0.05)
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.timeout(5)
+    def test_close_wakes_up(self):
+        """Tests that closing wakes up a waiting consumer."""
+        handoff = FrameHandoff()
+        threading.Timer(0.1, handoff.close).start()
+        assert not handoff.wait()
+
+    def test_clear(self):
+        """Tests that clear drops the available frames."""
+        handoff = FrameHandoff('every')
+        handoff.publish(create_frame(1))
+        handoff.clear()
+        assert not handoff.wait(0)
+
+    def test_invalid_mode(self):
+        """Tests that unknown frame modes are rejected."""
+        with pytest.raises(ValueError):
+            FrameHandoff('oldest')
+
+
+if __name__ == '__main__':
+    pytest.main(TestFrameHandoff)
@@ -0,0 +1,33 @@
+"""Tests the default waiting behaviour of the capture interface.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from tests.unittests.utils.counting_capture import CountingCapture
+
+
+class TestICapture:
+    """Tests i_capture.py."""
+
+    def test_wait_for_frame(self):
+        """Tests that captures reading on demand do not wait."""
+        assert CountingCapture(1).wait_for_frame(10)
+
+    @pytest.mark.asyncio
+    async def test_get_next_frame_async(self):
+        """Tests that the awaitable variant returns the frames of the capture."""
+        capture = CountingCapture(2)
+
+        ret, frame_obj = await capture.get_next_frame_async()
+        assert ret
+        assert frame_obj.frame[0, 0] == 1
+
+        ret, frame_obj = await capture.get_next_frame_async()
+        assert frame_obj.frame[0, 0] == 2
+
+
+if __name__ == '__main__':
+    pytest.main(TestICapture)
@@ -0,0 +1,128 @@
+"""Tests the prefetching capture wrapper.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import asyncio
+import os
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from processor.input.image_capture import ImageCapture
+from processor.input.prefetch_capture import PrefetchCapture
+from tests.unittests.utils.counting_capture import CountingCapture
+
+
+def read_all(capture):
+    """Reads all frames of a capture.
+
+    Args:
+        capture (ICapture): capture to read.
+
+    Returns:
+        [FrameObj]: all frames of the capture.
+    """
+    frames = []
+    while capture.opened():
+        ret, frame_obj = capture.get_next_frame()
+        if ret:
+            frames.append(frame_obj)
+    return frames
+
+
+class TestPrefetchCapture:
+    """Tests prefetch_capture.py."""
+
+    @pytest.mark.timeout(10)
+    def test_all_frames_in_order(self):
+        """Tests that all frames of the capture are returned, in order."""
+        capture = PrefetchCapture(CountingCapture(20), buffer_size=4)
+        frames = read_all(capture)
+
+        assert [int(frame_obj.frame[0, 0]) for frame_obj in frames] == list(range(1, 21))
+        assert not capture.get_next_frame()[0]
+        capture.close()
+
+    @pytest.mark.timeout(10)
+    def test_bounded_buffer(self):
+        """Tests that the reading thread stops reading ahead when the buffer is full."""
+        counting_capture = CountingCapture(100)
+        capture = PrefetchCapture(counting_capture, buffer_size=4)
+        time.sleep(0.3)
+
+        # The buffer and the frame waiting to be put in it.
+        assert counting_capture.frames_read <= 5
+        capture.close()
+        assert counting_capture.closed
+        assert not capture.opened()
+        assert not capture.get_next_frame()[0]
+
+    @pytest.mark.timeout(10)
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_image_folder(self, tmp_path, workers):
+        """Tests that the images of a folder are decoded in order by the pool.
+
+        Args:
+            tmp_path (Path): temporary folder for the images.
+            workers (int): number of decoding threads.
+        """
+        for i in range(12):
+            cv2.imwrite(os.path.join(tmp_path, f'{i:06}.png'), np.full((4, 4, 3), i * 10, dtype=np.uint8))
+
+        capture = PrefetchCapture(ImageCapture(str(tmp_path)), buffer_size=3, workers=workers)
+        frames = read_all(capture)
+
+        assert [int(frame_obj.frame[0, 0, 0]) for frame_obj in frames] == [i * 10 for i in range(12)]
+        capture.close()
+
+    @pytest.mark.timeout(10)
+    def test_wait_for_frame(self):
+        """Tests that waiting returns once a frame is decoded, and without waiting once all frames are read."""
+        capture = PrefetchCapture(CountingCapture(3), buffer_size=2)
+        for i in range(1, 4):
+            assert capture.wait_for_frame(5)
+            assert int(capture.get_next_frame()[1].frame[0, 0]) == i
+
+        # The end of the capture is returned without waiting.
+        assert capture.wait_for_frame(5)
+        assert not capture.get_next_frame()[0]
+
+        start = time.monotonic()
+        assert not capture.wait_for_frame(5)
+        assert time.monotonic() - start < 1
+        capture.close()
+
+    @pytest.mark.timeout(10)
+    def test_get_next_frame_async(self):
+        """Tests that all frames are returned in order when waiting for them off the event loop."""
+        capture = PrefetchCapture(CountingCapture(10), buffer_size=4)
+
+        async def read_all_async():
+            """Reads all frames of the capture without blocking the event loop.
+
+            Returns:
+                [FrameObj]: all frames of the capture.
+            """
+            frames = []
+            while capture.opened():
+                ret, frame_obj = await capture.get_next_frame_async(5)
+                if ret:
+                    frames.append(frame_obj)
+            return frames
+
+        frames = asyncio.run(read_all_async())
+        assert [int(frame_obj.frame[0, 0]) for frame_obj in frames] == list(range(1, 11))
+        capture.close()
+
+    def test_invalid_buffer_size(self):
+        """Tests that the buffer should hold at least one frame."""
+        with pytest.raises(ValueError):
+            PrefetchCapture(CountingCapture(1), buffer_size=0)
+
+
+if __name__ == '__main__':
+    pytest.main(TestPrefetchCapture)
@@ -0,0 +1,74 @@
+"""Tests the detection batcher, which combines frames of multiple threads into batches.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.detection_batcher import DetectionBatcher
+from tests.unittests.utils.fake_batch_detector import FakeBatchDetector
+
+
+class TestDetectionBatcher:
+    """Tests detection_batcher.py."""
+    def test_invalid_batch_size(self):
+        """Tests whether an empty batch size raises an error."""
+        with pytest.raises(ValueError):
+            DetectionBatcher(FakeBatchDetector(), max_batch_size=0)
+
+    def test_detect(self):
+        """Tests whether a single frame gets its own detections."""
+        batcher = DetectionBatcher(FakeBatchDetector(), max_wait=0)
+
+        bounding_boxes = batcher.detect(FrameObj(np.zeros((4, 4, 3)), 0.5))
+        batcher.stop()
+
+        assert bounding_boxes.bounding_boxes[0].certainty == 0.5
+
+    def test_detect_batch(self):
+        """Tests whether frames are combined into batches of at most the maximum batch size."""
+        detector = FakeBatchDetector()
+        batcher = DetectionBatcher(detector, max_batch_size=4, max_wait=1)
+
+        # Detections are scattered back in the order of the frames.
+        frame_objs = [FrameObj(np.zeros((4, 4, 3)), i) for i in range(10)]
+        batch_bounding_boxes = batcher.detect_batch(frame_objs)
+        batcher.stop()
+
+        certainties = [bounding_boxes.bounding_boxes[0].certainty for bounding_boxes in batch_bounding_boxes]
+        assert certainties == list(range(10))
+        assert detector.batch_sizes == [4, 4, 2]
+
+    def test_detect_multiple_threads(self):
+        """Tests whether frames of multiple threads are scattered back to the thread they came from."""
+        detector = FakeBatchDetector()
+        batcher = DetectionBatcher(detector, max_batch_size=8, max_wait=0.05)
+
+        # Every thread acts as a camera processor detecting a single frame.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: batcher.detect(FrameObj(np.zeros((4, 4, 3)), i)), range(16)))
+        batcher.stop()
+
+        assert [bounding_boxes.bounding_boxes[0].certainty for bounding_boxes in results] == list(range(16))
+        assert sum(detector.batch_sizes) == 16
+        assert len(detector.batch_sizes) < 16
+
+    def test_detect_error(self):
+        """Tests whether an exception of the detector is raised by the caller of the failed batch."""
+        batcher = DetectionBatcher(FakeBatchDetector(), max_wait=0)
+
+        with pytest.raises(ValueError):
+            batcher.detect(FrameObj(np.zeros((4, 4, 3)), -1))
+
+        # The batcher keeps running after a failed batch.
+        assert batcher.detect(FrameObj(np.zeros((4, 4, 3)), 1)).bounding_boxes[0].certainty == 1
+        batcher.stop()
+
+
+if __name__ == '__main__':
+    pytest.main(TestDetectionBatcher)
@@ -0,0 +1,78 @@
+"""Tests the detection server together with the remote detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+from configparser import ConfigParser
+
+import numpy as np
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.detection_batcher import DetectionBatcher
+from processor.pipeline.detection.detection_server import DetectionServer, parse_address, parse_authkey
+from processor.pipeline.detection.remote_detector import RemoteDetector
+from tests.unittests.utils.fake_batch_detector import FakeBatchDetector
+
+
+class TestDetectionServer:
+    """Tests detection_server.py and remote_detector.py."""
+    def test_parse_address(self):
+        """Tests whether TCP addresses and local socket paths are parsed."""
+        assert parse_address('localhost:50100') == ('localhost', 50100)
+        assert parse_address('/tmp/detection.sock') == '/tmp/detection.sock'
+        assert parse_authkey('secret') == b'secret'
+        assert parse_authkey(None) is None
+
+    def test_tcp_requires_authkey(self, tmp_path):
+        """Tests whether a TCP socket is refused without authentication key, and a local socket is allowed.
+
+        Args:
+            tmp_path (Path): Temporary directory containing the local socket.
+        """
+        with pytest.raises(ValueError):
+            DetectionServer(FakeBatchDetector(), ('localhost', 0), parse_authkey(''))
+
+        server = DetectionServer(FakeBatchDetector(), str(tmp_path / 'detection.sock'))
+        server.close()
+
+    @pytest.mark.timeout(60)
+    def test_remote_detect(self, tmp_path):
+        """Tests whether frames of multiple remote detectors are detected by a single server.
+
+        Args:
+            tmp_path (Path): Temporary directory containing the local socket.
+        """
+        detector = FakeBatchDetector()
+        batcher = DetectionBatcher(detector, max_wait=0)
+        address = str(tmp_path / 'detection.sock')
+        server = DetectionServer(batcher, address, b'secret')
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+
+        configs = ConfigParser()
+        configs.read_dict({'DetectionServer': {'address': address, 'authkey': 'secret', 'max_frame_size': '8'}})
+        remote_detectors = [RemoteDetector(configs['DetectionServer'], None) for _ in range(2)]
+
+        # Frames larger than the maximum frame size get downscaled, the timestamp is kept.
+        for i, remote_detector in enumerate(remote_detectors):
+            bounding_boxes = remote_detector.detect(FrameObj(np.zeros((32, 16, 3), dtype=np.uint8), i))
+            assert bounding_boxes.bounding_boxes[0].certainty == i
+
+        # Exceptions of the detector are raised by the remote detector.
+        with pytest.raises(ValueError):
+            remote_detectors[0].detect(FrameObj(np.zeros((4, 4, 3), dtype=np.uint8), -1))
+
+        for remote_detector in remote_detectors:
+            remote_detector.close()
+        server.close()
+        server_thread.join()
+        batcher.stop()
+
+        assert sum(detector.batch_sizes) == 3
+
+
+if __name__ == '__main__':
+    pytest.main(TestDetectionServer)
@@ -0,0 +1,94 @@
+"""Tests the conversion of the predictions of the YOLO detectors to bounding boxes.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import configparser
+
+import numpy as np
+import pytest
+import torch
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.i_yolo_detector import IYoloDetector
+
+
+class TestIYoloDetector:
+    """Tests i_yolo_detector.py."""
+    def setup_method(self):
+        """Creates predictions of a frame, sorted on confidence like the output of the non-maximum suppression."""
+        # pylint: disable=attribute-defined-outside-init
+        self.names = ['person', 'bicycle', 'car', 'dog']
+        self.frame_obj = FrameObj(np.zeros((360, 640, 3), dtype=np.uint8), 0)
+
+        # The image has the shape of the frame, so the coordinates are not rescaled.
+        self.img = torch.zeros(1, 3, 360, 640)
+        self.det = torch.tensor([
+            [10.2, 20.0, 110.0, 220.0, 0.9, 0.],
+            [300.0, 40.0, 340.0, 80.0, 0.8, 2.],
+            [0.0, 0.0, 64.0, 36.0, 0.7, 3.],
+            [320.0, 180.0, 640.0, 360.0, 0.6, 0.]
+        ])
+
+    def test_class_indices(self):
+        """Tests whether the filtered types are converted to their indices."""
+        assert IYoloDetector.class_indices(self.names, ['dog', 'person', 'horse']).tolist() == [0, 3]
+
+    def test_create_bounding_boxes(self):
+        """Tests whether only the boxes of the filtered classes are created, normalized to the frame."""
+        boxes = IYoloDetector.create_bounding_boxes(self.det.clone(), self.img, self.frame_obj,
+                                                    IYoloDetector.class_indices(self.names, ['person', 'car']),
+                                                    self.names)
+
+        # Lowest confidence first, numbered from 0.
+        assert boxes.identifiers.tolist() == [0, 1, 2]
+        assert boxes.classifications == ['person', 'car', 'person']
+        assert np.allclose(boxes.certainties, [0.6, 0.8, 0.9])
+        assert np.allclose(boxes.rects[0], [0.5, 0.5, 1, 1])
+        assert np.allclose(boxes.rects[2], [10 / 640, 20 / 360, 110 / 640, 220 / 360])
+
+        box = list(boxes)[1]
+        assert box.classification == 'car'
+        assert box.rectangle.x1 == pytest.approx(300 / 640)
+
+    def test_no_predictions(self):
+        """Tests whether no boxes are created without predictions of the filtered classes."""
+        filter_classes = IYoloDetector.class_indices(self.names, ['bicycle'])
+        assert len(IYoloDetector.create_bounding_boxes(self.det.clone(), self.img, self.frame_obj,
+                                                       filter_classes, self.names)) == 0
+        assert len(IYoloDetector.create_bounding_boxes(None, self.img, self.frame_obj, filter_classes,
+                                                       self.names)) == 0
+
+    def test_generate_predictions(self):
+        """Tests whether only the candidates of the given classes go through the non-maximum suppression."""
+        configs = configparser.ConfigParser()
+        configs.read_string('[Yolo]\nconf-thres = 0.25\niou-thres = 0.45\naugment = false\n')
+
+        # Two candidates at the same position, a person and a car, as [x, y, width, height, objectness, classes].
+        candidates = torch.tensor([[[100., 100., 50., 100., 0.9, 0.9, 0., 0.1, 0.],
+                                    [100., 100., 50., 100., 0.9, 0., 0., 0.9, 0.]]])
+
+        def model(img, augment=False):
+            """Predicts the candidates.
+
+            Args:
+                img (Tensor): images.
+                augment (bool): augmented inference.
+
+            Returns:
+                (Tensor,): the candidates.
+            """
+            assert not augment
+            return (candidates.expand(len(img), -1, -1).clone(),)
+
+        pred = IYoloDetector.generate_predictions(self.img, model, configs['Yolo'])
+        assert sorted(pred[0][:, 5].tolist()) == [0., 2.]
+
+        pred = IYoloDetector.generate_predictions(self.img, model, configs['Yolo'],
+                                                  IYoloDetector.class_indices(self.names, ['person']).tolist())
+        assert pred[0][:, 5].tolist() == [0.]
+
+
+if __name__ == '__main__':
+    pytest.main(TestIYoloDetector)
@@ -0,0 +1,88 @@
+"""Tests the letterbox buffer converting frames to input tensors of the detectors.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from processor.pipeline.detection.letterbox_buffer import LetterboxBuffer, PADDING_VALUE
+
+
+def reference_image(frame, buffer):
+    """Letterboxes and converts a frame the way the detectors did before, allocating every step.
+
+    Args:
+        frame (np.ndarray): BGR frame.
+        buffer (LetterboxBuffer): Buffer of which the layout is used.
+
+    Returns:
+        Tensor: (3, height, width) normalized RGB image.
+    """
+    (height, width), (x1, y1, x2, y2) = buffer.layout(frame.shape[:2])
+    image = cv2.resize(frame, (x2 - x1, y2 - y1), interpolation=cv2.INTER_LINEAR)
+    image = cv2.copyMakeBorder(image, y1, height - y2, x1, width - x2, cv2.BORDER_CONSTANT,
+                               value=(PADDING_VALUE, PADDING_VALUE, PADDING_VALUE))
+    image = torch.from_numpy(np.ascontiguousarray(image[:, :, ::-1].transpose(2, 0, 1))).float()
+    image /= 255.0
+    return image
+
+
+class TestLetterboxBuffer:
+    """Tests letterbox_buffer.py."""
+    def setup_method(self):
+        """Creates random frames of different resolutions."""
+        # pylint: disable=attribute-defined-outside-init
+        generator = np.random.default_rng(0)
+        self.frames = [generator.integers(0, 256, (*shape, 3), dtype=np.uint8)
+                       for shape in [(1080, 1920), (480, 640), (500, 333), (640, 640)]]
+
+    def test_layout(self):
+        """Tests whether the padding is trimmed to a multiple of the stride, unless all letterboxes are square."""
+        assert LetterboxBuffer(640, 32, 'cpu').layout((1080, 1920)) == ((384, 640), (0, 12, 640, 372))
+        assert LetterboxBuffer(640, 32, 'cpu', auto=False).layout((1080, 1920)) == ((640, 640), (0, 140, 640, 500))
+
+    @pytest.mark.parametrize('auto', [True, False])
+    def test_convert(self, auto):
+        """Tests whether the converted images are the same as the images converted step by step.
+
+        Args:
+            auto (bool): Whether to trim the padding.
+        """
+        buffer = LetterboxBuffer(640, 32, 'cpu', auto=auto)
+
+        # The frames change shape, so the padding of the buffer must be filled again.
+        for frame in self.frames + self.frames[:2]:
+            images = buffer.convert([frame])
+            assert torch.equal(images[0], reference_image(frame, buffer))
+
+    def test_batch(self):
+        """Tests whether frames of different resolutions are converted to a single batch."""
+        buffer = LetterboxBuffer(640, 32, 'cpu', auto=False)
+        images = buffer.convert(self.frames)
+
+        assert images.shape == (4, 3, 640, 640)
+        for image, frame in zip(images, self.frames):
+            assert torch.equal(image, reference_image(frame, buffer))
+
+        # The frames of a smaller batch are written into the same buffer.
+        pointer = images.data_ptr()
+        images = buffer.convert(self.frames[2:0:-1])
+        assert images.data_ptr() == pointer
+        assert torch.equal(images[1], reference_image(self.frames[1], buffer))
+
+        with pytest.raises(ValueError):
+            LetterboxBuffer(640, 32, 'cpu').convert(self.frames)
+
+    def test_half(self):
+        """Tests whether the images are converted to half precision."""
+        images = LetterboxBuffer(320, 32, 'cpu', half=True).convert(self.frames[:1])
+        assert images.dtype == torch.float16
+        assert float(images.max()) <= 1.
+
+
+if __name__ == '__main__':
+    pytest.main(TestLetterboxBuffer)
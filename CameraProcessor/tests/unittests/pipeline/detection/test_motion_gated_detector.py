@@ -0,0 +1,111 @@
+"""Tests the motion gated detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.motion_gated_detector import MotionGatedDetector
+from tests.unittests.utils.recording_detector import RecordingDetector
+from tests.unittests.utils.utils import create_section
+
+
+# Values of the MotionGate section of the configurations, overridden per test.
+MOTION_GATE_CONFIG = {'enabled': 'true', 'max_skipped_frames': '0'}
+
+
+def create_frame(square=None):
+    """Creates a dark 640x480 frame, optionally with a bright square.
+
+    Args:
+        square ((int, int)): top left corner of a bright 40x40 square, None for an empty frame.
+
+    Returns:
+        FrameObj: the frame.
+    """
+    frame = np.full((480, 640, 3), 20, dtype=np.uint8)
+    if square is not None:
+        frame[square[1]:square[1] + 40, square[0]:square[0] + 40] = 230
+    return FrameObj(frame, 0)
+
+
+class TestMotionGatedDetector:
+    """Tests the MotionGatedDetector."""
+
+    def test_skips_unchanged_frames(self):
+        """Tests that unchanged frames reuse the detections of the last detected frame."""
+        detector = RecordingDetector()
+        gate = MotionGatedDetector(detector, create_section('MotionGate', MOTION_GATE_CONFIG))
+
+        first = gate.detect(create_frame())
+        for _ in range(4):
+            reused = gate.detect(create_frame())
+            assert reused == first
+            assert reused is not first
+
+            # Changing the boxes of a frame does not change the boxes of the next frames.
+            reused.set_object_id(0, 5)
+            assert first.bounding_boxes[0].object_id is None
+
+        assert len(detector.shapes) == 1
+        assert gate.skipped_frames == 4
+        assert gate.skip_ratio == pytest.approx(0.8)
+
+    def test_detects_changed_frames(self):
+        """Tests that a frame that changed since the last detected frame is detected."""
+        detector = RecordingDetector()
+        gate = MotionGatedDetector(detector, create_section('MotionGate', MOTION_GATE_CONFIG))
+
+        gate.detect(create_frame())
+        gate.detect(create_frame((300, 200)))
+        gate.detect(create_frame((300, 200)))
+
+        assert len(detector.shapes) == 2
+        assert gate.stats()['skipped_frames'] == 1
+
+    def test_max_skipped_frames(self):
+        """Tests that a frame is detected anyway after the maximum number of skipped frames."""
+        detector = RecordingDetector()
+        gate = MotionGatedDetector(detector, create_section('MotionGate', MOTION_GATE_CONFIG, max_skipped_frames='2'))
+
+        for _ in range(6):
+            gate.detect(create_frame())
+        assert len(detector.shapes) == 2
+
+    def test_crop_to_motion(self):
+        """Tests that only the changed region is detected and the boxes are mapped onto the full frame."""
+        detector = RecordingDetector()
+        config = create_section('MotionGate', MOTION_GATE_CONFIG, crop_to_motion='true', crop_padding='0')
+        gate = MotionGatedDetector(detector, config)
+
+        gate.detect(create_frame())
+        boxes = gate.detect(create_frame((20, 20)))
+
+        # The first box is kept, as it does not overlap the changed region.
+        assert gate.cropped_frames == 1
+        width, height = detector.shapes[1]
+        assert width < 100 and height < 100
+        assert len(boxes) == 2
+
+        box = boxes.bounding_boxes[1]
+        assert [box.identifier for box in boxes] == [0, 1]
+        assert 0.03 < box.rectangle.x1 < box.rectangle.x2 < 0.1
+        assert 0.04 < box.rectangle.y1 < box.rectangle.y2 < 0.13
+
+    def test_large_change_detects_full_frame(self):
+        """Tests that the full frame is detected when most of it changed."""
+        detector = RecordingDetector()
+        gate = MotionGatedDetector(detector, create_section('MotionGate', MOTION_GATE_CONFIG, crop_to_motion='true'))
+
+        gate.detect(create_frame())
+        gate.detect(FrameObj(np.full((480, 640, 3), 200, dtype=np.uint8), 0))
+
+        assert gate.cropped_frames == 0
+        assert detector.shapes == [(640, 480), (640, 480)]
+
+
+if __name__ == '__main__':
+    pytest.main(TestMotionGatedDetector)
@@ -0,0 +1,94 @@
+"""Tests the region of interest detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.region_of_interest_detector import RegionOfInterestDetector, parse_polygons, \
+    merge_regions
+from tests.unittests.utils.recording_detector import RecordingDetector
+from tests.unittests.utils.utils import create_section
+
+
+# Values of the RegionOfInterest section of the configurations, overridden per test.
+REGION_OF_INTEREST_CONFIG = {'enabled': 'true', 'crop_padding': '0'}
+
+
+class TestRegionOfInterestDetector:
+    """Tests the RegionOfInterestDetector."""
+
+    def setup_method(self):
+        """Creates a 640x480 frame."""
+        # pylint: disable=attribute-defined-outside-init
+        self.frame_obj = FrameObj(np.zeros((480, 640, 3), dtype=np.uint8), 0)
+
+    def test_parse_polygons(self):
+        """Tests whether polygons are parsed, and invalid polygons are not accepted."""
+        polygons = parse_polygons('0,0.5 1,0.5 1,1 0,1; 0,0 0.2,0 0.2,0.3;')
+        assert len(polygons) == 2
+        assert polygons[1].tolist() == [[0, 0], [0.2, 0], [0.2, 0.3]]
+
+        with pytest.raises(ValueError):
+            parse_polygons('0,0 1,1')
+        with pytest.raises(ValueError):
+            parse_polygons('0,0 2,0 2,1')
+
+    def test_merge_regions(self):
+        """Tests whether overlapping regions are merged."""
+        assert sorted(merge_regions([(0, 0, 10, 10), (30, 30, 40, 40), (5, 5, 20, 20), (15, 15, 32, 32)])) == \
+            [(0, 0, 40, 40)]
+        assert sorted(merge_regions([(0, 0, 10, 10), (5, 5, 20, 20), (30, 30, 40, 40)])) == \
+            [(0, 0, 20, 20), (30, 30, 40, 40)]
+        assert sorted(merge_regions([(0, 0, 10, 10), (10, 0, 20, 10)])) == [(0, 0, 10, 10), (10, 0, 20, 10)]
+
+    def test_full_frame(self):
+        """Tests whether a region covering the frame detects the frame itself."""
+        detector = RecordingDetector()
+        config = create_section('RegionOfInterest', REGION_OF_INTEREST_CONFIG, polygons='0,0 1,0 1,1 0,1')
+        boxes = RegionOfInterestDetector(detector, config).detect(self.frame_obj)
+
+        assert detector.shapes == [(640, 480)]
+        assert len(boxes) == 1
+
+    def test_crop(self):
+        """Tests whether only the crop of the region is detected, and the boxes are mapped back onto the frame."""
+        detector = RecordingDetector()
+        config = create_section('RegionOfInterest', REGION_OF_INTEREST_CONFIG, polygons='0,0.5 1,0.5 1,1 0,1')
+        boxes = list(RegionOfInterestDetector(detector, config).detect(self.frame_obj))
+
+        assert detector.shapes == [(640, 240)]
+        assert len(boxes) == 1
+        rectangle = boxes[0].rectangle
+        assert (rectangle.x1, rectangle.y1, rectangle.x2, rectangle.y2) == pytest.approx((0.25, 0.625, 0.75, 0.875))
+
+    def test_multiple_crops(self):
+        """Tests whether every region is detected, numbering the boxes of all crops."""
+        detector = RecordingDetector()
+        config = create_section('RegionOfInterest', REGION_OF_INTEREST_CONFIG,
+                                polygons='0,0 0.25,0 0.25,0.5 0,0.5; 0.5,0.5 1,0.5 1,1 0.5,1; 0.2,0.1 0.3,0.1 0.3,0.2')
+        roi_detector = RegionOfInterestDetector(detector, config)
+        boxes = list(roi_detector.detect(self.frame_obj))
+
+        # The small region overlaps the first region, so they are merged.
+        assert sorted(roi_detector.regions(self.frame_obj.shape)) == [(0, 0, 192, 240), (320, 240, 640, 480)]
+        assert sorted(detector.shapes) == [(192, 240), (320, 240)]
+        assert [box.identifier for box in boxes] == [0, 1]
+
+    def test_outside(self):
+        """Tests whether boxes of which the anchor is outside the polygon are dropped."""
+        # The center of the box is on the edge of the triangle, the center of its bottom edge outside it.
+        polygon = '0,0 0.8,0 0,0.8'
+        config = create_section('RegionOfInterest', REGION_OF_INTEREST_CONFIG, polygons=polygon, anchor='bottom')
+        assert len(RegionOfInterestDetector(RecordingDetector(), config).detect(self.frame_obj)) == 0
+
+        with pytest.raises(ValueError):
+            RegionOfInterestDetector(RecordingDetector(), create_section('RegionOfInterest', REGION_OF_INTEREST_CONFIG,
+                                                                         polygons=polygon, anchor='top'))
+
+
+if __name__ == '__main__':
+    pytest.main(TestRegionOfInterestDetector)
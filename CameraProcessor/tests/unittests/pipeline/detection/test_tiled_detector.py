@@ -0,0 +1,95 @@
+"""Tests the tiled detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.tiled_detector import TiledDetector, tile_starts, merge_detections
+from tests.unittests.utils.recording_detector import RecordingDetector
+from tests.unittests.utils.utils import create_section
+
+
+# Values of the Tiling section of the configurations, overridden per test.
+TILING_CONFIG = {'enabled': 'true', 'tile_size': '640', 'overlap': '128', 'max_batch_size': '8',
+                 'include_full_frame': 'false'}
+
+
+class TestTiledDetector:
+    """Tests the TiledDetector."""
+
+    def setup_method(self):
+        """Creates a 3840x2160 (4K) frame."""
+        # pylint: disable=attribute-defined-outside-init
+        self.frame_obj = FrameObj(np.zeros((2160, 3840, 3), dtype=np.uint8), 0)
+
+    def test_tile_starts(self):
+        """Tests whether the tiles cover the axis with at least the overlap."""
+        assert tile_starts(480, 640, 128) == [0]
+        assert tile_starts(640, 640, 128) == [0]
+
+        starts = tile_starts(2160, 640, 128)
+        assert starts[0] == 0 and starts[-1] == 2160 - 640
+        assert all(start + 640 - next_start >= 128 for start, next_start in zip(starts, starts[1:]))
+
+    def test_merge_detections(self):
+        """Tests whether boxes of the same object in different tiles are merged."""
+        full = BoundingBox(0, Rectangle(0.1, 0.1, 0.3, 0.5), 'person', 0.9)
+        cut_off = BoundingBox(0, Rectangle(0.1, 0.1, 0.3, 0.2), 'person', 0.6)
+        other_class = BoundingBox(0, Rectangle(0.1, 0.1, 0.3, 0.5), 'car', 0.8)
+        elsewhere = BoundingBox(1, Rectangle(0.6, 0.6, 0.7, 0.7), 'person', 0.5)
+        boxes = [cut_off, elsewhere, other_class, full]
+
+        assert merge_detections(boxes, 0.5, 'ios') == [full, other_class, elsewhere]
+        # The cut off box overlaps too little with the full box to be merged on intersection over union.
+        assert merge_detections(boxes, 0.5, 'iou') == [full, other_class, cut_off, elsewhere]
+        assert merge_detections([]) == []
+
+    def test_small_frame(self):
+        """Tests whether a frame fitting in a single tile is detected as is."""
+        detector = RecordingDetector()
+        boxes = TiledDetector(detector, create_section('Tiling', TILING_CONFIG)) \
+            .detect(FrameObj(np.zeros((480, 640, 3), np.uint8), 0))
+
+        assert detector.shapes == [(640, 480)]
+        assert len(boxes) == 1
+
+    def test_tiles(self):
+        """Tests whether all tiles are detected and their boxes mapped back onto the frame."""
+        detector = RecordingDetector()
+        tiled_detector = TiledDetector(detector, create_section('Tiling', TILING_CONFIG))
+        boxes = list(tiled_detector.detect(self.frame_obj))
+
+        regions = tiled_detector.regions(self.frame_obj.shape)
+        assert len(regions) == 8 * 4
+        assert detector.shapes == [(640, 640)] * len(regions)
+        assert [box.identifier for box in boxes] == list(range(len(regions)))
+
+        rectangle = boxes[0].rectangle
+        x1, y1, x2, y2 = regions[0]
+        assert rectangle.x1 == pytest.approx((x1 + 0.25 * (x2 - x1)) / 3840)
+        assert rectangle.y2 == pytest.approx((y1 + 0.75 * (y2 - y1)) / 2160)
+
+    def test_full_frame(self):
+        """Tests whether the downscaled frame is detected as well, and merged with the boxes of the tiles."""
+        detector = RecordingDetector()
+        config = create_section('Tiling', TILING_CONFIG, include_full_frame='true', merge_threshold='0.5')
+        boxes = TiledDetector(detector, config).detect(self.frame_obj)
+
+        assert detector.shapes[-1] == (3840, 2160)
+        # The box of the full frame contains the boxes of the tiles in its centre.
+        assert len(boxes) < len(detector.shapes)
+
+        with pytest.raises(ValueError):
+            TiledDetector(detector, create_section('Tiling', TILING_CONFIG, overlap='640'))
+        with pytest.raises(ValueError):
+            TiledDetector(detector, create_section('Tiling', TILING_CONFIG, merge_metric='giou'))
+
+
+if __name__ == '__main__':
+    pytest.main(TestTiledDetector)
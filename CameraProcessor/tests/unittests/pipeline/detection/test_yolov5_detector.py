@@ -0,0 +1,54 @@
+"""Tests the batched detection of the YOLOv5 detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import cv2
+import pytest
+
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.yolov5_detector import Yolov5Detector
+from tests.unittests.utils.utils import get_sample_frame
+
+
+class TestYolov5Detector:
+    """Tests yolov5_detector.py."""
+    @pytest.fixture
+    def detector(self, configs):
+        """Creates the YOLOv5 detector of the test configurations.
+
+        Args:
+            configs (ConfigParser): Configurations of the test.
+
+        Returns:
+            Yolov5Detector: Detector of the test configurations.
+        """
+        return Yolov5Detector(configs['Yolov5'], configs['Filter'])
+
+    def test_detect_batch_single_frame(self, detector):
+        """Tests whether a batch of a single frame gets the same detections as detecting the frame.
+
+        Args:
+            detector (Yolov5Detector): Detector of the test configurations.
+        """
+        frame_obj = FrameObj(get_sample_frame(), 0)
+        assert detector.detect_batch([frame_obj]) == [detector.detect(frame_obj)]
+
+    def test_detect_batch_shapes(self, detector):
+        """Tests whether frames of different shapes are letterboxed on their own, like detecting them one by one.
+
+        Args:
+            detector (Yolov5Detector): Detector of the test configurations.
+        """
+        frame = get_sample_frame()
+        height, width = frame.shape[:2]
+        frame_objs = [
+            FrameObj(frame, 0),
+            FrameObj(cv2.resize(frame, (width // 2, height)), 1)
+        ]
+        assert detector.detect_batch(frame_objs) == [detector.detect(frame_obj) for frame_obj in frame_objs]
+
+
+if __name__ == '__main__':
+    pytest.main(TestYolov5Detector)
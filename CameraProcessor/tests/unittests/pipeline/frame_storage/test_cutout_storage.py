@@ -0,0 +1,51 @@
+"""Tests the cutout storage.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.frame_storage.cutout_storage import CutoutStorage
+from processor.utils.features import slice_bounding_box
+from tests.unittests.conftest import get_large_frame
+
+
+class TestCutoutStorage:
+    """Tests the CutoutStorage."""
+
+    def setup_method(self):
+        """Stores the cutouts of two boxes."""
+        # pylint: disable=attribute-defined-outside-init
+        self.storage = CutoutStorage()
+        self.frame_obj = FrameObj(get_large_frame(), 1.)
+        self.box1 = BoundingBox(1, Rectangle(0, 0.5, 0.25, 1), 'person', 0.5)
+        self.box2 = BoundingBox(2, Rectangle(0.5, 0, 0.75, 0.25), 'person', 0.8)
+        self.entry = self.storage.store(self.frame_obj, BoundingBoxes([self.box1, self.box2]))
+
+    def test_cutout(self):
+        """Tests whether the stored cutouts are copies of the cutouts of the frame."""
+        for box in (self.box1, self.box2):
+            cutout = self.storage.cutout(self.entry, box)
+            assert np.all(cutout == slice_bounding_box(box, self.frame_obj.frame))
+            assert not np.shares_memory(cutout, self.frame_obj.frame)
+
+        assert self.storage.nbytes(self.entry) == sum(self.storage.cutout(self.entry, box).nbytes
+                                                      for box in (self.box1, self.box2))
+        assert self.storage.nbytes(self.entry) < self.frame_obj.frame.nbytes
+
+    def test_missing(self):
+        """Tests whether the frame and the cutouts of other boxes cannot be retrieved."""
+        with pytest.raises(ValueError):
+            self.storage.frame(self.entry)
+        with pytest.raises(ValueError):
+            self.storage.cutout(self.entry, BoundingBox(3, Rectangle(0, 0, 1, 1), 'person', 0.5))
+
+
+if __name__ == '__main__':
+    pytest.main(TestCutoutStorage)
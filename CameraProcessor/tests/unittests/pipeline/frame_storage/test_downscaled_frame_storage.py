@@ -0,0 +1,53 @@
+"""Tests the downscaled frame storage.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.frame_storage.downscaled_frame_storage import DownscaledFrameStorage
+
+
+class TestDownscaledFrameStorage:
+    """Tests the DownscaledFrameStorage."""
+
+    def setup_method(self):
+        """Creates a 640x480 frame of which the left half is white."""
+        # pylint: disable=attribute-defined-outside-init
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[:, :320] = 255
+        self.frame_obj = FrameObj(frame, 1.)
+
+    def test_store(self):
+        """Tests whether the frame is downscaled."""
+        storage = DownscaledFrameStorage(0.25)
+        entry = storage.store(self.frame_obj, BoundingBoxes([]))
+
+        assert storage.frame(entry).shape == (160, 120)
+        assert storage.frame(entry).timestamp == self.frame_obj.timestamp
+        assert storage.nbytes(entry) == self.frame_obj.frame.nbytes // 16
+
+        # Scale 1 stores the frame itself.
+        assert DownscaledFrameStorage(1).store(self.frame_obj, BoundingBoxes([])) is self.frame_obj
+
+        with pytest.raises(ValueError):
+            DownscaledFrameStorage(0)
+
+    def test_cutout(self):
+        """Tests whether the normalized box is cut out of the downscaled frame."""
+        storage = DownscaledFrameStorage(0.5)
+        box = BoundingBox(1, Rectangle(0, 0, 0.5, 0.5), 'person', 0.5)
+        cutout = storage.cutout(storage.store(self.frame_obj, BoundingBoxes([box])), box)
+
+        assert cutout.shape == (120, 160, 3)
+        assert np.all(cutout == 255)
+
+
+if __name__ == '__main__':
+    pytest.main(TestDownscaledFrameStorage)
@@ -0,0 +1,46 @@
+"""Tests the JPEG frame storage.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.frame_storage.jpeg_frame_storage import JpegFrameStorage
+from tests.unittests.conftest import get_large_frame
+
+
+class TestJpegFrameStorage:
+    """Tests the JpegFrameStorage."""
+
+    def test_store(self):
+        """Tests whether the frame is compressed and decoded to nearly the same frame."""
+        storage = JpegFrameStorage(95)
+        frame_obj = FrameObj(get_large_frame(), 2.)
+        entry = storage.store(frame_obj, BoundingBoxes([]))
+
+        assert storage.nbytes(entry) < frame_obj.frame.nbytes / 4
+
+        frame = storage.frame(entry)
+        assert frame.timestamp == frame_obj.timestamp
+        assert frame.frame.shape == frame_obj.frame.shape
+        assert np.abs(frame.frame.astype(int) - frame_obj.frame).mean() < 5
+
+    def test_cutout(self):
+        """Tests whether the cutout of a box is sliced out of the decoded frame."""
+        storage = JpegFrameStorage()
+        frame_obj = FrameObj(get_large_frame(), 2.)
+        box = BoundingBox(1, Rectangle(0.25, 0.5, 0.75, 1), 'person', 0.5)
+        cutout = storage.cutout(storage.store(frame_obj, BoundingBoxes([box])), box)
+
+        height, width = frame_obj.frame.shape[:2]
+        assert cutout.shape[:2] == (height - int(0.5 * height), int(0.75 * width) - int(0.25 * width))
+
+
+if __name__ == '__main__':
+    pytest.main(TestJpegFrameStorage)
@@ -0,0 +1,56 @@
+"""Tests the feature cache storing the feature vectors of tracks.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.reidentification.feature_cache import FeatureCache
+
+
+class TestFeatureCache:
+    """Tests feature_cache.py."""
+    def setup_method(self):
+        """Creates a cache containing the features of a single track."""
+        # pylint: disable=attribute-defined-outside-init
+        self.cache = FeatureCache(max_age=2, min_iou=0.5, max_certainty_change=0.2)
+        self.box = BoundingBox(7, Rectangle(0, 0, 0.5, 0.5), 'person', 0.5)
+        self.feature = np.ones(4, dtype=np.float32)
+        self.cache.put(self.box, self.feature)
+
+    def test_fresh(self):
+        """Tests whether features are reused for the same track in the next frames."""
+        self.cache.next_frame()
+        assert self.cache.get(BoundingBox(7, Rectangle(0.05, 0, 0.55, 0.5), 'person', 0.6)) is self.feature
+        assert self.cache.get(BoundingBox(8, self.box.rectangle, 'person', 0.5)) is None
+
+    def test_max_age(self):
+        """Tests whether features are removed once they are too old."""
+        for _ in range(3):
+            self.cache.next_frame()
+
+        assert self.cache.get(self.box) is None
+        assert len(self.cache) == 0
+
+    def test_moved(self):
+        """Tests whether features are not reused when the box moved too much."""
+        assert self.cache.get(BoundingBox(7, Rectangle(0.4, 0.4, 0.9, 0.9), 'person', 0.5)) is None
+        assert self.cache.get(BoundingBox(7, Rectangle(0.6, 0.6, 1, 1), 'person', 0.5)) is None
+
+    def test_certainty_changed(self):
+        """Tests whether features are not reused when the certainty changed too much."""
+        assert self.cache.get(BoundingBox(7, self.box.rectangle, 'person', 0.9)) is None
+
+    def test_disabled(self):
+        """Tests whether nothing is cached when the maximum age is 0."""
+        cache = FeatureCache(max_age=0)
+        cache.put(self.box, self.feature)
+        assert len(cache) == 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestFeatureCache)
@@ -0,0 +1,160 @@
+"""Tests the similarity matching of the pytorch re-identifier.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from configparser import ConfigParser
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.reidentification.pytorch_re_identifier import PytorchReIdentifier
+from processor.pipeline.reidentification.reid_data import ReidData
+
+
+def create_re_identifier(distance, threshold, box_features, cache_max_age=0):
+    """Creates a re-identifier of which the extractor returns the given features.
+
+    The cutouts are replaced by the identifiers of the boxes, so the extracted boxes can be checked.
+
+    Args:
+        distance (str): Distance metric, euclidean or cosine.
+        threshold (float): Threshold from which a re-identification is included.
+        box_features (np.ndarray): Features returned for the boxes, row i for the box with identifier i.
+        cache_max_age (int): Number of frames features of a track are reused.
+
+    Returns:
+        PytorchReIdentifier: re-identifier returning the given features.
+    """
+    configs = ConfigParser()
+    configs.read_dict({'ReId': {'distance': distance, 'threshold': str(threshold),
+                                'cache_max_age': str(cache_max_age)}})
+    re_identifier = PytorchReIdentifier(configs['ReId'], None)
+    re_identifier.extracted = []
+    re_identifier.extract_cutouts = lambda frame_obj, boxes: [box.identifier for box in boxes]
+
+    def extract_features(cutouts):
+        """Returns the features belonging to the identifiers and records which identifiers got extracted.
+
+        Args:
+            cutouts ([int]): identifiers of the boxes.
+
+        Returns:
+            np.ndarray: features of the boxes.
+        """
+        re_identifier.extracted.append(cutouts)
+        return np.asarray(box_features, dtype=np.float32)[cutouts]
+
+    re_identifier.extract_features = extract_features
+    return re_identifier
+
+
+def create_boxes(count, object_ids=None):
+    """Creates bounding boxes without an object id.
+
+    Args:
+        count (int): Number of boxes.
+        object_ids (dict[int, int]): Object ids of the boxes that are already assigned.
+
+    Returns:
+        BoundingBoxes: the boxes.
+    """
+    object_ids = object_ids or {}
+    return BoundingBoxes([BoundingBox(i, Rectangle(0, 0, 1, 1), 'person', 0.5, object_ids.get(i))
+                          for i in range(count)])
+
+
+class TestPytorchReIdentifier:
+    """Tests pytorch_re_identifier.py."""
+    def test_invalid_distance(self):
+        """Tests whether an invalid distance metric raises an error."""
+        with pytest.raises(ValueError):
+            create_re_identifier('manhattan', 1, [])
+
+    def test_float16_features(self):
+        """Tests whether float16 features are compared with float32 precision."""
+        re_identifier = create_re_identifier('cosine', 1, [])
+        query_features = np.ones((2, 512), dtype=np.float16)
+
+        similarities = re_identifier.similarity_matrix(query_features, query_features)
+        assert similarities.dtype == np.float32
+        assert np.allclose(similarities, 1)
+
+    @pytest.mark.parametrize('distance', ['euclidean', 'cosine'])
+    def test_similarity_matrix(self, distance):
+        """Tests whether the similarity matrix equals the pairwise scipy distances.
+
+        Args:
+            distance (str): Distance metric, euclidean or cosine.
+        """
+        rng = np.random.default_rng(0)
+        query_features = rng.normal(size=(5, 64)).astype(np.float32)
+        gallery_features = rng.normal(size=(7, 64)).astype(np.float32)
+        re_identifier = create_re_identifier(distance, 1, [])
+
+        expected = cdist(query_features, gallery_features, distance)
+        if distance == 'cosine':
+            expected = 1 - expected
+
+        similarities = re_identifier.similarity_matrix(query_features, gallery_features)
+        assert similarities.shape == (5, 7)
+        assert np.allclose(similarities, expected, atol=1e-4)
+        assert re_identifier.similarity(query_features[0], gallery_features[1]) == pytest.approx(expected[0, 1], 1e-4)
+
+    def test_re_identify(self):
+        """Tests whether boxes are assigned to the most similar query within the threshold."""
+        box_features = [[0, 0], [10, 0], [0, 9], [50, 50]]
+        re_identifier = create_re_identifier('euclidean', 5, box_features)
+
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(1, np.array([1, 0], dtype=np.float32))
+        re_id_data.add_query_feature(2, np.array([9, 0], dtype=np.float32))
+        re_id_data.add_query_feature(3, [0., 10.])
+
+        # Box 0 is the closest to query 1 but already assigned to query 3.
+        boxes = create_boxes(4, {0: 3})
+        re_identifier.re_identify(FrameObj(np.zeros((4, 4, 3)), 0), boxes, re_id_data)
+
+        assert [box.object_id for box in boxes] == [3, 2, 3, None]
+        assert re_identifier.extracted == [[1, 2, 3]]
+        assert re_id_data.get_object_id_for_box(1) == 2
+        assert re_id_data.get_object_id_for_box(2) == 3
+        assert re_id_data.get_object_id_for_box(3) is None
+
+    def test_feature_cache(self):
+        """Tests whether features of stable tracks are reused, and extracted again once the box moved."""
+        re_identifier = create_re_identifier('euclidean', 5, [[0, 0], [10, 0]], cache_max_age=2)
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(1, [100., 100.])
+        frame_obj = FrameObj(np.zeros((4, 4, 3)), 0)
+
+        for _ in range(4):
+            re_identifier.re_identify(frame_obj, create_boxes(2), re_id_data)
+
+        # Box 1 moved, so its features are extracted again although they are cached.
+        moved_boxes = create_boxes(2)
+        moved_boxes.bounding_boxes[1] = BoundingBox(1, Rectangle(0.5, 0.5, 1, 1), 'person', 0.5)
+        re_identifier.re_identify(frame_obj, moved_boxes, re_id_data)
+
+        # Features are reused for two frames after they got extracted.
+        assert re_identifier.extracted == [[0, 1], [0, 1], [1]]
+
+    def test_re_identify_without_queries(self):
+        """Tests whether nothing gets extracted or assigned when there are no queries."""
+        re_identifier = create_re_identifier('cosine', 0.5, [[1, 0]])
+        boxes = create_boxes(1)
+
+        re_identifier.re_identify(FrameObj(np.zeros((4, 4, 3)), 0), boxes, ReidData())
+
+        assert boxes.bounding_boxes[0].object_id is None
+        assert re_identifier.extracted == []
+
+
+if __name__ == '__main__':
+    pytest.main(TestPytorchReIdentifier)
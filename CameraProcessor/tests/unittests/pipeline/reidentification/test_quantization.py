@@ -0,0 +1,111 @@
+"""Tests the quantization of the re-identification models.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from processor.pipeline.reidentification.quantization import quantize, load_quantized, quantized_path, \
+    read_calibration_cutouts, calibration_batches
+from tests.unittests.utils.small_re_id_model import SmallReIdModel
+
+
+class TestQuantization:
+    """Tests quantization.py."""
+    def setup_method(self):
+        """Creates a small model and calibration batches."""
+        # pylint: disable=attribute-defined-outside-init
+        self.model = SmallReIdModel().eval()
+        generator = torch.Generator().manual_seed(0)
+        self.batches = [torch.rand(4, 3, 32, 16, generator=generator) for _ in range(4)]
+
+    @pytest.mark.parametrize('mode', ['dynamic', 'static'])
+    def test_quantize(self, mode):
+        """Tests whether the quantized model extracts features close to the features of the original model.
+
+        Args:
+            mode (str): quantization mode.
+        """
+        quantized = quantize(self.model, mode, self.batches)
+
+        images = torch.cat(self.batches)
+        with torch.no_grad():
+            features, quantized_features = self.model(images), quantized(images)
+
+        assert isinstance(quantized, torch.jit.ScriptModule)
+        assert quantized_features.shape == features.shape
+        assert torch.nn.functional.cosine_similarity(features, quantized_features).min() > 0.95
+
+        # The original model is not quantized.
+        assert isinstance(self.model.conv, torch.nn.Conv2d)
+
+    def test_invalid(self):
+        """Tests whether an unknown mode or missing calibration batches are not accepted."""
+        with pytest.raises(ValueError):
+            quantize(self.model, 'int4', self.batches)
+        with pytest.raises(ValueError):
+            quantize(self.model, 'static', [])
+
+    def test_cache(self, tmp_path):
+        """Tests whether the quantized model is cached, and quantized again once the weights are newer.
+
+        Args:
+            tmp_path (Path): temporary folder for the weights.
+        """
+        weights_path = os.path.join(tmp_path, 'model.pth')
+        torch.save(self.model.state_dict(), weights_path)
+        calls = []
+
+        def create_batches():
+            """Creates the calibration batches, counting the calls.
+
+            Returns:
+                [Tensor]: calibration batches.
+            """
+            calls.append(len(calls))
+            return self.batches
+
+        load_quantized(self.model, 'static', weights_path, create_batches)
+        assert os.path.exists(quantized_path(weights_path, 'static'))
+
+        cached = load_quantized(self.model, 'static', weights_path, create_batches)
+        assert len(calls) == 1
+        with torch.no_grad():
+            assert cached(self.batches[0]).shape == (4, 16)
+
+        # Make the weights newer than the cached model.
+        modified = os.path.getmtime(quantized_path(weights_path, 'static')) + 10
+        os.utime(weights_path, (modified, modified))
+        load_quantized(self.model, 'static', weights_path, create_batches)
+        assert len(calls) == 2
+
+    def test_calibration_cutouts(self, tmp_path):
+        """Tests whether the calibration cutouts are read and converted to batches.
+
+        Args:
+            tmp_path (Path): temporary folder for the cutouts.
+        """
+        for i in range(5):
+            cv2.imwrite(os.path.join(tmp_path, f'{i}.png'), np.full((32, 16, 3), i * 50, dtype=np.uint8))
+        with open(os.path.join(tmp_path, 'notes.txt'), 'w') as notes:
+            notes.write('not an image')
+
+        assert len(read_calibration_cutouts(str(tmp_path))) == 5
+        assert len(read_calibration_cutouts(str(tmp_path), max_cutouts=3)) == 3
+        assert read_calibration_cutouts(os.path.join(tmp_path, 'missing')) == []
+
+        batches = calibration_batches(read_calibration_cutouts(str(tmp_path)),
+                                      lambda cutout: torch.from_numpy(cutout.transpose(2, 0, 1)).float(),
+                                      batch_size=2)
+        assert [batch.shape[0] for batch in batches] == [2, 2, 1]
+        assert batches[0].shape[1:] == (3, 32, 16)
+
+
+if __name__ == '__main__':
+    pytest.main(TestQuantization)
@@ -0,0 +1,47 @@
+"""Tests the re-identification data storing the queries.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.pipeline.reidentification.reid_data import ReidData
+
+
+class TestReidData:
+    """Tests reid_data.py."""
+    def test_query_features_arrays(self):
+        """Tests whether feature vectors are stored as contiguous arrays, keeping float types of arrays."""
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(1, [0.5, 0.25])
+        re_id_data.add_query_feature(2, np.array([1, 2], dtype=np.float16))
+
+        feature = re_id_data.get_feature_for_query(1)
+        assert feature.dtype == np.float32 and feature.flags['C_CONTIGUOUS']
+        assert re_id_data.get_feature_for_query(2).dtype == np.float16
+
+    def test_query_matrix(self):
+        """Tests whether the query matrix follows added and removed queries."""
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(1, np.array([1, 0], dtype=np.float32))
+        re_id_data.add_query_feature(2, np.array([0, 1], dtype=np.float32))
+        re_id_data.add_query_box(5, 2)
+
+        query_ids, query_features = re_id_data.get_query_features()
+        assert query_ids == [1, 2]
+        assert np.array_equal(query_features, [[1, 0], [0, 1]])
+
+        # The matrix is cached until the queries change.
+        assert re_id_data.get_query_features()[1] is query_features
+
+        re_id_data.remove_query(2)
+        query_ids, query_features = re_id_data.get_query_features()
+        assert query_ids == [1]
+        assert query_features.shape == (1, 2)
+        assert re_id_data.get_object_id_for_box(5) is None
+
+
+if __name__ == '__main__':
+    pytest.main(TestReidData)
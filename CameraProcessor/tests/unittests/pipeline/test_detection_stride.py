@@ -0,0 +1,89 @@
+"""Tests the detection stride.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection_stride import DetectionStride
+
+
+def create_boxes(x_offset):
+    """Creates the tracked boxes of a frame with a single track of width 0.1.
+
+    Args:
+        x_offset (float): left side of the box.
+
+    Returns:
+        BoundingBoxes: a single tracked box.
+    """
+    return BoundingBoxes([BoundingBox(1, Rectangle(x_offset, 0.2, x_offset + 0.1, 0.4), 'person', 0.9)])
+
+
+class TestDetectionStride:
+    """Tests the DetectionStride."""
+
+    def test_fixed_stride(self):
+        """Tests that every n-th frame is detected with a fixed stride."""
+        stride = DetectionStride(3)
+        detected = [stride.should_detect() for _ in range(9)]
+
+        assert detected == [True, False, False, True, False, False, True, False, False]
+        assert stride.skipped_detections == 6
+        assert not stride.adaptive
+
+    def test_fixed_stride_ignores_motion(self):
+        """Tests that the interval of a fixed stride does not change with the motion."""
+        stride = DetectionStride(2)
+        stride.observe(create_boxes(0.))
+        stride.observe(create_boxes(0.5))
+        assert stride.interval == 2
+
+    def test_adaptive_stride(self):
+        """Tests that the interval shrinks when the objects move faster."""
+        stride = DetectionStride(1, max_stride=8, max_motion=0.5)
+
+        # Without motion the maximum stride is used.
+        stride.observe(create_boxes(0.))
+        assert stride.interval == 8
+
+        # Moving a quarter of the width per frame allows 2 frames in between detections.
+        stride.observe(create_boxes(0.025))
+        assert stride.motion == pytest.approx(0.25)
+        assert stride.interval == 2
+
+        # Moving more than the maximum motion per frame detects every frame.
+        stride.observe(create_boxes(0.125))
+        assert stride.interval == 1
+
+        # A slow object allows the maximum stride again.
+        stride.observe(create_boxes(0.126))
+        assert stride.interval == 8
+
+    def test_new_tracks_do_not_move(self):
+        """Tests that tracks that were not in the previous frame do not count as motion."""
+        stride = DetectionStride(2, max_stride=4)
+        stride.observe(BoundingBoxes([]))
+        stride.observe(create_boxes(0.5))
+        assert stride.motion == 0
+        assert stride.interval == 4
+
+    @pytest.mark.parametrize('stride, max_stride, max_motion', [(0, None, 0.5), (3, 2, 0.5), (1, 4, 0)])
+    def test_invalid(self, stride, max_stride, max_motion):
+        """Tests that invalid settings are rejected.
+
+        Args:
+            stride (int): number of frames in between two detections.
+            max_stride (int): maximum stride.
+            max_motion (float): maximum motion in between two detections.
+        """
+        with pytest.raises(ValueError):
+            DetectionStride(stride, max_stride, max_motion)
+
+
+if __name__ == '__main__':
+    pytest.main(TestDetectionStride)
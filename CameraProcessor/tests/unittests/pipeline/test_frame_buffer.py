@@ -16,6 +16,8 @@ from processor.data_object.rectangle import Rectangle
 from processor.data_object.bounding_box import BoundingBox
 from processor.data_object.bounding_boxes import BoundingBoxes
 from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.frame_storage.cutout_storage import CutoutStorage
+from processor.utils.features import slice_bounding_box
 
 
 # pylint: disable=attribute-defined-outside-init
@@ -87,3 +89,32 @@ class TestFrameBuffer:
         assert frame3.timestamp in self.frame_buffer.buffer
         assert self.frame2.timestamp in self.frame_buffer.buffer
         assert self.frame1.timestamp not in self.frame_buffer.buffer
+
+    def test_get_cutout(self):
+        """Test whether the frame_buffer cuts out the box given a frame id and a box id."""
+        assert np.all(self.frame_buffer.get_cutout(self.frame2.timestamp, self.box3.identifier) ==
+                      slice_bounding_box(self.box3, self.frame2.frame))
+
+    def test_max_bytes(self):
+        """Test that the frame_buffer deletes the oldest items when the stored bytes exceed the maximum."""
+        frame_buffer = FrameBuffer(10, max_bytes=self.frame2.frame.nbytes)
+        frame_buffer.add_frame(self.frame1, self.boxes1)
+        frame_buffer.add_frame(self.frame2, self.boxes2)
+
+        assert list(frame_buffer.buffer) == [self.frame2.timestamp]
+        assert frame_buffer.nbytes == self.frame2.frame.nbytes
+
+        # A single frame larger than the maximum is kept.
+        frame_buffer = FrameBuffer(10, max_bytes=1)
+        frame_buffer.add_frame(self.frame1, self.boxes1)
+        assert list(frame_buffer.buffer) == [self.frame1.timestamp]
+
+    def test_cutout_storage(self):
+        """Test that the frame_buffer only stores the cutouts of the boxes with the cutout storage."""
+        frame_buffer = FrameBuffer(2, CutoutStorage())
+        frame_buffer.add_frame(self.frame2, self.boxes2)
+
+        assert frame_buffer.nbytes < self.frame2.frame.nbytes
+        assert np.all(frame_buffer.get_cutout(self.frame2.timestamp, self.box3.identifier) ==
+                      slice_bounding_box(self.box3, self.frame2.frame))
+        assert frame_buffer.get_boxes(self.frame2.timestamp) == self.boxes2
@@ -0,0 +1,85 @@
+"""Tests the latency budget.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.pipeline.latency_budget import LatencyBudget
+
+
+class TestLatencyBudget:
+    """Tests the LatencyBudget."""
+
+    def test_detects_every_frame_within_budget(self):
+        """Tests that every frame is detected while the lag is within the budget."""
+        budget = LatencyBudget(0.1)
+        for _ in range(20):
+            assert budget.should_detect()
+            budget.record(0.01, True)
+
+        assert budget.detection_interval == 1
+        assert budget.skipped_detections == 0
+        assert budget.frames == 20
+
+    def test_skips_detection_over_budget(self):
+        """Tests that the detection interval grows up to the maximum while the lag exceeds the budget."""
+        budget = LatencyBudget(0.1, max_interval=3, smoothing=1)
+        detected = []
+        for _ in range(12):
+            detect = budget.should_detect()
+            detected.append(detect)
+            budget.record(0.2 if detect else 0.15, detect)
+
+        assert budget.detection_interval == 3
+        assert detected[:9] == [True, False, True, False, False, True, False, False, True]
+        assert budget.skipped_detections == detected.count(False)
+        assert budget.max_lag == pytest.approx(0.2)
+
+    def test_recovers_under_budget(self):
+        """Tests that the detection interval shrinks once the lag drops below half the budget."""
+        budget = LatencyBudget(0.1, max_interval=4, smoothing=1)
+        for _ in range(10):
+            budget.record(0.2, budget.should_detect())
+        assert budget.detection_interval == 4
+
+        for _ in range(10):
+            budget.record(0.01, budget.should_detect())
+        assert budget.detection_interval == 1
+
+    def test_smoothed_lag(self):
+        """Tests that the lag is smoothed over the frames."""
+        budget = LatencyBudget(1, smoothing=0.5)
+        budget.record(0.2, True)
+        budget.record(0.4, True)
+        assert budget.lag == pytest.approx(0.3)
+
+    def test_stats(self):
+        """Tests that the stats contain the frames dropped by the capture."""
+        class Capture:
+            """Capture counting dropped frames."""
+            dropped_frames = 7
+
+        budget = LatencyBudget(1)
+        budget.record(0.5, True)
+
+        assert budget.stats()['frames'] == 1
+        assert 'dropped_frames' not in budget.stats()
+        assert budget.stats(Capture())['dropped_frames'] == 7
+
+    @pytest.mark.parametrize('budget, max_interval, smoothing', [(0, 5, 0.1), (1, 0, 0.1), (1, 5, 0), (1, 5, 2)])
+    def test_invalid(self, budget, max_interval, smoothing):
+        """Tests that invalid settings are rejected.
+
+        Args:
+            budget (float): target lag.
+            max_interval (int): maximum detection interval.
+            smoothing (float): weight of the newest lag.
+        """
+        with pytest.raises(ValueError):
+            LatencyBudget(budget, max_interval, smoothing)
+
+
+if __name__ == '__main__':
+    pytest.main(TestLatencyBudget)
@@ -0,0 +1,104 @@
+"""Tests the pipeline stage running a step of the pipeline on its own thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.pipeline.pipeline_stage import PipelineStage, END_OF_STREAM
+
+
+class TestPipelineStage:
+    """Tests pipeline_stage.py."""
+
+    @staticmethod
+    def __create_source(items):
+        """Creates a source function that produces the given items followed by the end of the stream.
+
+        Args:
+            items ([object]): Items the source produces in order.
+
+        Returns:
+            function: Source function for a PipelineStage without input queue.
+        """
+        iterator = iter(items)
+        return lambda: next(iterator, END_OF_STREAM)
+
+    @staticmethod
+    def __drain(output_queue):
+        """Takes all items from the queue until the end of the stream.
+
+        Args:
+            output_queue (Queue): Output queue of the last stage.
+
+        Returns:
+            [object]: All items before the end of the stream.
+        """
+        items = []
+        while True:
+            item = output_queue.get(timeout=5)
+            if item is END_OF_STREAM:
+                return items
+            items.append(item)
+
+    @pytest.mark.timeout(30)
+    def test_chained_stages_keep_order(self):
+        """Tests that items pass through chained stages in order and are transformed by every stage."""
+        source = PipelineStage('source', self.__create_source(range(50)), queue_size=1)
+        double = PipelineStage('double', lambda item: item * 2, source.output_queue, queue_size=1)
+        increment = PipelineStage('increment', lambda item: item + 1, double.output_queue, queue_size=1)
+
+        for stage in [source, double, increment]:
+            stage.start()
+
+        assert self.__drain(increment.output_queue) == [item * 2 + 1 for item in range(50)]
+
+        for stage in [source, double, increment]:
+            stage.stop()
+            assert not stage.running
+
+    @pytest.mark.timeout(30)
+    def test_source_skips_none(self):
+        """Tests that a source stage does not pass on None, which signals that no item was available yet."""
+        source = PipelineStage('source', self.__create_source([None, 1, None, 2]))
+        source.start()
+
+        assert self.__drain(source.output_queue) == [1, 2]
+        source.stop()
+
+    @pytest.mark.timeout(30)
+    def test_error_ends_stream(self):
+        """Tests that a failing stage stores its error and ends the stream for the stages behind it."""
+        def fail(_):
+            """Work function that always fails.
+
+            Raises:
+                ValueError: Always.
+            """
+            raise ValueError('failing stage')
+
+        source = PipelineStage('source', self.__create_source([1, 2, 3]))
+        failing = PipelineStage('failing', fail, source.output_queue)
+        source.start()
+        failing.start()
+
+        assert self.__drain(failing.output_queue) == []
+        assert isinstance(failing.error, ValueError)
+
+        source.stop()
+        failing.stop()
+
+    @pytest.mark.timeout(30)
+    def test_stop_unblocks_full_queue(self):
+        """Tests that stopping a stage that waits on a full output queue does not hang."""
+        source = PipelineStage('source', lambda: 1, queue_size=1)
+        source.start()
+
+        # Nobody takes items from the queue, so the source blocks on its output queue.
+        source.stop()
+        assert not source.running
+
+
+if __name__ == '__main__':
+    pytest.main(TestPipelineStage)
@@ -12,7 +12,7 @@ from tests.unittests.utils.fake_tracker import FakeTracker
 from tests.unittests.utils.fake_re_identifier import FakeReIdentifier
 from tests.unittests.utils.fake_websocket import FakeWebsocket
 from processor.pipeline.prepare_pipeline import prepare_objects
-from processor.pipeline.process_frames import process_stream
+from processor.pipeline.process_frames import process_stream, process_stream_pipelined, process_stream_scheduler
 from processor.pipeline.detection.yolov5_detector import Yolov5Detector
 from processor.pipeline.detection.yolor_detector import YolorDetector
 from processor.input.video_capture import VideoCapture
@@ -120,6 +120,66 @@ class TestProcessFrames:
         asyncio.get_event_loop().run_until_complete(self.await_detection(capture, detector, tracker, re_identifier))
         capture.close()
 
+    @pytest.mark.timeout(180)
+    def test_process_stream_pipelined_with_fake(self, configs):
+        """Tests that process_stream_pipelined handles every frame in capture order.
+
+        Args:
+            configs (ConfigParser): Configurations of the test.
+        """
+        capture = self.__get_video(configs)
+        timestamps = []
+
+        # Process the stream with fake stages, storing the order in which the frames got processed.
+        asyncio.get_event_loop().run_until_complete(
+            process_stream_pipelined(
+                capture,
+                FakeDetector(),
+                FakeTracker(),
+                FakeReIdentifier(),
+                lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+                timestamps.append(frame_obj.timestamp),
+                FakeWebsocket(),
+                queue_size=1
+            )
+        )
+        capture.close()
+
+        assert len(timestamps) > 0
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.timeout(180)
+    def test_process_stream_parallel_scheduler_with_fake(self, configs):
+        """Tests that the parallel scheduler with overlapping iterations handles every frame in capture order.
+
+        Args:
+            configs (ConfigParser): Configurations of the test.
+        """
+        capture = self.__get_video(configs)
+        timestamps = []
+
+        # Let multiple frames run through the plan at the same time.
+        configs['Scheduler']['type'] = 'parallel'
+        configs['Scheduler']['max_iterations'] = '3'
+
+        # Process the stream with fake stages, storing the order in which the frames got processed.
+        asyncio.get_event_loop().run_until_complete(
+            process_stream_scheduler(
+                capture,
+                FakeDetector(),
+                FakeTracker(),
+                FakeReIdentifier(),
+                lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+                timestamps.append(frame_obj.timestamp),
+                FakeWebsocket(),
+                configs['Scheduler']
+            )
+        )
+        capture.close()
+
+        assert len(timestamps) > 0
+        assert timestamps == sorted(timestamps)
+
     async def await_detection(self, capture, detector, tracker, re_identifier):
         """Async function that runs process_stream.
 
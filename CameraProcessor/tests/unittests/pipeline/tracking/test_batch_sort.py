@@ -0,0 +1,126 @@
+"""Tests the vectorized SORT tracker.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.pipeline.tracking.sort.sort import Sort
+from processor.pipeline.tracking.sort.batch_sort import BatchSort
+
+
+def create_detections(frames, objects, seed=0):
+    """Creates noisy detections of objects moving with a constant velocity, with some missed detections.
+
+    Args:
+        frames (int): number of frames.
+        objects (int): number of objects.
+        seed (int): seed of the random generator.
+
+    Returns:
+        [[(np.ndarray, str, float)]]: detections in the SORT format for every frame.
+    """
+    rng = np.random.default_rng(seed)
+    starts = rng.uniform(0, 800, (objects, 2))
+    sizes = rng.uniform(30, 120, (objects, 2))
+    velocities = rng.uniform(-5, 5, (objects, 2))
+
+    detections = []
+    for frame in range(frames):
+        frame_detections = []
+        for i in rng.permutation(objects):
+            # Objects are not detected in some frames, which tests the predictions of unmatched tracks.
+            if rng.random() < 0.15:
+                continue
+            top_left = starts[i] + frame * velocities[i] + rng.normal(0, 1, 2)
+            certainty = float(rng.uniform(0.5, 1))
+            box = np.array([*top_left, *(top_left + sizes[i]), certainty])
+            frame_detections.append((box, f'class{i % 3}', certainty))
+        detections.append(frame_detections)
+    return detections
+
+
+class TestBatchSort:
+    """Tests the BatchSort tracker against the original SORT tracker."""
+
+    @pytest.mark.parametrize('max_age, min_hits', [(1, 3), (5, 0), (30, 2)])
+    def test_same_as_sort(self, max_age, min_hits):
+        """Tests that BatchSort tracks the same boxes with the same ids as Sort.
+
+        Args:
+            max_age (int): amount of frames a track persists while not matched.
+            min_hits (int): consecutive hits before a track is returned.
+        """
+        sort = Sort(max_age=max_age, min_hits=min_hits, iou_threshold=0.3)
+        batch_sort = BatchSort(max_age=max_age, min_hits=min_hits, iou_threshold=0.3)
+
+        for detections in create_detections(frames=60, objects=12):
+            expected = sort.update(detections)
+            tracked = batch_sort.update(detections)
+
+            assert len(tracked) == len(expected)
+            assert len(batch_sort) == len(sort.trackers)
+            for (box, classification, certainty), (expected_box, expected_class, expected_certainty) \
+                    in zip(tracked, expected):
+                assert np.allclose(box, expected_box)
+                assert classification == expected_class
+                assert certainty == expected_certainty
+
+    def test_empty_frames(self):
+        """Tests that tracks are removed after max_age frames without detections."""
+        batch_sort = BatchSort(max_age=2, min_hits=0)
+        box = (np.array([10., 10., 50., 90., 0.9]), 'person', 0.9)
+
+        tracked = batch_sort.update([box])
+        assert len(tracked) == 1
+        assert tracked[0][0][4] == 1
+
+        for _ in range(3):
+            assert batch_sort.update([]).shape == (0, 5)
+        assert len(batch_sort) == 0
+
+        # A new track gets a new id.
+        assert batch_sort.update([box])[0][0][4] == 2
+
+    @pytest.mark.parametrize('min_hits', [0, 3])
+    def test_predict_same_as_sort(self, min_hits):
+        """Tests that BatchSort predicts the same boxes as Sort on frames that are not detected.
+
+        Args:
+            min_hits (int): consecutive hits before a track is returned.
+        """
+        sort = Sort(max_age=2, min_hits=min_hits, iou_threshold=0.3)
+        batch_sort = BatchSort(max_age=2, min_hits=min_hits, iou_threshold=0.3)
+
+        for frame, detections in enumerate(create_detections(frames=40, objects=8)):
+            # Only detect every third frame.
+            if frame % 3 == 0:
+                expected, tracked = sort.update(detections), batch_sort.update(detections)
+            else:
+                expected, tracked = sort.predict(), batch_sort.predict()
+
+            assert len(tracked) == len(expected)
+            for (box, classification, _), (expected_box, expected_class, _) in zip(tracked, expected):
+                assert np.allclose(box, expected_box)
+                assert classification == expected_class
+
+    def test_predict_does_not_age(self):
+        """Tests that predicted frames do not count as missed detections and move the tracks."""
+        batch_sort = BatchSort(max_age=1, min_hits=0)
+        batch_sort.update([(np.array([10., 10., 50., 90., 0.9]), 'person', 0.9)])
+        batch_sort.update([(np.array([14., 10., 54., 90., 0.9]), 'person', 0.9)])
+
+        for _ in range(5):
+            predicted = batch_sort.predict()
+            assert len(predicted) == 1
+            assert predicted[0][0][4] == 1
+        assert len(batch_sort) == 1
+
+        # The track keeps moving to the right.
+        assert predicted[0][0][0] > 14.
+
+
+if __name__ == '__main__':
+    pytest.main(TestBatchSort)
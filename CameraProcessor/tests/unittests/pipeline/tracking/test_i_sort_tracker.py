@@ -0,0 +1,67 @@
+"""Tests the conversions of the SORT tracker interface.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.reidentification.reid_data import ReidData
+from processor.pipeline.tracking.i_sort_tracker import ISortTracker
+
+
+class TestISortTracker:
+    """Tests the conversions between bounding boxes and the SORT format."""
+
+    @pytest.mark.parametrize('columns', [False, True])
+    def test_convert_boxes_to_sort(self, columns):
+        """Tests converting list based and columnar bounding boxes to the SORT format.
+
+        Args:
+            columns (bool): whether the boxes are stored as columns.
+        """
+        boxes = BoundingBoxes([
+            BoundingBox(0, Rectangle(0.1, 0.2, 0.5, 0.6), 'person', 0.8),
+            BoundingBox(1, Rectangle(0, 0, 1, 1), 'car', 0.4)
+        ])
+        if columns:
+            boxes = ArrayBoundingBoxes.from_bounding_boxes(boxes)
+
+        detections = ISortTracker.convert_boxes_to_sort(boxes, (200, 100))
+
+        assert len(detections) == 2
+        assert np.allclose(detections[0][0], [20, 20, 100, 60, 0.8])
+        assert detections[0][1:] == ('person', 0.8)
+        assert np.allclose(detections[1][0], [0, 0, 200, 100, 0.4])
+        assert detections[1][1:] == ('car', 0.4)
+
+    def test_parse_boxes_from_sort(self):
+        """Tests parsing the output of SORT, clipping the boxes to the frame and adding the object ids."""
+        re_id_data = ReidData()
+        re_id_data.add_query_box(2, 9)
+        tracked = [
+            (np.array([20.7, 20.2, 100.9, 60.5, 1.]), 'person', 0.8),
+            (np.array([-5., 10., 250., 90., 2.]), 'car', 0.4)
+        ]
+
+        boxes = ISortTracker.parse_boxes_from_sort(tracked, (200, 100), re_id_data)
+
+        assert isinstance(boxes, ArrayBoundingBoxes)
+        assert list(boxes) == [
+            BoundingBox(1, Rectangle(0.1, 0.2, 0.5, 0.6), 'person', 0.8),
+            BoundingBox(2, Rectangle(0, 0.1, 1, 0.9), 'car', 0.4, object_id=9)
+        ]
+
+    def test_parse_no_boxes(self):
+        """Tests parsing the empty output of SORT."""
+        boxes = ISortTracker.parse_boxes_from_sort(np.empty((0, 5)), (200, 100), ReidData())
+        assert len(boxes) == 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestISortTracker)
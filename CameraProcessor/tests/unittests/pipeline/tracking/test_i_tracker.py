@@ -19,6 +19,11 @@ class TestITracker(ITracker):
         with pytest.raises(NotImplementedError):
             ITracker.track(self, BoundingBoxes, FrameObj, {})
 
+    def test_itracker_predict_tracks(self):
+        """Test if predict falls back to tracking the frame without detections."""
+        with pytest.raises(NotImplementedError):
+            ITracker.predict(self, FrameObj, {})
+
 
 if __name__ == '__main__':
     pytest.main(TestITracker)
@@ -0,0 +1,74 @@
+"""Tests the association of detections to trackers of SORT.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.pipeline.tracking.sort.sort import associate_detections_to_trackers, iou_batch
+
+
+class TestSort:
+    """Tests associate_detections_to_trackers of SORT."""
+
+    def test_no_trackers(self):
+        """Tests that all detections are unmatched without trackers."""
+        detections = np.array([[0., 0., 10., 10.], [20., 20., 30., 30.]])
+        matches, unmatched_detections, unmatched_trackers = \
+            associate_detections_to_trackers(detections, np.empty((0, 4)))
+
+        assert matches.shape == (0, 2)
+        assert list(unmatched_detections) == [0, 1]
+        assert len(unmatched_trackers) == 0
+
+    def test_no_detections(self):
+        """Tests that all trackers are unmatched without detections."""
+        trackers = np.array([[0., 0., 10., 10.]])
+        matches, unmatched_detections, unmatched_trackers = \
+            associate_detections_to_trackers(np.empty((0, 4)), trackers)
+
+        assert matches.shape == (0, 2)
+        assert len(unmatched_detections) == 0
+        assert list(unmatched_trackers) == [0]
+
+    def test_uncontested(self):
+        """Tests matching boxes that only overlap with a single box, and the IoU threshold."""
+        trackers = np.array([[0., 0., 10., 10.], [100., 100., 110., 110.], [200., 0., 210., 10.]])
+        detections = np.array([[101., 101., 111., 111.], [0., 1., 10., 11.], [205., 5., 215., 15.]])
+        matches, unmatched_detections, unmatched_trackers = associate_detections_to_trackers(detections, trackers)
+
+        assert sorted(map(tuple, matches)) == [(0, 1), (1, 0)]
+        assert list(unmatched_detections) == [2]
+        assert list(unmatched_trackers) == [2]
+
+    def test_contested(self):
+        """Tests that contested pairs get the assignment with the highest total IoU."""
+        trackers = np.array([[0., 0., 10., 10.], [4., 0., 14., 10.], [500., 0., 510., 10.]])
+        detections = np.array([[2., 0., 12., 10.], [5., 0., 15., 10.], [501., 0., 511., 10.]])
+        matches, unmatched_detections, unmatched_trackers = associate_detections_to_trackers(detections, trackers)
+
+        assert sorted(map(tuple, matches)) == [(0, 0), (1, 1), (2, 2)]
+        assert len(unmatched_detections) == 0
+        assert len(unmatched_trackers) == 0
+
+    def test_crowd(self):
+        """Tests that every match has an IoU above the threshold and every box is matched at most once."""
+        rng = np.random.default_rng(0)
+        top_left = rng.uniform(0, 1000, (500, 2))
+        trackers = np.hstack([top_left, top_left + rng.uniform(20, 60, (500, 2))])
+        detections = trackers[rng.permutation(500)[:400]] + rng.normal(0, 3, (400, 4))
+
+        matches, unmatched_detections, unmatched_trackers = associate_detections_to_trackers(detections, trackers)
+
+        iou_matrix = iou_batch(detections, trackers)
+        assert np.all(iou_matrix[matches[:, 0], matches[:, 1]] >= 0.3)
+        assert len(np.unique(matches[:, 0])) == len(matches)
+        assert len(np.unique(matches[:, 1])) == len(matches)
+        assert sorted([*matches[:, 0], *unmatched_detections]) == list(range(400))
+        assert sorted([*matches[:, 1], *unmatched_trackers]) == list(range(500))
+
+
+if __name__ == '__main__':
+    pytest.main(TestSort)
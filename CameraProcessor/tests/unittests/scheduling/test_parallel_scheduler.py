@@ -0,0 +1,110 @@
+"""Tests the parallel scheduler using the schedules of the schedule wrapper.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+
+import pytest
+
+from processor.scheduling.parallel_scheduler import ParallelScheduler
+from processor.scheduling.node.schedule_node import ScheduleNode
+
+from tests.unittests.scheduling.utils.schedule_wrapper import ScheduleWrapper
+from tests.unittests.scheduling.utils.multiple_input_component import MultipleInputComponent
+from tests.unittests.scheduling.utils.recording_component import RecordingComponent
+
+
+class TestParallelScheduler:
+    """Tests functionality of the parallel scheduler class with different Schedules."""
+    def test_unknown_executor(self):
+        """Tests whether an unknown executor type raises an error."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_empty_schedule()
+
+        with pytest.raises(NameError):
+            ParallelScheduler(schedule_wrapper.schedule_input_node, executor='unknown')
+
+    def test_small_schedule_graph(self):
+        """Tests whether a schedule only containing an output node gives correct output."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_empty_schedule()
+        scheduler = ParallelScheduler(schedule_wrapper.schedule_input_node)
+
+        scheduler.schedule_graph(['small'], {})
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'small'
+
+    def test_schedule_graph(self):
+        """Tests whether the big schedule gives the same output as with the sequential scheduler."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_big_schedule()
+        scheduler = ParallelScheduler(schedule_wrapper.schedule_input_node, max_workers=4)
+
+        scheduler.schedule_graph(['big'], {})
+
+        assert schedule_wrapper.schedule_output_node.component.out == \
+               'big,start,start,first_arg,big,start,start,second_arg,merged'
+
+    def test_global_schedule_graph(self):
+        """Tests whether the globals are passed to the nodes."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_global_schedule()
+        scheduler = ParallelScheduler(schedule_wrapper.schedule_input_node)
+
+        scheduler.schedule_graph([], {'global_var': 'global'})
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'global,start'
+
+    def test_non_executable_graph(self):
+        """Test whether an non-executable graph indeed raises an exception."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_invalid_schedule()
+        scheduler = ParallelScheduler(schedule_wrapper.schedule_input_node)
+
+        assert pytest.raises(Exception, scheduler.schedule_graph, 'invalid', {})
+
+    def test_independent_branches_concurrent(self):
+        """Tests whether two independent branches run at the same time."""
+        delay = 0.2
+        merge_node = ScheduleNode(2, [], MultipleInputComponent(), {})
+        branch_node1 = ScheduleNode(1, [(merge_node, 0)], RecordingComponent(delay), {})
+        branch_node2 = ScheduleNode(1, [(merge_node, 1)], RecordingComponent(delay), {})
+        start_node = ScheduleNode(1, [(branch_node1, 0), (branch_node2, 0)], RecordingComponent(), {})
+        scheduler = ParallelScheduler(start_node, max_workers=2)
+
+        start = time.perf_counter()
+        scheduler.schedule_graph(['branch'], {})
+
+        # Sequentially the branches would take twice the delay.
+        assert time.perf_counter() - start < 1.8 * delay
+        assert branch_node1.component.received == branch_node2.component.received == ['branch']
+
+    def test_overlapping_iterations_in_order(self):
+        """Tests whether overlapping iterations still reach each node in the order they were scheduled."""
+        output_node = ScheduleNode(1, [], RecordingComponent(), {})
+        slow_node = ScheduleNode(1, [(output_node, 0)], RecordingComponent(0.01), {})
+        start_node = ScheduleNode(1, [(slow_node, 0)], RecordingComponent(), {})
+        scheduler = ParallelScheduler(start_node, max_workers=4, max_iterations=3)
+
+        for i in range(20):
+            scheduler.schedule_graph([i], {})
+        scheduler.wait()
+        scheduler.shutdown()
+
+        assert output_node.component.received == list(range(20))
+
+    def test_component_error(self):
+        """Tests whether an exception inside a component is raised by the scheduler."""
+        output_node = ScheduleNode(2, [], MultipleInputComponent(), {})
+        start_node = ScheduleNode(1, [(output_node, 0), (output_node, 1)], RecordingComponent(), {})
+        scheduler = ParallelScheduler(start_node)
+
+        # Merging fails inside the component, since None is not a string.
+        with pytest.raises(AttributeError):
+            scheduler.schedule_graph([None], {})
+
+
+if __name__ == '__main__':
+    pytest.main(TestParallelScheduler)
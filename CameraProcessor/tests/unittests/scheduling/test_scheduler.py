@@ -43,6 +43,19 @@ class TestScheduler:
         # No stage inside the schedule modified the string.
         assert schedule_wrapper.schedule_output_node.component.out == "small"
 
+    def test_wait_and_shutdown(self):
+        """Tests whether the sequential scheduler can be waited for and shut down like the parallel scheduler."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_big_schedule()
+        scheduler = schedule_wrapper.scheduler
+
+        scheduler.schedule_graph(['big'], {})
+        scheduler.wait()
+        scheduler.shutdown()
+
+        # The iteration finished inside schedule_graph.
+        assert schedule_wrapper.schedule_output_node.component.out is not None
+
     def test_schedule_graph(self):
         """Tests the functionality of schedule_graph().
 
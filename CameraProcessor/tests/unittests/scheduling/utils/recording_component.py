@@ -0,0 +1,45 @@
+"""Contains a component that records the objects it received.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+
+
+class RecordingComponent:
+    """Test component that sleeps before passing its input on, and records the inputs in the order it got them.
+
+    Attributes:
+        delay (float): Number of seconds the work function sleeps.
+        received ([object]): Inputs received by the work function, in order of execution.
+    """
+    def __init__(self, delay=0.0):
+        """Inits the component without any received inputs.
+
+        Args:
+            delay (float): Number of seconds the work function sleeps.
+        """
+        self.delay = delay
+        self.received = []
+
+    def work(self, obj):
+        """Sleeps and records the input.
+
+        Args:
+            obj (object): input object passed through by the scheduler.
+
+        Returns:
+            object: The unmodified input object.
+        """
+        time.sleep(self.delay)
+        self.received.append(obj)
+        return obj
+
+    def execute_component(self):
+        """Interface function to execute the component.
+
+        Returns:
+            func: Work function to call when component is run.
+        """
+        return self.work
@@ -0,0 +1,75 @@
+"""Tests the detector benchmark.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.training.detection.detector_benchmark import benchmark, match_detections
+from tests.unittests.utils.recording_detector import RecordingDetector
+
+
+def create_boxes(boxes):
+    """Creates bounding boxes.
+
+    Args:
+        boxes ([(float, float, float, float, str, float)]): rectangle, classification and certainty of every box.
+
+    Returns:
+        BoundingBoxes: the boxes.
+    """
+    return BoundingBoxes([BoundingBox(i, Rectangle(*box[:4]), box[4], box[5]) for i, box in enumerate(boxes)])
+
+
+class TestDetectorBenchmark:
+    """Tests the matching and results of the detector benchmark."""
+
+    def test_match_same_boxes(self):
+        """Tests that identical boxes are all matched."""
+        boxes = create_boxes([(0.1, 0.1, 0.3, 0.3, 'person', 0.9), (0.5, 0.5, 0.7, 0.9, 'car', 0.6)])
+        matches = match_detections(boxes, boxes)
+
+        assert len(matches) == 2
+        assert all(overlap == pytest.approx(1) and difference == 0 for overlap, difference in matches)
+
+    def test_match_class_and_overlap(self):
+        """Tests that boxes of another class or with too little overlap are not matched."""
+        baseline = create_boxes([(0.1, 0.1, 0.3, 0.3, 'person', 0.9), (0.5, 0.5, 0.7, 0.9, 'car', 0.6)])
+        candidate = create_boxes([(0.1, 0.1, 0.3, 0.3, 'car', 0.9), (0.6, 0.5, 0.8, 0.9, 'car', 0.5)])
+
+        assert not match_detections(baseline, candidate, iou_threshold=0.5)
+        matches = match_detections(baseline, candidate, iou_threshold=0.3)
+        assert len(matches) == 1
+        assert matches[0][0] == pytest.approx(1 / 3)
+        assert matches[0][1] == pytest.approx(0.1)
+
+    def test_match_once(self):
+        """Tests that a baseline box is matched to at most one candidate box, the one with the best overlap."""
+        baseline = create_boxes([(0.1, 0.1, 0.3, 0.3, 'person', 0.9)])
+        candidate = create_boxes([(0.11, 0.1, 0.31, 0.3, 'person', 0.9), (0.1, 0.1, 0.3, 0.3, 'person', 0.8)])
+
+        matches = match_detections(baseline, candidate)
+        assert len(matches) == 1
+        assert matches[0][0] == pytest.approx(1)
+
+    def test_benchmark_same_detector(self):
+        """Tests that detectors with the same detections fully agree."""
+        frames = [FrameObj(np.zeros((48, 64, 3), dtype=np.uint8), i) for i in range(6)]
+        baseline, candidate = RecordingDetector(), RecordingDetector()
+        results = benchmark(baseline, candidate, frames, warmup=2)
+
+        assert results['frames'] == 4
+        assert len(baseline.shapes) == len(candidate.shapes) == 6
+        assert results['precision'] == results['recall'] == 1
+        assert results['mean_iou'] == pytest.approx(1)
+        assert results['speedup'] > 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestDetectorBenchmark)
@@ -0,0 +1,53 @@
+"""Capture returning a fixed number of generated frames for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+
+import numpy as np
+
+from processor.data_object.frame_obj import FrameObj
+from processor.input.i_capture import ICapture
+
+
+class CountingCapture(ICapture):
+    """Capture returning a fixed number of frames, of which the pixels contain the frame number.
+
+    Attributes:
+        nr_frames (int): Number of frames of the capture.
+        frames_read (int): Number of frames read so far.
+        closed (bool): Whether the capture was closed.
+    """
+
+    def __init__(self, nr_frames):
+        """Inits the capture.
+
+        Args:
+            nr_frames (int): Number of frames of the capture.
+        """
+        self.nr_frames = nr_frames
+        self.frames_read = 0
+        self.closed = False
+
+    def opened(self):
+        """Checks whether frames are left.
+
+        Returns:
+            bool: Whether frames are left.
+        """
+        return not self.closed and self.frames_read < self.nr_frames
+
+    def close(self):
+        """Closes the capture."""
+        self.closed = True
+
+    def get_next_frame(self):
+        """Gets the next frame.
+
+        Returns:
+            bool, FrameObj: Whether the frame was read, and the frame.
+        """
+        self.frames_read += 1
+        return True, FrameObj(np.full((2, 2), self.frames_read), time.time())
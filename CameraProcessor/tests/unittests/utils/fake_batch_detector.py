@@ -0,0 +1,49 @@
+"""Mock detector recording the batches it detected, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class FakeBatchDetector(IDetector):
+    """A fake detector returning a single box containing the timestamp of the frame as certainty.
+
+    Attributes:
+        batch_sizes ([int]): Sizes of the batches that were detected, in order.
+    """
+    def __init__(self):
+        """Inits the detector without any detected batches."""
+        self.batch_sizes = []
+
+    def detect(self, frame_obj):
+        """Detects a single box, using the timestamp as certainty so the box can be matched to the frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: A single box.
+
+        Raises:
+            ValueError: The timestamp of the frame is negative.
+        """
+        if frame_obj.timestamp < 0:
+            raise ValueError('Negative timestamp')
+        return BoundingBoxes([BoundingBox(0, Rectangle(0, 0, 1, 1), 'fake class', frame_obj.timestamp)])
+
+    def detect_batch(self, frame_objs):
+        """Records the size of the batch and detects the frames.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object for every frame.
+        """
+        self.batch_sizes.append(len(frame_objs))
+        return [self.detect(frame_obj) for frame_obj in frame_objs]
@@ -0,0 +1,33 @@
+"""Mock detector recording the frames it detects.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class RecordingDetector(IDetector):
+    """A fake detector, which records the shape of every frame and detects a box in the centre of it.
+
+    Attributes:
+        shapes ([(int, int)]): Width and height of every detected frame.
+    """
+    def __init__(self):
+        """Inits the detector without detected frames."""
+        self.shapes = []
+
+    def detect(self, frame_obj):
+        """Records the frame and detects a box covering the centre half of it.
+
+        Args:
+            frame_obj (FrameObj): Frame to detect.
+
+        Returns:
+            BoundingBoxes: A single box in the centre of the frame.
+        """
+        self.shapes.append(frame_obj.shape)
+        return BoundingBoxes([BoundingBox(0, Rectangle(0.25, 0.25, 0.75, 0.75), 'person', 0.9)])
@@ -0,0 +1,37 @@
+"""Small convolutional model extracting feature vectors, like the backbones of the re-identification models.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import torch
+from torch import nn
+
+
+class SmallReIdModel(nn.Module):
+    """A convolution, batch normalization and ReLU block, followed by pooling and a linear layer."""
+
+    def __init__(self, features=16):
+        """Inits the layers with fixed random weights.
+
+        Args:
+            features (int): Length of the extracted feature vectors.
+        """
+        super().__init__()
+        torch.manual_seed(0)
+        self.conv = nn.Conv2d(3, 8, 3, padding=1)
+        self.bn = nn.BatchNorm2d(8)
+        self.relu = nn.ReLU()
+        self.pool = nn.AdaptiveAvgPool2d(1)
+        self.fc = nn.Linear(8, features)
+
+    def forward(self, images):
+        """Extracts the feature vectors of the images.
+
+        Args:
+            images (Tensor): (N, 3, height, width) images.
+
+        Returns:
+            Tensor: (N, features) feature vectors.
+        """
+        return self.fc(torch.flatten(self.pool(self.relu(self.bn(self.conv(images)))), 1))
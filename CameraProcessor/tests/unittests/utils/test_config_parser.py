@@ -112,6 +112,8 @@ class TestConfigParser:
         assert configs['Main']['detector'] == env_vars_dict['DETECTION_ALG']
         assert configs['Main']['tracker'] == env_vars_dict['TRACKING_ALG']
         assert configs['Main']['reid'] == env_vars_dict['REID_ALG']
+        assert configs['RegionOfInterest']['polygons'] == env_vars_dict['ROI_POLYGONS']
+        assert configs['RegionOfInterest'].getboolean('enabled')
 
         # Remove environment variables.
         self.remove_environment_variables(self.dummy_environment_variables)
@@ -149,5 +151,6 @@ class TestConfigParser:
             'PROCESSOR_MODE': 'test_mode',
             'DETECTION_ALG': 'test_det_alg',
             'TRACKING_ALG': 'test_track_alg',
-            'REID_ALG': 'test_reid_alg'
+            'REID_ALG': 'test_reid_alg',
+            'ROI_POLYGONS': '0,0.5 1,0.5 1,1 0,1'
         }
@@ -9,6 +9,7 @@ import json
 from processor.utils.text import boxes_to_accuracy_json, boxes_to_txt, feature_map_to_json, \
                                  bounding_box_to_dict, bounding_boxes_to_dict
 from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.array_bounding_boxes import ArrayBoundingBoxes
 from processor.data_object.bounding_box import BoundingBox
 from processor.data_object.rectangle import Rectangle
 
@@ -94,3 +95,21 @@ class TestText:
                                     ]
                                     })
         assert json_string == proper_string
+
+    def test_array_boxes_to_txt(self):
+        """Tests that boxes_to_txt gives the same text for columnar bounding boxes."""
+        boxes = BoundingBoxes([
+            BoundingBox(1, Rectangle(0.1, 0.25, 0.333, 0.9), 'person', 0.456),
+            BoundingBox(2, Rectangle(0, 0, 1, 1), 'car', 0.125)
+        ])
+        array_boxes = ArrayBoundingBoxes.from_bounding_boxes(boxes)
+        assert boxes_to_txt(array_boxes, (640, 480), 3) == boxes_to_txt(boxes, (640, 480), 3)
+
+    def test_array_bounding_boxes_to_dict(self):
+        """Tests that bounding_boxes_to_dict gives the same dict for columnar bounding boxes."""
+        boxes = BoundingBoxes([
+            BoundingBox(1, Rectangle(0.1, 0.25, 0.333, 0.9), 'person', 0.456, object_id=3),
+            BoundingBox(2, Rectangle(0, 0, 1, 1), 'car', 0.125)
+        ])
+        array_boxes = ArrayBoundingBoxes.from_bounding_boxes(boxes)
+        assert bounding_boxes_to_dict(array_boxes, 1.0) == bounding_boxes_to_dict(boxes, 1.0)
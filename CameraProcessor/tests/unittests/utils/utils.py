@@ -4,6 +4,8 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import configparser
+
 import cv2
 from tests.conftest import root_path
 
@@ -34,3 +36,19 @@ def get_sample_frame():
     """
     __images_name = f'{root_path}/data/tests/unittests/images/000001.jpg'
     return cv2.imread(__images_name)
+
+
+def create_section(name, defaults, **values):
+    """Creates a section of the configurations, like the sections read from configs.ini.
+
+    Args:
+        name (str): name of the section.
+        defaults (dict[str, str]): configuration values of the section.
+        **values (str): configuration values overriding the defaults.
+
+    Returns:
+        SectionProxy: the section.
+    """
+    config = configparser.ConfigParser()
+    config[name] = {**defaults, **values}
+    return config[name]
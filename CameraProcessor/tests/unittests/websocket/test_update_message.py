@@ -4,6 +4,7 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import numpy as np
 import pytest
 from processor.websocket.update_message import UpdateMessage
 
@@ -41,6 +42,23 @@ class TestUpdateMessage:
         with pytest.raises(AttributeError):
             UpdateMessage(1, [])
 
+    def test_array_feature_map(self):
+        """Tests whether an array feature map is kept as array and only converted to a list in the message."""
+        feature_map = np.array([0.5, 0.25], dtype=np.float32)
+        message = UpdateMessage(self.object_id, feature_map)
+
+        assert message.feature_map is feature_map
+        assert message == UpdateMessage(self.object_id, [0.5, 0.25])
+        assert message.to_message()['featureMap'] == [0.5, 0.25]
+        assert isinstance(message.to_message()['featureMap'][0], float)
+
+        with pytest.raises(TypeError):
+            UpdateMessage(1, np.ones((2, 2), dtype=np.float32))
+        with pytest.raises(TypeError):
+            UpdateMessage(1, np.ones(2, dtype=np.int64))
+        with pytest.raises(AttributeError):
+            UpdateMessage(1, np.empty(0, dtype=np.float32))
+
     def test_invalid_from_message(self):
         """Tests whether a message with missing keys raises Exceptions."""
         # Create invalid messages.